@@ -3,7 +3,7 @@ import os
 import sys
 
 # ruff: noqa: E402 We first need to insert the path
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, pool, text
 
 from alembic import context
 
@@ -32,6 +32,8 @@ def run_migrations_online() -> None:
     engine = engine_from_config(config_ini_section, prefix="sqlalchemy.", poolclass=pool.NullPool)
 
     connection = engine.connect()
+    # Migrations can take long, don't let a timeout configured on the role or database abort them.
+    connection.execute(text("SET statement_timeout = 0"))
     context.configure(connection=connection, target_metadata=Base.metadata, compare_type=True)
 
     try:
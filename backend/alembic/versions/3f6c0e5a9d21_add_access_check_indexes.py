@@ -0,0 +1,27 @@
+"""add indexes for tournament access checks
+
+Revision ID: 3f6c0e5a9d21
+Revises: c1ab44651e79
+Create Date: 2026-10-19 11:20:41.518203
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str | None = "3f6c0e5a9d21"
+down_revision: str | None = "c1ab44651e79"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_users_x_clubs_user_id_club_id", "users_x_clubs", ["user_id", "club_id"], unique=False
+    )
+    op.create_index("ix_tournaments_id_club_id", "tournaments", ["id", "club_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tournaments_id_club_id", table_name="tournaments")
+    op.drop_index("ix_users_x_clubs_user_id_club_id", table_name="users_x_clubs")
@@ -0,0 +1,46 @@
+"""add indexes on foreign keys used to traverse the tournament tree
+
+Revision ID: 5a7e9c3d2b18
+Revises: 8d2b7c4e1f90
+Create Date: 2026-10-19 12:31:48.915302
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str | None = "5a7e9c3d2b18"
+down_revision: str | None = "8d2b7c4e1f90"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+indexed_columns = [
+    ("stage_items", "ranking_id"),
+    ("stage_item_inputs", "team_id"),
+    ("rounds", "stage_item_id"),
+    ("matches", "round_id"),
+    ("matches", "stage_item_input1_id"),
+    ("matches", "stage_item_input2_id"),
+    ("matches", "court_id"),
+    ("players_x_teams", "player_id"),
+    ("players_x_teams", "team_id"),
+]
+
+
+def upgrade() -> None:
+    # Build the indexes without locking the tables for writes, since `matches` can be large.
+    with op.get_context().autocommit_block():
+        for table, column in indexed_columns:
+            op.create_index(
+                op.f(f"ix_{table}_{column}"),
+                table,
+                [column],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    for table, column in reversed(indexed_columns):
+        op.drop_index(op.f(f"ix_{table}_{column}"), table_name=table)
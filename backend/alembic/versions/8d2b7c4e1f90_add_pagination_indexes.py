@@ -0,0 +1,29 @@
+"""add indexes for keyset pagination of teams and players
+
+Revision ID: 8d2b7c4e1f90
+Revises: 3f6c0e5a9d21
+Create Date: 2026-10-19 12:05:13.402871
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str | None = "8d2b7c4e1f90"
+down_revision: str | None = "3f6c0e5a9d21"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_teams_tournament_id_name_id", "teams", ["tournament_id", "name", "id"], unique=False
+    )
+    op.create_index(
+        "ix_players_tournament_id_name_id", "players", ["tournament_id", "name", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_players_tournament_id_name_id", table_name="players")
+    op.drop_index("ix_teams_tournament_id_name_id", table_name="teams")
@@ -0,0 +1,55 @@
+"""add tournament_id to rounds and matches
+
+Revision ID: b4f1d9e2c7a3
+Revises: 5a7e9c3d2b18
+Create Date: 2026-10-19 13:42:07.306114
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str | None = "b4f1d9e2c7a3"
+down_revision: str | None = "5a7e9c3d2b18"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    # Databases that were created before the stages table was introduced (6458e0bc3e9d) still
+    # have the old `rounds.tournament_id` column, it gets overwritten below.
+    op.add_column(
+        "rounds", sa.Column("tournament_id", sa.BigInteger(), nullable=True), if_not_exists=True
+    )
+    op.add_column("matches", sa.Column("tournament_id", sa.BigInteger(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE rounds
+        SET tournament_id = stages.tournament_id
+        FROM stage_items
+        JOIN stages ON stages.id = stage_items.stage_id
+        WHERE stage_items.id = rounds.stage_item_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE matches
+        SET tournament_id = rounds.tournament_id
+        FROM rounds
+        WHERE rounds.id = matches.round_id
+        """
+    )
+
+    for table in ("rounds", "matches"):
+        op.alter_column(table, "tournament_id", existing_type=sa.BigInteger(), nullable=False)
+        op.create_foreign_key(None, table, "tournaments", ["tournament_id"], ["id"])
+        op.create_index(op.f(f"ix_{table}_tournament_id"), table, ["tournament_id"], unique=False)
+
+
+def downgrade() -> None:
+    for table in ("matches", "rounds"):
+        op.drop_index(op.f(f"ix_{table}_tournament_id"), table_name=table)
+        op.drop_column(table, "tournament_id")
@@ -1,6 +1,8 @@
+import math
 import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from pathlib import Path
 
 from fastapi import FastAPI, Request
 from starlette.exceptions import HTTPException
@@ -11,12 +13,24 @@ from starlette.staticfiles import StaticFiles
 
 from bracket.config import Environment, config, environment, init_sentry
 from bracket.cronjobs.scheduling import start_cronjobs
-from bracket.database import database
-from bracket.models.metrics import RequestDefinition, get_request_metrics
+from bracket.database import (
+    READ_PRIMARY_COOKIE,
+    RequestQueryStats,
+    database,
+    request_query_stats,
+)
+from bracket.models.metrics import (
+    DB_QUERIES_PER_REQUEST,
+    REQUEST_COUNT,
+    RESPONSE_TIME,
+    get_route_key,
+    get_route_key_with_status,
+)
 from bracket.routes import (
     auth,
     clubs,
     courts,
+    exports,
     internals,
     matches,
     players,
@@ -31,8 +45,17 @@ from bracket.routes import (
 )
 from bracket.utils.alembic import alembic_run_migrations
 from bracket.utils.asyncio import AsyncioTasksManager
+from bracket.utils.compute import shutdown_compute_pools
 from bracket.utils.db_init import init_db_when_empty
 from bracket.utils.logging import logger
+from bracket.utils.loop_monitor import monitor_event_loop, track_in_flight_route
+from bracket.utils.metrics_multiprocess import (
+    write_metrics_snapshot,
+    write_metrics_snapshots_periodically,
+)
+from bracket.utils.tracing import RequestTrace, current_trace, log_if_slow_request
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
 init_sentry()
 
@@ -48,6 +71,10 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     if environment is Environment.PRODUCTION:
         start_cronjobs()
 
+    AsyncioTasksManager.add_coroutine(monitor_event_loop())
+    if config.metrics_multiprocess_dir is not None:
+        AsyncioTasksManager.add_coroutine(write_metrics_snapshots_periodically())
+
     if environment is Environment.PRODUCTION and not config.is_cors_enabled():
         logger.warning("It's advised to set the `CORS_ORIGINS` environment variable in production")
 
@@ -57,12 +84,17 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         await database.disconnect()
 
     await AsyncioTasksManager.gather()
+    shutdown_compute_pools()
+
+    if config.metrics_multiprocess_dir is not None:
+        write_metrics_snapshot(Path(config.metrics_multiprocess_dir))
 
 
 routers = {
     "Auth": auth.router,
     "Clubs": clubs.router,
     "Courts": courts.router,
+    "Exports": exports.router,
     "Internals": internals.router,
     "Matches": matches.router,
     "Players": players.router,
@@ -130,12 +162,36 @@ app.add_middleware(
 
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next: RequestResponseEndpoint) -> Response:
-    start_time = time.time()
-    request_metrics = get_request_metrics()
-    request_metrics.request_count[RequestDefinition.from_request(request)] += 1
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    request_metrics.response_time[RequestDefinition.from_request(request)] = process_time
+    start_time = time.perf_counter()
+    route_key = get_route_key(request)
+    REQUEST_COUNT.inc(route_key)
+    trace = RequestTrace(method=route_key[1], route=route_key[0])
+    trace_token = current_trace.set(trace)
+    query_stats = RequestQueryStats()
+    query_stats_token = request_query_stats.set(query_stats)
+    status_code = 500
+    try:
+        with track_in_flight_route(route_key[0]):
+            response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        request_query_stats.reset(query_stats_token)
+        current_trace.reset(trace_token)
+        log_if_slow_request(trace)
+        RESPONSE_TIME.observe(
+            time.perf_counter() - start_time, get_route_key_with_status(route_key, status_code)
+        )
+        DB_QUERIES_PER_REQUEST.observe(sum(query_stats.query_count.values()), route_key)
+
+    response.headers["Server-Timing"] = query_stats.to_server_timing()
+    if database.read_replica is not None and request.method not in SAFE_METHODS:
+        response.set_cookie(
+            READ_PRIMARY_COOKIE,
+            "1",
+            max_age=math.ceil(config.pg_replica_primary_window),
+            httponly=True,
+            samesite="lax",
+        )
     return response
 
 
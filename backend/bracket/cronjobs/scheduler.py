@@ -0,0 +1,120 @@
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable, Sequence
+
+from databases.core import Connection
+from heliclockter import timedelta
+from pydantic import BaseModel, ConfigDict
+
+from bracket.config import config
+from bracket.database import database
+from bracket.models.metrics import (
+    CRONJOB_DURATION_SECONDS,
+    CRONJOB_FAILURES,
+    CRONJOB_LAST_RUN,
+    CRONJOB_LEADER,
+)
+from bracket.utils.logging import logger
+
+# Key of the Postgres advisory lock that is held by the worker that runs the cronjobs.
+CRONJOBS_LEADER_LOCK_KEY = 0x62726B74_63726F6E  # "brkt" "cron"
+
+
+class CronJob(BaseModel):
+    """
+    A job that runs every `interval`, plus a random delay of up to `jitter` so that jobs with the
+    same interval don't all hit the database at the same moment.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    entrypoint: Callable[[], Awaitable[None]]
+    interval: timedelta
+    jitter: timedelta = timedelta(seconds=0)
+
+    @property
+    def name(self) -> str:
+        return self.entrypoint.__name__
+
+    def get_delay(self) -> float:
+        return self.interval.total_seconds() + random.uniform(0, self.jitter.total_seconds())
+
+
+async def run_cronjob(job: CronJob) -> None:
+    start = time.monotonic()
+    try:
+        await job.entrypoint()
+    except Exception as e:
+        CRONJOB_FAILURES.inc((job.name,))
+        logger.exception(f"Could not run cronjob {job.name}: {e}")
+    finally:
+        CRONJOB_DURATION_SECONDS.observe(time.monotonic() - start, (job.name,))
+        CRONJOB_LAST_RUN.set(time.time(), (job.name,))
+
+
+async def schedule_cronjob(job: CronJob) -> None:
+    while True:
+        await asyncio.sleep(job.get_delay())
+        await run_cronjob(job)
+
+
+async def try_acquire_leader_lock(connection: Connection) -> bool:
+    if database.url.dialect == "sqlite":
+        # SQLite has no advisory locks, and a SQLite deployment runs a single worker anyway.
+        return True
+
+    query = "SELECT pg_try_advisory_lock(:key)"
+    return bool(await connection.fetch_val(query, {"key": CRONJOBS_LEADER_LOCK_KEY}))
+
+
+async def release_leader_lock(connection: Connection) -> None:
+    if database.url.dialect == "sqlite":
+        return
+
+    query = "SELECT pg_advisory_unlock(:key)"
+    await connection.fetch_val(query, {"key": CRONJOBS_LEADER_LOCK_KEY})
+
+
+async def lead(connection: Connection, jobs: Sequence[CronJob]) -> None:
+    """
+    Runs the jobs until the task is cancelled or the connection that holds the lock is lost.
+
+    The jobs run in their own tasks, so they use their own connections instead of the one that
+    holds the lock.
+    """
+    logger.info(f"This worker is now running the cronjobs: {', '.join(job.name for job in jobs)}")
+    tasks = [asyncio.create_task(schedule_cronjob(job)) for job in jobs]
+    CRONJOB_LEADER.set(1)
+    try:
+        while True:
+            await asyncio.sleep(config.cronjob_leader_check_interval)
+            # Raises when the connection is lost, in which case Postgres releases the lock as well.
+            await connection.fetch_val("SELECT 1")
+    finally:
+        CRONJOB_LEADER.set(0)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def run_scheduler(jobs: Sequence[CronJob]) -> None:
+    """
+    Every worker runs the scheduler, but only the worker that holds the cronjobs advisory lock (the
+    leader) runs the jobs. The other workers retry to acquire the lock every
+    `cronjob_leader_check_interval` seconds, so one of them takes over when the leader stops.
+    """
+    while True:
+        try:
+            async with database.connection() as connection:
+                if await try_acquire_leader_lock(connection):
+                    try:
+                        await lead(connection, jobs)
+                    finally:
+                        # A connection is returned to the pool in any case, don't let the next
+                        # user of the connection keep the lock.
+                        await release_leader_lock(connection)
+        except Exception as e:
+            logger.exception(f"Cronjob scheduler failed: {e}")
+
+        await asyncio.sleep(config.cronjob_leader_check_interval)
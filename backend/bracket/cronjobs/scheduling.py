@@ -1,43 +1,52 @@
-import asyncio
-from collections.abc import Awaitable, Callable
+import time
 
 from heliclockter import timedelta
 
-from bracket.models.db.account import UserAccountType
-from bracket.sql.users import delete_user_and_owned_clubs, get_expired_demo_users
+from bracket.config import config
+from bracket.cronjobs.scheduler import CronJob, run_scheduler
+from bracket.logic.tournaments import delete_logos_of_deleted_tournaments
+from bracket.models.metrics import DEMO_PURGE_ROWS, DEMO_PURGE_SECONDS
+from bracket.sql.users import get_expired_demo_accounts, sql_purge_demo_accounts
 from bracket.utils.asyncio import AsyncioTasksManager
 from bracket.utils.logging import logger
 
-CronjobT = Callable[[], Awaitable[None]]
-
 
 async def delete_demo_accounts() -> None:
-    demo_users = await get_expired_demo_users()
-    if len(demo_users) < 1:
+    """
+    Deletes the expired demo accounts in batches of `demo_purge_batch_size` accounts, each in a
+    single transaction. Once a run takes longer than `demo_purge_time_budget` seconds, no new batch
+    is started and the remaining accounts are left for the next run.
+    """
+    start = time.monotonic()
+    demo_accounts = await get_expired_demo_accounts()
+    if len(demo_accounts) < 1:
         return
 
-    logger.info(f"Deleting {len(demo_users)} expired demo accounts")
-
-    for demo_user in demo_users:
-        assert demo_user.account_type is UserAccountType.DEMO
-        user_id = demo_user.id
-
-        await delete_user_and_owned_clubs(user_id)
+    logger.info(f"Deleting {len(demo_accounts)} expired demo accounts")
 
+    batch_size = config.demo_purge_batch_size
+    for i in range(0, len(demo_accounts), batch_size):
+        if i > 0 and time.monotonic() - start > config.demo_purge_time_budget:
+            logger.warning(
+                "Demo account purge ran out of time, "
+                f"{len(demo_accounts) - i} accounts are left for the next run"
+            )
+            break
 
-async def run_cronjob(cronjob_entrypoint: CronjobT, delta_time: timedelta) -> None:
-    while True:
-        await asyncio.sleep(delta_time.total_seconds())
+        deleted = await sql_purge_demo_accounts(demo_accounts[i : i + batch_size])
+        delete_logos_of_deleted_tournaments(deleted)
+        for table, rows in deleted.rows_per_table.items():
+            DEMO_PURGE_ROWS.inc((table,), rows)
 
-        try:
-            await cronjob_entrypoint()
-        except Exception as e:
-            logger.exception(f"Could not run cronjob {cronjob_entrypoint.__name__}: {e}")
+    DEMO_PURGE_SECONDS.observe(time.monotonic() - start)
 
 
-CRONJOBS = ((timedelta(minutes=5), delete_demo_accounts),)
+CRONJOBS = (
+    CronJob(
+        entrypoint=delete_demo_accounts, interval=timedelta(minutes=5), jitter=timedelta(minutes=1)
+    ),
+)
 
 
 def start_cronjobs() -> None:
-    for delta_time, cronjob_entrypoint in CRONJOBS:
-        AsyncioTasksManager.add_coroutine(run_cronjob(cronjob_entrypoint, delta_time))
+    AsyncioTasksManager.add_coroutine(run_scheduler(CRONJOBS))
@@ -1,12 +1,378 @@
+import json
 import os
 import sys
+import time
+from collections import defaultdict
+from collections.abc import AsyncGenerator, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import Any
 
+import asyncpg  # type: ignore[import-untyped]
 import sqlalchemy
-from databases import Database
+from databases import Database, DatabaseURL
+from databases.backends.postgres import PostgresBackend, PostgresConnection
+from databases.interfaces import Record
 from heliclockter import datetime_utc
+from sqlalchemy.sql import ClauseElement
+from sqlalchemy.sql.elements import TextClause
 
 from bracket.config import config
+from bracket.models.metrics import (
+    DB_POOL_ACQUIRE_SECONDS,
+    DB_POOL_ACQUIRE_TIMEOUTS,
+    DB_POOL_IDLE,
+    DB_POOL_IN_USE,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_SIZE,
+    DB_POOL_WAITING,
+    DB_QUERY_PLANNING_SECONDS,
+    DB_QUERY_ROWS,
+    DB_QUERY_SECONDS,
+    LabelValues,
+    registry,
+)
+from bracket.utils.asyncio import AsyncioTasksManager
+from bracket.utils.logging import logger
+from bracket.utils.tracing import current_trace
+
+QueryType = ClauseElement | str
+QUERY_NAME_SKIPPED_MODULES = frozenset({__name__, "bracket.utils.db", "databases.core"})
+SERVER_TIMING_MAX_QUERY_NAMES = 5
+POOL_WARNING_INTERVAL_SECONDS = 10.0
+
+
+@dataclass
+class RequestQueryStats:
+    query_count: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    query_time: dict[str, float] = field(default_factory=lambda: defaultdict(float))
+
+    def to_server_timing(self) -> str:
+        total_count = sum(self.query_count.values())
+        entries = [
+            f'db;dur={sum(self.query_time.values()) * 1000:.1f};desc="{total_count} queries"'
+        ]
+        slowest = sorted(self.query_time.items(), key=lambda item: item[1], reverse=True)
+        for query_name, query_time in slowest[:SERVER_TIMING_MAX_QUERY_NAMES]:
+            entries.append(
+                f"db.{query_name};dur={query_time * 1000:.1f};"
+                f'desc="{self.query_count[query_name]} queries"'
+            )
+        return ", ".join(entries)
+
+
+request_query_stats: ContextVar[RequestQueryStats | None] = ContextVar(
+    "request_query_stats", default=None
+)
+
+
+# Set for requests to read-only endpoints, whose queries may then be served by the read replica.
+use_read_replica: ContextVar[bool] = ContextVar("use_read_replica", default=False)
+# Set on responses to mutating requests, and expires after `pg_replica_primary_window` seconds.
+# While a client sends it, its reads go to the primary, so that it sees its own changes even when
+# the replica lags behind. Being a cookie, it works regardless of which worker serves the request.
+READ_PRIMARY_COOKIE = "bracket_read_primary"
+
+
+@contextmanager
+def read_from_primary() -> Iterator[None]:
+    """
+    Sends the reads inside the block to the primary, also during a request to a read-only endpoint.
+
+    Used for authentication and access checks: a lagging replica must not deny access that was just
+    granted, or grant access that was just revoked.
+    """
+    token = use_read_replica.set(False)
+    try:
+        yield
+    finally:
+        use_read_replica.reset(token)
+
+
+def get_query_name() -> str:
+    """
+    Returns the name of the function that issued the query, skipping the database helpers.
+    """
+    frame = sys._getframe(2)
+    while (
+        frame.f_back is not None and frame.f_globals.get("__name__") in QUERY_NAME_SKIPPED_MODULES
+    ):
+        frame = frame.f_back
+    return frame.f_code.co_name
+
+
+def record_query(query_name: str, start_time: float, row_count: int) -> None:
+    end_time = time.perf_counter()
+    query_time = end_time - start_time
+    query_labels = (query_name,)
+    DB_QUERY_SECONDS.observe(query_time, query_labels)
+    DB_QUERY_ROWS.inc(query_labels, row_count)
+    if (stats := request_query_stats.get()) is not None:
+        stats.query_count[query_name] += 1
+        stats.query_time[query_name] += query_time
+    if (trace := current_trace.get()) is not None:
+        trace.add_span(f"db.{query_name}", start_time, end_time)
+
+
+class PreparedQuery(TextClause):
+    """
+    A text query on a hot path, whose planning time is sampled and reported per query.
+
+    asyncpg already prepares every query once per connection and caches the statement (see
+    `pg_statement_cache_size`), so this doesn't change how the query is executed. On SQLite, this
+    is a plain `text()`.
+    """
+
+    inherit_cache = True
+
+
+def bind_prepared_query(
+    query: QueryType, values: dict[str, Any] | None
+) -> tuple[QueryType, dict[str, Any] | None]:
+    # `databases` only binds values to string queries, not to `TextClause`s.
+    if isinstance(query, PreparedQuery) and values is not None:
+        return query.bindparams(**values), None
+    return query, values
+
+
+# Time at which the planning time of each `PreparedQuery` was last sampled, per query text.
+planning_time_sampled_at: dict[str, float] = {}
+
+
+class InstrumentedPostgresConnection(PostgresConnection):
+    async def acquire(self) -> None:
+        assert isinstance(self._database, InstrumentedPostgresBackend)
+        self._connection = await self._database.acquire_connection()
+
+    def sample_planning_time(self, query: ClauseElement) -> None:
+        """
+        Records the planning time of a `PreparedQuery`, at most once per
+        `pg_planning_time_sample_interval` seconds per query.
+
+        Postgres plans statements when they are executed, so the time is measured with
+        `EXPLAIN (SUMMARY)` using the same parameters. That runs in the background on another
+        connection, so the query itself doesn't wait for it.
+        """
+        assert self._connection is not None, "Connection is not acquired"
+        # Queries in a transaction can depend on uncommitted changes, which other connections
+        # don't see.
+        if not isinstance(query, PreparedQuery) or self._connection.is_in_transaction():
+            return
+
+        now = time.monotonic()
+        sampled_at = planning_time_sampled_at.get(query.text)
+        if sampled_at is not None and now - sampled_at < config.pg_planning_time_sample_interval:
+            return
+
+        assert isinstance(self._database, InstrumentedPostgresBackend)
+        planning_time_sampled_at[query.text] = now
+        query_str, args, _ = self._compile(query)
+        AsyncioTasksManager.add_coroutine(
+            self._database.sample_planning_time(get_query_name(), query_str, args)
+        )
+
+    async def fetch_all(self, query: ClauseElement) -> list[Record]:
+        self.sample_planning_time(query)
+        return await super().fetch_all(query)
+
+    async def fetch_one(self, query: ClauseElement) -> Record | None:
+        self.sample_planning_time(query)
+        return await super().fetch_one(query)
+
+    async def execute(self, query: ClauseElement) -> Any:
+        self.sample_planning_time(query)
+        return await super().execute(query)
+
+
+class InstrumentedPostgresBackend(PostgresBackend):
+    """
+    Applies the acquire timeout and measures how long requests wait for a connection from the
+    pool. Warnings about blocked acquisitions are rate limited.
+    """
+
+    def __init__(self, database_url: DatabaseURL | str, **options: Any) -> None:
+        super().__init__(database_url, **options)
+        self.pool_labels: LabelValues = ("primary",)
+        self.blocked_since_last_warning = 0
+        self.last_warning_time = 0.0
+
+    async def connect(self) -> None:
+        await super().connect()
+        registry.add_collector(self.collect_metrics)
+
+    async def disconnect(self) -> None:
+        registry.collectors.remove(self.collect_metrics)
+        await super().disconnect()
+
+    def connection(self) -> PostgresConnection:
+        return InstrumentedPostgresConnection(self, self._dialect)
+
+    async def acquire_connection(self) -> asyncpg.Connection:
+        assert self._pool is not None, "DatabaseBackend is not running"
+        start_time = time.perf_counter()
+        DB_POOL_WAITING.inc(self.pool_labels)
+        try:
+            connection = await self._pool.acquire(timeout=config.pg_pool_acquire_timeout)
+        except TimeoutError:
+            DB_POOL_ACQUIRE_TIMEOUTS.inc(self.pool_labels)
+            logger.error(
+                f"Timed out after {config.pg_pool_acquire_timeout}s waiting for a database "
+                f"connection from the {self.pool_labels[0]} pool, "
+                f"pool size: {self._pool.get_size()}/{self._pool.get_max_size()}"
+            )
+            raise
+        finally:
+            DB_POOL_WAITING.dec(self.pool_labels)
+
+        wait_time = time.perf_counter() - start_time
+        DB_POOL_ACQUIRE_SECONDS.observe(wait_time, self.pool_labels)
+        if wait_time >= config.pg_pool_acquire_warning_threshold:
+            self.warn_blocked_acquire(wait_time)
+
+        return connection
+
+    async def sample_planning_time(self, query_name: str, query_str: str, args: list[Any]) -> None:
+        assert self._pool is not None, "DatabaseBackend is not running"
+        # Don't take a connection that a request is waiting for, the next query samples again.
+        if self._pool.get_idle_size() < 1:
+            return
+
+        explain_query = f"EXPLAIN (SUMMARY, FORMAT JSON) {query_str}"
+        try:
+            async with self._pool.acquire(timeout=config.pg_pool_acquire_timeout) as connection:
+                plan = await connection.fetchval(explain_query, *args)
+        except Exception as e:
+            logger.warning(f"Could not sample the planning time of query {query_name}: {e}")
+            return
+
+        planning_time = json.loads(plan)[0]["Planning Time"] / 1000
+        DB_QUERY_PLANNING_SECONDS.observe(planning_time, (query_name,))
+
+    def warn_blocked_acquire(self, wait_time: float) -> None:
+        assert self._pool is not None
+        self.blocked_since_last_warning += 1
+        now = time.monotonic()
+        if now - self.last_warning_time < POOL_WARNING_INTERVAL_SECONDS:
+            return
+
+        logger.warning(
+            f"Waited {wait_time * 1000:.0f}ms for a database connection from the "
+            f"{self.pool_labels[0]} pool ({self.blocked_since_last_warning} blocked acquisitions "
+            f"since last warning), pool size: "
+            f"{self._pool.get_size()}/{self._pool.get_max_size()}, "
+            f"waiting: {DB_POOL_WAITING.values.get(self.pool_labels, 0.0):.0f}"
+        )
+        self.blocked_since_last_warning = 0
+        self.last_warning_time = now
+
+    def collect_metrics(self) -> None:
+        if self._pool is None:
+            return
+
+        size = self._pool.get_size()
+        idle = self._pool.get_idle_size()
+        DB_POOL_SIZE.set(size, self.pool_labels)
+        DB_POOL_IDLE.set(idle, self.pool_labels)
+        DB_POOL_IN_USE.set(size - idle, self.pool_labels)
+        DB_POOL_MAX_SIZE.set(self._pool.get_max_size(), self.pool_labels)
+
+
+class InstrumentedDatabase(Database):
+    """
+    Records the time spent and rows returned per query, grouped by the function that issued it.
+
+    If a read replica is configured, reads are sent to it when `use_read_replica` is set. Writes
+    always go to this database.
+    """
+
+    SUPPORTED_BACKENDS = Database.SUPPORTED_BACKENDS | {
+        "postgresql": f"{__name__}:InstrumentedPostgresBackend",
+        "postgres": f"{__name__}:InstrumentedPostgresBackend",
+    }
+
+    def __init__(
+        self, url: str | DatabaseURL, *, pool_name: str = "primary", **options: Any
+    ) -> None:
+        super().__init__(url, **options)
+        self.read_replica: InstrumentedDatabase | None = None
+        if isinstance(self._backend, InstrumentedPostgresBackend):
+            self._backend.pool_labels = (pool_name,)
+
+    async def connect(self) -> None:
+        await super().connect()
+        if self.read_replica is not None:
+            await self.read_replica.connect()
+
+    async def disconnect(self) -> None:
+        if self.read_replica is not None:
+            await self.read_replica.disconnect()
+        await super().disconnect()
+
+    def get_read_replica(self) -> "InstrumentedDatabase | None":
+        return self.read_replica if use_read_replica.get() else None
+
+    async def fetch_all(
+        self, query: QueryType, values: dict[str, Any] | None = None
+    ) -> list[Record]:
+        if (read_replica := self.get_read_replica()) is not None:
+            return await read_replica.fetch_all(query, values)
+
+        query_name, start_time = get_query_name(), time.perf_counter()
+        result = await super().fetch_all(*bind_prepared_query(query, values))
+        record_query(query_name, start_time, len(result))
+        return result
+
+    async def fetch_one(
+        self, query: QueryType, values: dict[str, Any] | None = None
+    ) -> Record | None:
+        if (read_replica := self.get_read_replica()) is not None:
+            return await read_replica.fetch_one(query, values)
+
+        query_name, start_time = get_query_name(), time.perf_counter()
+        result = await super().fetch_one(*bind_prepared_query(query, values))
+        record_query(query_name, start_time, int(result is not None))
+        return result
+
+    async def fetch_val(
+        self, query: QueryType, values: dict[str, Any] | None = None, column: Any = 0
+    ) -> Any:
+        if (read_replica := self.get_read_replica()) is not None:
+            return await read_replica.fetch_val(query, values, column)
+
+        query_name, start_time = get_query_name(), time.perf_counter()
+        result = await super().fetch_val(*bind_prepared_query(query, values), column)
+        record_query(query_name, start_time, 1)
+        return result
+
+    async def iterate(
+        self, query: QueryType, values: dict[str, Any] | None = None
+    ) -> AsyncGenerator[Mapping[Any, Any], None]:
+        """
+        Yields the rows one by one from a server-side cursor, so large results are never held in
+        memory at once.
+        """
+        if (read_replica := self.get_read_replica()) is not None:
+            async for record in read_replica.iterate(query, values):
+                yield record
+            return
+
+        query_name, start_time, row_count = get_query_name(), time.perf_counter(), 0
+        async for record in super().iterate(*bind_prepared_query(query, values)):
+            row_count += 1
+            yield record
+        record_query(query_name, start_time, row_count)
+
+    async def execute(self, query: QueryType, values: dict[str, Any] | None = None) -> Any:
+        query_name, start_time = get_query_name(), time.perf_counter()
+        result = await super().execute(*bind_prepared_query(query, values))
+        record_query(query_name, start_time, 0)
+        return result
+
+    async def execute_many(self, query: QueryType, values: list[Any]) -> None:
+        query_name, start_time = get_query_name(), time.perf_counter()
+        await super().execute_many(query, values)
+        record_query(query_name, start_time, len(values))
 
 
 def datetime_decoder(value: str) -> datetime_utc:
@@ -44,16 +410,41 @@ def get_database_url():
         return str(config.pg_dsn)
 
 
+def get_server_settings() -> dict[str, str]:
+    if config.pg_statement_timeout_ms is None:
+        return {}
+
+    return {"statement_timeout": str(config.pg_statement_timeout_ms)}
+
+
+def create_postgres_database_instance(url: str, pool_name: str) -> InstrumentedDatabase:
+    return InstrumentedDatabase(
+        url,
+        pool_name=pool_name,
+        init=asyncpg_init,
+        min_size=config.pg_pool_min_size,
+        max_size=config.pg_pool_max_size,
+        server_settings=get_server_settings(),
+        statement_cache_size=config.pg_statement_cache_size,
+        max_cached_statement_lifetime=config.pg_max_cached_statement_lifetime,
+    )
+
+
 def create_database_instance():
     """Create database instance based on deployment mode"""
     db_url = get_database_url()
     
     if db_url.startswith("sqlite"):
         # SQLite mode: No special initialization needed
-        return Database(db_url)
+        return InstrumentedDatabase(db_url)
     else:
         # PostgreSQL mode: Use existing asyncpg initialization
-        return Database(db_url, init=asyncpg_init)
+        instance = create_postgres_database_instance(db_url, "primary")
+        if config.pg_replica_dsn is not None:
+            instance.read_replica = create_postgres_database_instance(
+                str(config.pg_replica_dsn), "replica"
+            )
+        return instance
 
 
 def create_sqlalchemy_engine():
@@ -0,0 +1,62 @@
+"""
+In-memory caches for the queries that authenticate every API request: the user belonging to the
+email in the JWT and the tournaments and clubs that user can access.
+
+Only positive results are cached, so that access is granted as soon as it is given. The queries
+always read from the primary database, never from a lagging read replica.
+
+Writes invalidate the caches of the process that handles them. Other worker processes keep their
+entries until they expire, so `config.auth_cache_ttl` bounds how long a revoked club membership
+keeps granting access there.
+"""
+
+from collections.abc import Hashable
+from typing import TypeVar
+
+from bracket.config import config
+from bracket.models.db.user import UserInDB
+from bracket.utils.cache import LRUCache
+from bracket.utils.id_types import ClubId, TournamentId, UserId
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class AuthCache:
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.users: LRUCache[str, UserInDB] = LRUCache(max_size, ttl)
+        self.tournament_access: LRUCache[tuple[UserId, TournamentId], bool] = LRUCache(
+            max_size, ttl
+        )
+        self.club_access: LRUCache[UserId, frozenset[ClubId]] = LRUCache(max_size, ttl)
+        # Incremented on every invalidation, so that a query that was already running when the
+        # cache was invalidated doesn't store its (possibly outdated) result.
+        self.generation = 0
+
+    def set_if_not_invalidated(
+        self, cache: LRUCache[K, V], key: K, value: V, since_generation: int
+    ) -> None:
+        if self.generation == since_generation:
+            cache.set(key, value)
+
+    def invalidate_user(self, user_id: UserId) -> None:
+        self.generation += 1
+        self.users.delete_where(lambda _, user: user.id == user_id)
+        self.tournament_access.delete_where(lambda key, _: key[0] == user_id)
+        self.club_access.delete(user_id)
+
+    def invalidate_access(self) -> None:
+        """
+        Clears the cached access of all users, for changes that affect every member of a club, like
+        creating or deleting a tournament or club.
+        """
+        self.generation += 1
+        self.tournament_access.clear()
+        self.club_access.clear()
+
+    def clear(self) -> None:
+        self.invalidate_access()
+        self.users.clear()
+
+
+auth_cache = AuthCache(config.auth_cache_size, config.auth_cache_ttl)
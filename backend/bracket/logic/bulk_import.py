@@ -0,0 +1,162 @@
+"""
+Parsing and validation of the team and player names that are imported in bulk from a CSV.
+
+The CSV is either pasted (a JSON body) or uploaded as a file. Both are read line by line and
+yielded in batches, so that an uploaded file is never held in memory as a whole and every batch
+can be written while the rest of the file is still being read. Once a row is invalid, no more
+batches are yielded, but the remaining rows are still validated. The import then fails with the
+errors of all invalid rows, and the transaction it runs in is rolled back.
+"""
+
+import codecs
+import csv
+import io
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from functools import cache
+from typing import Annotated, TypeVar
+
+from fastapi import HTTPException, UploadFile
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from starlette import status
+
+from bracket.models.db.player import PlayerBody
+from bracket.models.db.team import TeamBody
+
+MAX_REPORTED_ROW_ERRORS = 50
+IMPORT_BATCH_SIZE = 1_000
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+T = TypeVar("T")
+
+
+class ImportedTeam(BaseModel):
+    name: str
+    player_names: list[str]
+
+
+class ImportRowError(BaseModel):
+    row: int
+    error: str
+
+    def __str__(self) -> str:
+        return f"Row {self.row}: {self.error}"
+
+
+async def iter_text_lines(text: str) -> AsyncIterator[str]:
+    for line in io.StringIO(text):
+        yield line
+
+
+async def iter_upload_lines(file: UploadFile) -> AsyncIterator[str]:
+    """
+    Reads an uploaded UTF-8 file in chunks and yields its lines.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    remainder = ""
+    try:
+        while len(chunk := await file.read(UPLOAD_CHUNK_SIZE)) > 0:
+            *lines, remainder = (remainder + decoder.decode(chunk)).split("\n")
+            for line in lines:
+                yield line
+
+        remainder += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="The file is not valid UTF-8"
+        ) from exc
+
+    if len(remainder) > 0:
+        yield remainder
+
+
+@cache
+def get_name_validator(model: type[BaseModel]) -> TypeAdapter[str]:
+    """
+    Returns a validator for the `name` field of `model`, so that imported names follow the same
+    constraints as names that are entered one by one.
+    """
+    field = model.model_fields["name"]
+    return TypeAdapter(Annotated[str, *field.metadata])
+
+
+def validate_name(model: type[BaseModel], name: str) -> str | None:
+    try:
+        get_name_validator(model).validate_python(name)
+    except ValidationError as exc:
+        return str(exc.errors()[0]["msg"])
+
+    return None
+
+
+def raise_for_row_errors(row_errors: list[ImportRowError]) -> None:
+    """
+    Raises a 400 whose `detail` is a string with one line per invalid row, which the frontend
+    shows as is.
+    """
+    if len(row_errors) < 1:
+        return
+
+    lines = [str(row_error) for row_error in row_errors[:MAX_REPORTED_ROW_ERRORS]]
+    if len(row_errors) > MAX_REPORTED_ROW_ERRORS:
+        lines.append(f"And {len(row_errors) - MAX_REPORTED_ROW_ERRORS} more invalid rows")
+
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="\n".join(lines))
+
+
+def parse_team_row(
+    row_number: int, line: str, row_errors: list[ImportRowError]
+) -> ImportedTeam | None:
+    """
+    A row consists of a team name followed by the names of the players in that team.
+    """
+    cells = [cell.strip() for row in csv.reader([line]) for cell in row]
+    if not any(len(cell) > 0 for cell in cells):
+        return None
+
+    team_name, *player_names = cells
+    player_names = [name for name in player_names if len(name) > 0]
+    names = [(TeamBody, team_name)] + [(PlayerBody, name) for name in player_names]
+    for model, name in names:
+        if (error := validate_name(model, name)) is not None:
+            row_errors.append(ImportRowError(row=row_number, error=f"{error}: '{name}'"))
+
+    return ImportedTeam(name=team_name, player_names=player_names)
+
+
+def parse_player_row(row_number: int, line: str, row_errors: list[ImportRowError]) -> str | None:
+    """
+    A row contains a single player name, which may contain commas.
+    """
+    if len(name := line.strip()) < 1:
+        return None
+
+    if (error := validate_name(PlayerBody, name)) is not None:
+        row_errors.append(ImportRowError(row=row_number, error=f"{error}: '{name}'"))
+
+    return name
+
+
+async def iter_batches(
+    lines: AsyncIterable[str],
+    parse_row: Callable[[int, str, list[ImportRowError]], T | None],
+    row_errors: list[ImportRowError],
+) -> AsyncIterator[list[T]]:
+    """
+    Parses the lines with `parse_row`, which appends the errors of invalid rows to `row_errors`.
+    """
+    batch: list[T] = []
+    row_number = 0
+    async for line in lines:
+        row_number += 1
+        if (parsed := parse_row(row_number, line, row_errors)) is not None:
+            batch.append(parsed)
+
+        if len(row_errors) > 0:
+            # Nothing will be written anymore, only keep validating.
+            batch.clear()
+        elif len(batch) >= IMPORT_BATCH_SIZE:
+            yield batch
+            batch = []
+
+    if len(batch) > 0:
+        yield batch
@@ -3,6 +3,7 @@ from collections import defaultdict
 from bracket.database import database
 from bracket.models.db.match import Match, MatchWithDetailsDefinitive
 from bracket.models.db.util import StageWithStageItems
+from bracket.utils.compute import run_cpu_bound
 from bracket.utils.id_types import MatchId
 
 
@@ -24,7 +25,7 @@ def matches_overlap(match1: Match, match2: Match) -> bool:
 def get_conflicting_matches(
     stages: list[StageWithStageItems],
 ) -> tuple[
-    defaultdict[MatchId, list[bool]],
+    dict[MatchId, list[bool]],
     set[MatchId],
 ]:
     matches = [
@@ -74,7 +75,7 @@ def get_conflicting_matches(
             conflicts_to_clear.add(match.id)
 
     assert set(conflicts_to_set.keys()).intersection(conflicts_to_clear) == set()
-    return conflicts_to_set, conflicts_to_clear
+    return dict(conflicts_to_set), conflicts_to_clear
 
 
 async def set_conflicts(
@@ -111,5 +112,13 @@ async def set_conflicts(
 
 
 async def handle_conflicts(stages: list[StageWithStageItems]) -> None:
-    conflicts_to_set, conflicts_to_clear = get_conflicting_matches(stages)
+    match_count = sum(
+        len(round_.matches)
+        for stage in stages
+        for stage_item in stage.stage_items
+        for round_ in stage_item.rounds
+    )
+    conflicts_to_set, conflicts_to_clear = await run_cpu_bound(
+        get_conflicting_matches, stages, size=match_count**2
+    )
     await set_conflicts(conflicts_to_set, conflicts_to_clear)
@@ -10,6 +10,7 @@ from bracket.models.db.stage_item import StageType
 from bracket.models.db.util import StageItemWithRounds
 from bracket.sql.rankings import get_ranking_for_stage_item
 from bracket.sql.teams import update_team_stats
+from bracket.utils.compute import run_cpu_bound
 from bracket.utils.id_types import PlayerId, StageItemInputId, TeamId, TournamentId
 
 K = 32
@@ -64,6 +65,10 @@ def set_statistics_for_stage_item_input(
             raise ValueError(f"Unsupported stage type: {stage_item.type}")
 
 
+def get_match_count_in_stage_item(stage_item: StageItemWithRounds) -> int:
+    return sum(len(round_.matches) for round_ in stage_item.rounds)
+
+
 def determine_ranking_for_stage_item(
     stage_item: StageItemWithRounds,
     ranking: Ranking,
@@ -117,7 +122,12 @@ async def recalculate_ranking_for_stage_item(
         if stage_item_input.team_id is not None
     }
 
-    elo_per_input = determine_ranking_for_stage_item(stage_item, ranking)
+    elo_per_input = await run_cpu_bound(
+        determine_ranking_for_stage_item,
+        stage_item,
+        ranking,
+        size=get_match_count_in_stage_item(stage_item),
+    )
 
     for stage_item_input_id in team_x_stage_item_input_lookup.values():
         await update_team_stats(
@@ -45,6 +45,7 @@ async def create_rounds_for_new_stage_item(
                 created=MOCK_NOW,
                 is_draft=False,
                 stage_item_id=stage_item.id,
+                tournament_id=tournament_id,
                 name=await get_next_round_name(tournament_id, stage_item.id),
             ),
         )
@@ -6,6 +6,7 @@ from starlette import status
 
 from bracket.logic.ranking.calculation import (
     determine_team_ranking_for_stage_item,
+    get_match_count_in_stage_item,
 )
 from bracket.logic.ranking.statistics import TeamStatistics
 from bracket.models.db.stage_item_inputs import (
@@ -22,6 +23,7 @@ from bracket.sql.stage_item_inputs import (
     sql_set_team_id_for_stage_item_input,
 )
 from bracket.sql.stages import get_full_tournament_details
+from bracket.utils.compute import run_cpu_bound
 from bracket.utils.id_types import (
     StageId,
     StageItemId,
@@ -92,9 +94,11 @@ async def get_team_rankings_lookup_for_tournament(
         stage_item.id: stage_item for stage in stages for stage_item in stage.stage_items
     }
     return {
-        stage_item_id: determine_team_ranking_for_stage_item(
+        stage_item_id: await run_cpu_bound(
+            determine_team_ranking_for_stage_item,
             stage_item,
             assert_some(await get_ranking_for_stage_item(tournament_id, stage_item.id)),
+            size=get_match_count_in_stage_item(stage_item),
         )
         for stage_item_id, stage_item in stage_items.items()
     }
@@ -1,8 +1,18 @@
 import itertools
+import math
+import os
 import random
 from collections import defaultdict
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from decimal import Decimal
+from itertools import repeat
 
-from bracket.logic.scheduling.shared import check_input_combination_adheres_to_filter
+from bracket.config import config
+from bracket.logic.scheduling.shared import (
+    check_input_combination_adheres_to_filter,
+    get_suggested_match,
+)
 from bracket.models.db.match import (
     MatchFilter,
     MatchWithDetailsDefinitive,
@@ -53,35 +63,143 @@ def get_number_of_inputs_played_per_input(
     return result
 
 
-def get_possible_upcoming_matches_for_swiss(
+PairingCost = tuple[int, int, Decimal]
+
+
+def get_pairing_attempt(
+    seed: int,
+    input_ids: Sequence[StageItemInputId],
+    elos: Sequence[Decimal],
+    times_played: Sequence[int],
+    previous_match_hashes: frozenset[str],
+    elo_diff_threshold: int,
+) -> tuple[PairingCost, list[tuple[int, int]]]:
+    """
+    Builds one complete pairing greedily: inputs are visited in a random order (determined by
+    `seed`) and each unpaired input is matched to the best remaining opponent.
+
+    Only takes plain data so that it can be pickled and run in a separate process.
+    Returns the cost of the pairing (lower is better) and the pairs as indices into `input_ids`.
+    """
+    rng = random.Random(seed)
+    order = list(range(len(input_ids)))
+    rng.shuffle(order)
+
+    is_paired = [False] * len(input_ids)
+    pairs: list[tuple[int, int]] = []
+    times_played_total = 0
+    elo_diff_total = Decimal("0")
+
+    for i in order:
+        if is_paired[i]:
+            continue
+
+        best_opponent: int | None = None
+        best_key: tuple[int, Decimal] | None = None
+        for j in order:
+            if j == i or is_paired[j]:
+                continue
+            if get_match_hash(input_ids[i], input_ids[j]) in previous_match_hashes:
+                continue
+
+            elo_diff = abs(elos[i] - elos[j])
+            if elo_diff > elo_diff_threshold:
+                continue
+
+            key = (times_played[i] + times_played[j], elo_diff)
+            if best_key is None or key < best_key:
+                best_opponent, best_key = j, key
+
+        if best_opponent is None or best_key is None:
+            continue
+
+        is_paired[i] = is_paired[best_opponent] = True
+        pairs.append((i, best_opponent))
+        times_played_total += best_key[0]
+        elo_diff_total += best_key[1]
+
+    unpaired_count = is_paired.count(False)
+    return (unpaired_count, times_played_total, elo_diff_total), pairs
+
+
+def get_best_pairing_attempt(
+    seeds: Sequence[int],
+    input_ids: Sequence[StageItemInputId],
+    elos: Sequence[Decimal],
+    times_played: Sequence[int],
+    previous_match_hashes: frozenset[str],
+    elo_diff_threshold: int,
+) -> tuple[PairingCost, list[tuple[int, int]]]:
+    """
+    Runs a pairing attempt per seed and returns the first one with the lowest cost.
+
+    A worker runs a whole chunk of seeds, so the inputs are pickled once per chunk instead of once
+    per attempt.
+    """
+    attempts = (
+        get_pairing_attempt(
+            seed, input_ids, elos, times_played, previous_match_hashes, elo_diff_threshold
+        )
+        for seed in seeds
+    )
+    return min(attempts, key=lambda attempt: attempt[0])
+
+
+def get_best_pairing_with_restarts(
     filter_: MatchFilter,
-    rounds: list[RoundWithMatches],
-    stage_item_inputs: list[StageItemInput],
-    draft_round: RoundWithMatches | None = None,
+    inputs_to_schedule: list[StageItemInput],
+    previous_match_input_hashes: frozenset[str],
+    times_played_per_input: dict[int, int],
+    rng: random.Random,
+    executor: Executor | None = None,
 ) -> list[SuggestedMatch]:
-    # pylint: disable=too-many-branches,unsubscriptable-object
-    suggestions: list[SuggestedMatch] = []
-    scheduled_hashes: list[str] = []
-    draft_round_input_ids = get_draft_round_input_ids(draft_round) if draft_round else frozenset()
-
-    inputs_to_schedule = [
-        input_
-        for input_ in stage_item_inputs
-        if input_.id not in draft_round_input_ids
-        and (not isinstance(input_, StageItemInputFinal) or input_.team.active)
-    ]
+    """
+    Runs `filter_.restarts` independent randomized pairing attempts and keeps the one with the
+    lowest cost. Attempts are distributed over `executor` if given, otherwise run sequentially.
+    """
+    input_ids = [input_.id for input_ in inputs_to_schedule]
+    elos = [input_.elo for input_ in inputs_to_schedule]
+    times_played = [times_played_per_input[input_.id] for input_ in inputs_to_schedule]
+    seeds = [rng.randrange(2**32) for _ in range(filter_.restarts)]
 
-    if len(inputs_to_schedule) < 1:
-        return []
+    # Split the seeds into one contiguous chunk per worker. Because the chunks are in order, the
+    # first attempt with the lowest cost wins, regardless of the number of workers.
+    workers = 1 if executor is None else config.compute_offload_workers or os.cpu_count() or 1
+    chunk_size = math.ceil(len(seeds) / workers)
+    seed_chunks = [seeds[i : i + chunk_size] for i in range(0, len(seeds), chunk_size)]
 
-    previous_match_input_hashes = get_previous_matches_hashes(rounds)
-    times_played_per_input = get_number_of_inputs_played_per_input(
-        rounds, excluded_input_ids=draft_round_input_ids
+    map_ = executor.map if executor is not None else map
+    attempts = map_(
+        get_best_pairing_attempt,
+        seed_chunks,
+        repeat(input_ids),
+        repeat(elos),
+        repeat(times_played),
+        repeat(previous_match_input_hashes),
+        repeat(filter_.elo_diff_threshold),
     )
+    _, best_pairs = min(attempts, key=lambda attempt: attempt[0])
 
-    for input_ in inputs_to_schedule:
-        if input_.id not in times_played_per_input:
-            times_played_per_input[input_.id] = 0
+    suggestions = []
+    for i, j in best_pairs:
+        input1, input2 = sorted(
+            (inputs_to_schedule[i], inputs_to_schedule[j]), key=lambda x: assert_some(x.id)
+        )
+        suggestions.append(get_suggested_match(input1, input2, times_played[i] + times_played[j]))
+
+    return suggestions
+
+
+def get_candidate_matches_by_sampling(
+    filter_: MatchFilter,
+    inputs_to_schedule: list[StageItemInput],
+    previous_match_input_hashes: frozenset[str],
+    times_played_per_input: dict[int, int],
+    rng: random.Random,
+) -> list[SuggestedMatch]:
+    # pylint: disable=unsubscriptable-object
+    suggestions: list[SuggestedMatch] = []
+    scheduled_hashes: list[str] = []
 
     # If there are more possible matches to schedule (N * (N - 1)) than iteration count, then
     # pick random combinations.
@@ -95,12 +213,12 @@ def get_possible_upcoming_matches_for_swiss(
     if N * N <= filter_.iterations:
         inputs1 = inputs_to_schedule.copy()
         inputs2 = inputs_to_schedule.copy()
-        random.shuffle(inputs1)
-        random.shuffle(inputs2)
+        rng.shuffle(inputs1)
+        rng.shuffle(inputs2)
         inputs_iter = itertools.product(inputs1, inputs2)
     else:
-        inputs1 = random.choices(inputs_to_schedule, k=filter_.iterations)
-        inputs2 = random.choices(inputs_to_schedule, k=filter_.iterations)
+        inputs1 = rng.choices(inputs_to_schedule, k=filter_.iterations)
+        inputs2 = rng.choices(inputs_to_schedule, k=filter_.iterations)
         inputs_iter = zip(inputs1, inputs2)
 
     for i1, i2 in inputs_iter:
@@ -126,6 +244,62 @@ def get_possible_upcoming_matches_for_swiss(
             scheduled_hashes.append(match_hash)
             scheduled_hashes.append(get_match_hash(input2.id, input1.id))
 
+    return suggestions
+
+
+def get_possible_upcoming_matches_for_swiss(
+    filter_: MatchFilter,
+    rounds: list[RoundWithMatches],
+    stage_item_inputs: list[StageItemInput],
+    draft_round: RoundWithMatches | None = None,
+    executor: Executor | None = None,
+    seed: int | None = None,
+) -> list[SuggestedMatch]:
+    """
+    Suggests matches for the next Swiss round.
+
+    By default, candidate matches are sampled randomly (see `MatchFilter.iterations`).
+    If `filter_.restarts` is positive, complete pairings are searched instead using randomized
+    restarts, and only the matches of the best pairing are returned.
+
+    Passing the same `seed` for the same input gives the same suggestions.
+    """
+    rng = random.Random(seed)
+    draft_round_input_ids = get_draft_round_input_ids(draft_round) if draft_round else frozenset()
+
+    inputs_to_schedule = [
+        input_
+        for input_ in stage_item_inputs
+        if input_.id not in draft_round_input_ids
+        and (not isinstance(input_, StageItemInputFinal) or input_.team.active)
+    ]
+
+    if len(inputs_to_schedule) < 1:
+        return []
+
+    previous_match_input_hashes = get_previous_matches_hashes(rounds)
+    times_played_per_input = get_number_of_inputs_played_per_input(
+        rounds, excluded_input_ids=draft_round_input_ids
+    )
+
+    for input_ in inputs_to_schedule:
+        if input_.id not in times_played_per_input:
+            times_played_per_input[input_.id] = 0
+
+    if filter_.restarts > 0:
+        suggestions = get_best_pairing_with_restarts(
+            filter_,
+            inputs_to_schedule,
+            previous_match_input_hashes,
+            times_played_per_input,
+            rng,
+            executor,
+        )
+    else:
+        suggestions = get_candidate_matches_by_sampling(
+            filter_, inputs_to_schedule, previous_match_input_hashes, times_played_per_input, rng
+        )
+
     if len(suggestions) < 1:
         return []
 
@@ -1,3 +1,5 @@
+import hashlib
+
 from fastapi import HTTPException
 
 from bracket.logic.scheduling.ladder_teams import get_possible_upcoming_matches_for_swiss
@@ -5,7 +7,46 @@ from bracket.models.db.match import MatchFilter, SuggestedMatch
 from bracket.models.db.stage_item import StageType
 from bracket.models.db.util import RoundWithMatches, StageItemWithRounds
 from bracket.sql.stages import get_full_tournament_details
-from bracket.utils.id_types import StageItemId, TournamentId
+from bracket.utils.cache import LRUCache
+from bracket.utils.compute import get_process_pool, run_cpu_bound
+from bracket.utils.id_types import RoundId, StageItemId, TournamentId
+
+SuggestionsCacheKey = tuple[StageItemId, RoundId | None, MatchFilter, str]
+suggestions_cache: LRUCache[SuggestionsCacheKey, list[SuggestedMatch]] = LRUCache(max_size=256)
+
+
+def get_stage_item_state_version(stage_item: StageItemWithRounds) -> str:
+    """
+    Returns a digest of everything in the stage item that influences Swiss suggestions, so it
+    changes whenever a match (including one in the draft round) or an input changes.
+
+    The suggestions embed the inputs, including their teams and players, so every field of the
+    inputs is part of the digest, not only the ones the pairing is based on.
+
+    Uses `hashlib` instead of `hash()` so that all workers agree on the same version.
+    """
+    state = (
+        stage_item.id,
+        [
+            (
+                round_.id,
+                round_.is_draft,
+                [
+                    (
+                        match.id,
+                        match.stage_item_input1_id,
+                        match.stage_item_input2_id,
+                        match.stage_item_input1_score,
+                        match.stage_item_input2_score,
+                    )
+                    for match in sorted(round_.matches, key=lambda m: m.id)
+                ],
+            )
+            for round_ in sorted(stage_item.rounds, key=lambda r: r.id)
+        ],
+        [input_.model_dump_json() for input_ in sorted(stage_item.inputs, key=lambda i: i.id)],
+    )
+    return hashlib.sha256(repr(state).encode()).hexdigest()
 
 
 async def get_draft_round_in_stage_item(
@@ -27,17 +68,58 @@ async def get_draft_round_in_stage_item(
     return draft_round, stage_item
 
 
-def get_upcoming_matches_for_swiss(
+async def get_upcoming_matches_for_swiss(
     match_filter: MatchFilter,
     stage_item: StageItemWithRounds,
     draft_round: RoundWithMatches | None = None,
 ) -> list[SuggestedMatch]:
+    """
+    Computes the suggestions via the compute offload layer so that the event loop is not blocked.
+    When randomized restarts are requested, the search runs in a worker thread that distributes
+    the attempts over the process pool.
+
+    Suggestions are seeded by the state version of the stage item, so they are reproducible and
+    can be cached until a match in the stage item changes.
+    """
     if stage_item.type is not StageType.SWISS:
         raise HTTPException(400, "Expected stage item to be of type SWISS.")
 
     if draft_round is not None and not draft_round.is_draft:
         raise HTTPException(400, "There is no draft round, so no matches can be scheduled.")
 
-    return get_possible_upcoming_matches_for_swiss(
-        match_filter, stage_item.rounds, stage_item.inputs, draft_round
+    state_version = get_stage_item_state_version(stage_item)
+    cache_key = (
+        stage_item.id,
+        draft_round.id if draft_round is not None else None,
+        match_filter,
+        state_version,
     )
+    if (cached := suggestions_cache.get(cache_key)) is not None:
+        return list(cached)
+
+    inputs_count = len(stage_item.inputs)
+    if match_filter.restarts > 0:
+        suggestions = await run_cpu_bound(
+            get_possible_upcoming_matches_for_swiss,
+            match_filter,
+            stage_item.rounds,
+            stage_item.inputs,
+            draft_round,
+            get_process_pool(),
+            int(state_version[:16], 16),
+            size=match_filter.restarts * inputs_count**2,
+            executor_type="thread",
+        )
+    else:
+        suggestions = await run_cpu_bound(
+            get_possible_upcoming_matches_for_swiss,
+            match_filter,
+            stage_item.rounds,
+            stage_item.inputs,
+            draft_round,
+            None,
+            int(state_version[:16], 16),
+            size=min(match_filter.iterations, inputs_count**2),
+        )
+    suggestions_cache.set(cache_key, suggestions)
+    return list(suggestions)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from fastapi import HTTPException
 from heliclockter import datetime_utc
@@ -11,9 +11,10 @@ from bracket.models.db.club import ClubCreateBody
 from bracket.models.db.ranking import RankingCreateBody
 from bracket.models.db.tournament import TournamentBody
 from bracket.sql.clubs import create_club
+from bracket.sql.quotas import sql_count_for_tournament_quota
 from bracket.sql.rankings import sql_create_ranking
 from bracket.sql.tournaments import sql_create_tournament
-from bracket.utils.id_types import UserId
+from bracket.utils.id_types import TournamentId, UserId
 
 if TYPE_CHECKING:
     from bracket.models.db.user import UserBase
@@ -62,10 +63,10 @@ subscription_lookup = {
 }
 
 
-def check_requirement(array: list[Any], user: UserBase, attribute: str, additions: int = 1) -> None:
+def check_requirement(count: int, user: UserBase, attribute: str, additions: int = 1) -> None:
     subscription = subscription_lookup[user.account_type]
     constraint: int = getattr(subscription, attribute)
-    if len(array) + additions > constraint:
+    if count + additions > constraint:
         raise HTTPException(
             400,
             f"Your `{user.account_type.value}` subscription allows a maximum of "
@@ -73,6 +74,16 @@ def check_requirement(array: list[Any], user: UserBase, attribute: str, addition
         )
 
 
+async def check_tournament_quota(
+    tournament_id: TournamentId, user: UserBase, attribute: str, additions: int = 1
+) -> None:
+    """
+    Checks a limit on the entities of a tournament by counting them, without loading them.
+    """
+    count = await sql_count_for_tournament_quota(tournament_id, attribute)
+    check_requirement(count, user, attribute, additions)
+
+
 async def setup_demo_account(user_id: UserId) -> None:
     club = ClubCreateBody(name="Demo Club")
     club_inserted = await create_club(club, user_id)
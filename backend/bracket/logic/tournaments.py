@@ -1,14 +1,13 @@
 import aiofiles.os
 
-from bracket.sql.courts import sql_delete_courts_of_tournament
-from bracket.sql.players import sql_delete_players_of_tournament
-from bracket.sql.rankings import get_all_rankings_in_tournament, sql_delete_ranking
-from bracket.sql.shared import sql_delete_stage_item_matches, sql_delete_stage_item_relations
-from bracket.sql.stage_items import sql_delete_stage_item
-from bracket.sql.stages import get_full_tournament_details, sql_delete_stage
-from bracket.sql.teams import sql_delete_teams_of_tournament
-from bracket.sql.tournaments import sql_delete_tournament, sql_get_tournament
+from bracket.sql.tournaments import (
+    DeletedTournaments,
+    sql_delete_tournaments_with_contents,
+    sql_get_tournament,
+)
+from bracket.utils.asyncio import AsyncioTasksManager
 from bracket.utils.id_types import TournamentId
+from bracket.utils.logging import logger
 
 
 async def get_tournament_logo_path(tournament_id: TournamentId) -> str | None:
@@ -17,34 +16,27 @@ async def get_tournament_logo_path(tournament_id: TournamentId) -> str | None:
     return logo_path if logo_path is not None and await aiofiles.os.path.exists(logo_path) else None
 
 
-async def delete_tournament_logo(tournament_id: TournamentId) -> None:
-    logo_path = await get_tournament_logo_path(tournament_id)
-    if logo_path is not None:
-        await aiofiles.os.remove(logo_path)
+async def delete_logo_files(logo_paths: list[str]) -> None:
+    for logo_path in logo_paths:
+        try:
+            if await aiofiles.os.path.exists(logo_path):
+                await aiofiles.os.remove(logo_path)
+        except Exception as exc:
+            logger.error(f"Could not remove logo of deleted tournament: {logo_path}\n{exc}")
 
 
-async def sql_delete_tournament_completely(tournament_id: TournamentId) -> None:
-    stages = await get_full_tournament_details(tournament_id)
-    await delete_tournament_logo(tournament_id)
-
-    for stage in stages:
-        for stage_item in stage.stage_items:
-            await sql_delete_stage_item_matches(stage_item.id)
-
-    for stage in stages:
-        for stage_item in stage.stage_items:
-            await sql_delete_stage_item_relations(stage_item.id)
+def delete_logos_of_deleted_tournaments(deleted: DeletedTournaments) -> None:
+    """
+    The rows are gone already, so removing the files is done in the background instead of holding
+    up the caller.
+    """
+    logo_paths = [f"static/tournament-logos/{logo}" for logo in deleted.tournament_logos] + [
+        f"static/team-logos/{logo}" for logo in deleted.team_logos
+    ]
+    if len(logo_paths) > 0:
+        AsyncioTasksManager.add_coroutine(delete_logo_files(logo_paths))
 
-    for stage in stages:
-        for stage_item in stage.stage_items:
-            await sql_delete_stage_item(stage_item.id)
 
-        await sql_delete_stage(tournament_id, stage.id)
-
-    for ranking in await get_all_rankings_in_tournament(tournament_id):
-        await sql_delete_ranking(tournament_id, ranking.id)
-
-    await sql_delete_players_of_tournament(tournament_id)
-    await sql_delete_courts_of_tournament(tournament_id)
-    await sql_delete_teams_of_tournament(tournament_id)
-    await sql_delete_tournament(tournament_id)
+async def sql_delete_tournament_completely(tournament_id: TournamentId) -> None:
+    deleted = await sql_delete_tournaments_with_contents([tournament_id])
+    delete_logos_of_deleted_tournaments(deleted)
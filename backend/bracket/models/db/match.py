@@ -1,12 +1,12 @@
 from decimal import Decimal
 
 from heliclockter import datetime_utc, timedelta
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from bracket.models.db.court import Court
 from bracket.models.db.shared import BaseModelORM
 from bracket.models.db.stage_item_inputs import StageItemInput
-from bracket.utils.id_types import CourtId, MatchId, RoundId, StageItemInputId
+from bracket.utils.id_types import CourtId, MatchId, RoundId, StageItemInputId, TournamentId
 from bracket.utils.types import assert_some
 
 
@@ -19,6 +19,7 @@ class MatchBaseInsertable(BaseModelORM):
     custom_margin_minutes: int | None = None
     position_in_schedule: int | None = None
     round_id: RoundId
+    tournament_id: TournamentId
     stage_item_input1_score: int
     stage_item_input2_score: int
     court_id: CourtId | None = None
@@ -119,10 +120,13 @@ class MatchRescheduleBody(BaseModelORM):
 
 
 class MatchFilter(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     elo_diff_threshold: int
     only_recommended: bool
     limit: int
     iterations: int
+    restarts: int = 0
 
 
 class SuggestedMatch(BaseModel):
@@ -1,12 +1,13 @@
 from heliclockter import datetime_utc
 
 from bracket.models.db.shared import BaseModelORM
-from bracket.utils.id_types import RoundId, StageItemId
+from bracket.utils.id_types import RoundId, StageItemId, TournamentId
 
 
 class RoundInsertable(BaseModelORM):
     created: datetime_utc
     stage_item_id: StageItemId
+    tournament_id: TournamentId
     is_draft: bool
     name: str
 
@@ -7,7 +7,7 @@ from pydantic import BaseModel, constr
 
 from bracket.models.db.account import UserAccountType
 from bracket.models.db.shared import BaseModelORM
-from bracket.utils.id_types import UserId
+from bracket.utils.id_types import ClubId, TournamentId, UserId
 
 if TYPE_CHECKING:
     from bracket.logic.subscriptions import Subscription
@@ -38,6 +38,12 @@ class UserPublic(UserBase):
     id: UserId
 
 
+class ExpiredDemoAccount(BaseModelORM):
+    id: UserId
+    club_ids: list[ClubId]
+    tournament_ids: list[TournamentId]
+
+
 class UserToUpdate(BaseModel):
     email: str
     name: str
@@ -1,19 +1,24 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from enum import auto
-from functools import cache
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar, Literal, TypeVar
 
-from pydantic import BaseModel
-
-from bracket.utils.http import HTTPMethod
+from bracket.config import config
 from bracket.utils.starlette import get_route_path
 from bracket.utils.types import EnumAutoStr
 
 if TYPE_CHECKING:
     from starlette.requests import Request
 
+LabelValues = tuple[str, ...]
+# For counters and gauges a sample is a float, for histograms it is a list with the count per
+# bucket (the last bucket holds the observations above the highest bound) followed by the sum.
+SampleValue = float | list[float]
+Samples = Mapping[LabelValues, SampleValue]
+MetricT = TypeVar("MetricT", bound="Metric")
+
 
 class PrometheusMetricType(EnumAutoStr):
     counter = auto()
@@ -22,83 +27,391 @@ class PrometheusMetricType(EnumAutoStr):
     histogram = auto()
 
 
-class RequestDefinition(BaseModel):
-    url: str
-    method: HTTPMethod
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
 
-    @staticmethod
-    def from_request(request: Request) -> RequestDefinition:
-        return RequestDefinition(
-            url=get_route_path(request),
-            method=HTTPMethod(request.method),
-        )
 
-    def to_value_lookup(self, value: float) -> tuple[dict[str, str], float]:
-        return {"url": self.url, "method": self.method.value}, value
+def format_labels(label_names: Iterable[str], label_values: Iterable[str]) -> str:
+    return ",".join(
+        [
+            f'{label}="{escape_label_value(label_value)}"'
+            for label, label_value in zip(label_names, label_values)
+        ]
+    )
 
-    def __hash__(self) -> int:
-        return str.__hash__(f"{self.method}-{self.url}")
 
+class Metric:
+    """
+    A metric family with a fixed set of label names.
 
-class MetricDefinition(BaseModel):
-    name: str
-    description: str
-    type_: PrometheusMetricType
+    Samples are stored in a plain dict keyed by a tuple of label values, so recording a sample
+    only costs a dict lookup. Label values are formatted once per label set and cached.
+    """
 
-    def format_for_prometheus(self, value: float) -> str:
-        return (
-            f"# HELP {self.name} {self.description}\n"
-            f"# TYPE {self.name} {self.type_.value}\n"
-            f"{self.name} {value:.06f}\n"
-        )
+    type_: ClassVar[PrometheusMetricType]
+
+    def __init__(self, name: str, description: str, label_names: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.values: dict[LabelValues, SampleValue] = {}
+        self._formatted_labels: dict[LabelValues, str] = {}
 
-    def format_for_prometheus_per_label(self, values: list[tuple[dict[str, str], float]]) -> str:
-        result = f"# HELP {self.name} {self.description}\n# TYPE {self.name} {self.type_.value}\n"
-        for labels, value in values:
-            key_value = ",".join(
-                [f'{label}="{label_value}"' for label, label_value in labels.items()]
+    def get_formatted_labels(self, label_values: LabelValues) -> str:
+        if (formatted := self._formatted_labels.get(label_values)) is None:
+            formatted = self._formatted_labels[label_values] = format_labels(
+                self.label_names, label_values
             )
-            result += f"{self.name}{{{key_value}}} {value}\n"
-
-        return result
-
-
-METRIC_DEFINITIONS = [
-    MetricDefinition(
-        name="bracket_response_time",
-        description="Latest response time per endpoint",
-        type_=PrometheusMetricType.gauge,
-    ),
-    MetricDefinition(
-        name="bracket_request_count",
-        description="Requests count per endpoint",
-        type_=PrometheusMetricType.counter,
-    ),
-    MetricDefinition(
-        name="bracket_version",
-        description="Requests count per endpoint",
-        type_=PrometheusMetricType.counter,
-    ),
-]
-
-
-class RequestMetrics(BaseModel):
-    response_time: dict[RequestDefinition, float] = defaultdict(float)
-    request_count: dict[RequestDefinition, int] = defaultdict(int)
-
-    def to_prometheus(self) -> str:
-        metrics = [
-            METRIC_DEFINITIONS[0].format_for_prometheus_per_label(
-                [m.to_value_lookup(v) for m, v in self.response_time.items()]
-            ),
-            METRIC_DEFINITIONS[1].format_for_prometheus_per_label(
-                [m.to_value_lookup(v) for m, v in self.request_count.items()]
-            ),
-            METRIC_DEFINITIONS[2].format_for_prometheus(1.0),
-        ]
-        return "\n".join(metrics)
+        return formatted
+
+    def render_header(self) -> str:
+        return f"# HELP {self.name} {self.description}\n# TYPE {self.name} {self.type_.value}\n"
+
+    def render(self, samples: Samples) -> Iterator[str]:
+        yield self.render_header()
+        for label_values, value in samples.items():
+            labels = self.get_formatted_labels(label_values)
+            yield f"{self.name}{{{labels}}} {value}\n" if labels else f"{self.name} {value}\n"
+
+    def merge_sample(self, current: SampleValue | None, other: SampleValue) -> SampleValue:
+        assert isinstance(other, float | int) and not isinstance(current, list)
+        return other if current is None else current + other
+
+
+class Counter(Metric):
+    type_ = PrometheusMetricType.counter
+
+    def inc(self, label_values: LabelValues = (), amount: float = 1.0) -> None:
+        value = self.values.get(label_values, 0.0)
+        assert not isinstance(value, list)
+        self.values[label_values] = value + amount
+
+
+class Gauge(Counter):
+    """
+    When aggregating across processes, `multiprocess_mode` determines how the values of the
+    processes that are still alive are combined.
+    """
+
+    type_ = PrometheusMetricType.gauge
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: tuple[str, ...] = (),
+        multiprocess_mode: Literal["sum", "max"] = "sum",
+    ) -> None:
+        super().__init__(name, description, label_names)
+        self.multiprocess_mode = multiprocess_mode
+
+    def set(self, value: float, label_values: LabelValues = ()) -> None:
+        self.values[label_values] = float(value)
+
+    def dec(self, label_values: LabelValues = (), amount: float = 1.0) -> None:
+        self.inc(label_values, -amount)
+
+    def merge_sample(self, current: SampleValue | None, other: SampleValue) -> SampleValue:
+        if self.multiprocess_mode == "sum":
+            return super().merge_sample(current, other)
+
+        assert isinstance(other, float | int) and not isinstance(current, list)
+        return other if current is None else max(current, other)
+
+
+class Histogram(Metric):
+    type_ = PrometheusMetricType.histogram
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: tuple[str, ...] = (),
+        *,
+        buckets: Iterable[float],
+    ) -> None:
+        super().__init__(name, description, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._bucket_labels = [f"{bucket:g}" for bucket in self.buckets] + ["+Inf"]
+
+    def observe(self, value: float, label_values: LabelValues = ()) -> None:
+        if (counts := self.values.get(label_values)) is None:
+            counts = self.values[label_values] = [0.0] * (len(self.buckets) + 2)
+
+        assert isinstance(counts, list)
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def render(self, samples: Samples) -> Iterator[str]:
+        yield self.render_header()
+        for label_values, counts in samples.items():
+            assert isinstance(counts, list)
+            labels = self.get_formatted_labels(label_values)
+            bucket_prefix = f"{self.name}_bucket{{{labels}," if labels else f"{self.name}_bucket{{"
+            cumulative = 0.0
+            for bucket_label, count in zip(self._bucket_labels, counts[:-1]):
+                cumulative += count
+                yield f'{bucket_prefix}le="{bucket_label}"}} {cumulative:.0f}\n'
+
+            suffix = f"{{{labels}}}" if labels else ""
+            yield f"{self.name}_sum{suffix} {counts[-1]:.06f}\n"
+            yield f"{self.name}_count{suffix} {cumulative:.0f}\n"
+
+    def merge_sample(self, current: SampleValue | None, other: SampleValue) -> SampleValue:
+        assert isinstance(other, list) and not isinstance(current, float | int)
+        return list(other) if current is None else [a + b for a, b in zip(current, other)]
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.metrics: dict[str, Metric] = {}
+        self.collectors: list[Callable[[], None]] = []
+
+    def register(self, metric: MetricT) -> MetricT:
+        assert metric.name not in self.metrics, f"Metric {metric.name} is already registered"
+        self.metrics[metric.name] = metric
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """
+        Registers a function that updates metrics (usually gauges) right before they are read.
+        """
+        self.collectors.append(collector)
+
+    def collect(self) -> None:
+        for collector in self.collectors:
+            collector()
+
+    def snapshot(self) -> dict[str, list[tuple[LabelValues, SampleValue]]]:
+        self.collect()
+        return {
+            name: [
+                (label_values, list(value) if isinstance(value, list) else value)
+                for label_values, value in metric.values.items()
+            ]
+            for name, metric in self.metrics.items()
+        }
+
+    def merge(
+        self, snapshots: Iterable[Mapping[str, Iterable[tuple[LabelValues, SampleValue]]]]
+    ) -> dict[str, dict[LabelValues, SampleValue]]:
+        merged: dict[str, dict[LabelValues, SampleValue]] = {name: {} for name in self.metrics}
+        for snapshot in snapshots:
+            for name, samples in snapshot.items():
+                if (metric := self.metrics.get(name)) is None:
+                    continue
+
+                merged_samples = merged[name]
+                for label_values, value in samples:
+                    merged_samples[label_values] = metric.merge_sample(
+                        merged_samples.get(label_values), value
+                    )
+        return merged
+
+    def render(self, samples_per_metric: Mapping[str, Samples] | None = None) -> str:
+        if samples_per_metric is None:
+            self.collect()
+
+        chunks: list[str] = []
+        for name, metric in self.metrics.items():
+            samples = metric.values if samples_per_metric is None else samples_per_metric[name]
+            chunks.extend(metric.render(samples))
+        return "".join(chunks)
+
+
+RouteKey = tuple[str, str]
+route_keys: dict[RouteKey, RouteKey] = {}
+route_keys_with_status: dict[tuple[RouteKey, int], LabelValues] = {}
+
+
+def get_route_key(request: Request) -> RouteKey:
+    """
+    Returns the `(route template, method)` label values of a request, interned so that every
+    request to the same route shares the same tuple.
+    """
+    key = (get_route_path(request), request.method)
+    return route_keys.setdefault(key, key)
+
+
+def get_route_key_with_status(route_key: RouteKey, status_code: int) -> LabelValues:
+    if (label_values := route_keys_with_status.get((route_key, status_code))) is None:
+        label_values = route_keys_with_status[(route_key, status_code)] = (
+            *route_key,
+            str(status_code),
+        )
+    return label_values
+
+
+registry = MetricsRegistry()
+
+REQUEST_COUNT = registry.register(
+    Counter("bracket_request_count", "Requests count per endpoint", ("url", "method"))
+)
+RESPONSE_TIME = registry.register(
+    Histogram(
+        "bracket_response_time_seconds",
+        "Response time per endpoint and status code",
+        ("url", "method", "status"),
+        buckets=config.response_time_buckets,
+    )
+)
+VERSION = registry.register(
+    Gauge("bracket_version", "Always 1 while Bracket is running", multiprocess_mode="max")
+)
+VERSION.set(1.0)
+
+COMPUTE_QUEUE_DEPTH = registry.register(
+    Gauge(
+        "bracket_compute_queue_depth",
+        "Number of CPU-bound tasks currently queued or running in a worker pool",
+    )
+)
+COMPUTE_CALLS = registry.register(
+    Counter(
+        "bracket_compute_calls",
+        "CPU-bound function calls per function and executor",
+        ("function", "executor"),
+    )
+)
+COMPUTE_EXECUTION_SECONDS = registry.register(
+    Counter(
+        "bracket_compute_execution_seconds",
+        "Total execution time of CPU-bound function calls per function",
+        ("function",),
+    )
+)
+COMPUTE_WAIT_SECONDS = registry.register(
+    Counter(
+        "bracket_compute_wait_seconds",
+        "Total time CPU-bound function calls waited for a worker per function",
+        ("function",),
+    )
+)
+
+DB_QUERY_SECONDS = registry.register(
+    Histogram(
+        "bracket_db_query_seconds",
+        "Database query time per function that issued the query",
+        ("query",),
+        buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+    )
+)
+DB_QUERY_ROWS = registry.register(
+    Counter(
+        "bracket_db_query_rows",
+        "Rows returned or written per function that issued the query",
+        ("query",),
+    )
+)
+DB_QUERIES_PER_REQUEST = registry.register(
+    Histogram(
+        "bracket_db_queries_per_request",
+        "Number of database queries per request per endpoint",
+        ("url", "method"),
+        buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+    )
+)
+DB_QUERY_PLANNING_SECONDS = registry.register(
+    Histogram(
+        "bracket_db_query_planning_seconds",
+        "Planning time of hot queries per query, sampled with EXPLAIN (SUMMARY)",
+        ("query",),
+        buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+    )
+)
+
+DB_POOL_SIZE = registry.register(
+    Gauge("bracket_db_pool_size", "Number of open connections in the database pool", ("pool",))
+)
+DB_POOL_IDLE = registry.register(
+    Gauge("bracket_db_pool_idle", "Number of idle connections in the database pool", ("pool",))
+)
+DB_POOL_IN_USE = registry.register(
+    Gauge(
+        "bracket_db_pool_in_use",
+        "Number of connections in use from the database pool",
+        ("pool",),
+    )
+)
+DB_POOL_MAX_SIZE = registry.register(
+    Gauge(
+        "bracket_db_pool_max_size",
+        "Maximum number of connections in the database pool",
+        ("pool",),
+    )
+)
+DB_POOL_WAITING = registry.register(
+    Gauge(
+        "bracket_db_pool_waiting",
+        "Number of tasks waiting to acquire a database connection",
+        ("pool",),
+    )
+)
+DB_POOL_ACQUIRE_SECONDS = registry.register(
+    Histogram(
+        "bracket_db_pool_acquire_seconds",
+        "Time spent waiting to acquire a connection from the database pool",
+        ("pool",),
+        buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    )
+)
+DB_POOL_ACQUIRE_TIMEOUTS = registry.register(
+    Counter(
+        "bracket_db_pool_acquire_timeouts",
+        "Number of times acquiring a database connection timed out",
+        ("pool",),
+    )
+)
+
+EVENT_LOOP_LAG = registry.register(
+    Histogram(
+        "bracket_event_loop_lag_seconds",
+        "Delay between when the event loop monitor should wake up and when it did",
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    )
+)
+EVENT_LOOP_BLOCKED = registry.register(
+    Counter(
+        "bracket_event_loop_blocked",
+        "Times the event loop was blocked longer than the threshold per active route",
+        ("url",),
+    )
+)
 
+DEMO_PURGE_ROWS = registry.register(
+    Counter(
+        "bracket_demo_purge_rows",
+        "Rows deleted by the expired demo account purge per table",
+        ("table",),
+    )
+)
+DEMO_PURGE_SECONDS = registry.register(
+    Histogram(
+        "bracket_demo_purge_seconds",
+        "Duration of the runs of the expired demo account purge",
+        buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+    )
+)
 
-@cache
-def get_request_metrics() -> RequestMetrics:
-    return RequestMetrics()
+CRONJOB_LEADER = registry.register(
+    Gauge("bracket_cronjob_leader", "1 while this worker is the one that runs the cronjobs")
+)
+CRONJOB_LAST_RUN = registry.register(
+    Gauge(
+        "bracket_cronjob_last_run_timestamp_seconds",
+        "Unix time at which each cronjob last finished",
+        ("job",),
+        multiprocess_mode="max",
+    )
+)
+CRONJOB_DURATION_SECONDS = registry.register(
+    Histogram(
+        "bracket_cronjob_duration_seconds",
+        "Duration of the runs of each cronjob",
+        ("job",),
+        buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+    )
+)
+CRONJOB_FAILURES = registry.register(
+    Counter("bracket_cronjob_failures", "Runs of each cronjob that raised an exception", ("job",))
+)
@@ -9,7 +9,7 @@ from pydantic import BaseModel
 from starlette.requests import Request
 
 from bracket.config import config
-from bracket.database import database
+from bracket.database import database, read_from_primary
 from bracket.models.db.tournament import Tournament
 from bracket.models.db.user import UserInDB, UserPublic
 from bracket.schema import tournaments
@@ -18,9 +18,10 @@ from bracket.sql.users import get_user, get_user_access_to_club, get_user_access
 from bracket.utils.db import fetch_all_parsed
 from bracket.utils.id_types import ClubId, TournamentId, UserId
 from bracket.utils.security import verify_password
+from bracket.utils.tracing import TracedAPIRoute, traced
 from bracket.utils.types import assert_some
 
-router = APIRouter()
+router = APIRouter(route_class=TracedAPIRoute)
 
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 7 * 24 * 60  # 1 week
@@ -69,6 +70,7 @@ def create_access_token(data: dict[str, Any], expires_delta: timedelta) -> str:
     return jwt.encode(to_encode, config.jwt_secret, algorithm=ALGORITHM)
 
 
+@traced("auth")
 async def check_jwt_and_get_user(token: str) -> UserPublic | None:
     try:
         payload = jwt.decode(token, config.jwt_secret, algorithms=[ALGORITHM])
@@ -98,6 +100,18 @@ async def user_authenticated(token: str = Depends(oauth2_scheme)) -> UserPublic:
     return UserPublic.model_validate(user.model_dump())
 
 
+async def user_authenticated_admin(
+    user: UserPublic = Depends(user_authenticated),
+) -> UserPublic:
+    if config.admin_email is None or user.email != config.admin_email:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only the admin user can access this endpoint",
+        )
+
+    return user
+
+
 async def user_authenticated_for_tournament(
     tournament_id: TournamentId, token: str = Depends(oauth2_scheme)
 ) -> UserPublic:
@@ -139,9 +153,10 @@ async def user_authenticated_or_public_dashboard(
     except HTTPException:
         pass
 
-    tournaments_fetched = await fetch_all_parsed(
-        database, Tournament, tournaments.select().where(tournaments.c.id == tournament_id)
-    )
+    with read_from_primary():
+        tournaments_fetched = await fetch_all_parsed(
+            database, Tournament, tournaments.select().where(tournaments.c.id == tournament_id)
+        )
     if len(tournaments_fetched) < 1:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -156,7 +171,9 @@ async def user_authenticated_or_public_dashboard_by_endpoint_name(
     token: str = Depends(oauth2_scheme), endpoint_name: str | None = None
 ) -> UserPublic | None:
     if endpoint_name is not None:
-        if await sql_get_tournament_by_endpoint_name(endpoint_name) is None:
+        with read_from_primary():
+            tournament = await sql_get_tournament_by_endpoint_name(endpoint_name)
+        if tournament is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate credentials",
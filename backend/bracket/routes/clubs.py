@@ -6,10 +6,12 @@ from bracket.models.db.user import UserPublic
 from bracket.routes.auth import user_authenticated, user_authenticated_for_club
 from bracket.routes.models import ClubResponse, ClubsResponse, SuccessResponse
 from bracket.sql.clubs import create_club, get_clubs_for_user_id, sql_delete_club, sql_update_club
+from bracket.sql.quotas import sql_count_clubs_of_user
 from bracket.utils.errors import ForeignKey, check_foreign_key_violation
 from bracket.utils.id_types import ClubId
+from bracket.utils.tracing import TracedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TracedAPIRoute)
 
 
 @router.get("/clubs", response_model=ClubsResponse)
@@ -21,7 +23,7 @@ async def get_clubs(user: UserPublic = Depends(user_authenticated)) -> ClubsResp
 async def create_new_club(
     club: ClubCreateBody, user: UserPublic = Depends(user_authenticated)
 ) -> ClubResponse:
-    existing_clubs = await get_clubs_for_user_id(user.id)
+    existing_clubs = await sql_count_clubs_of_user(user.id)
     check_requirement(existing_clubs, user, "max_clubs")
     return ClubResponse(data=await create_club(club, user.id))
 
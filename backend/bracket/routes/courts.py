@@ -3,7 +3,7 @@ from heliclockter import datetime_utc
 from starlette import status
 
 from bracket.database import database
-from bracket.logic.subscriptions import check_requirement
+from bracket.logic.subscriptions import check_tournament_quota
 from bracket.models.db.court import Court, CourtBody, CourtToInsert
 from bracket.models.db.tournament import Tournament
 from bracket.models.db.user import UserPublic
@@ -12,18 +12,23 @@ from bracket.routes.auth import (
     user_authenticated_or_public_dashboard,
 )
 from bracket.routes.models import CourtsResponse, SingleCourtResponse, SuccessResponse
-from bracket.routes.util import disallow_archived_tournament
+from bracket.routes.util import disallow_archived_tournament, read_replica_dependency
 from bracket.schema import courts
 from bracket.sql.courts import get_all_courts_in_tournament, sql_delete_court, update_court
 from bracket.sql.stages import get_full_tournament_details
 from bracket.utils.db import fetch_one_parsed
 from bracket.utils.id_types import CourtId, TournamentId
+from bracket.utils.tracing import TracedAPIRoute
 from bracket.utils.types import assert_some
 
-router = APIRouter()
+router = APIRouter(route_class=TracedAPIRoute)
 
 
-@router.get("/tournaments/{tournament_id}/courts", response_model=CourtsResponse)
+@router.get(
+    "/tournaments/{tournament_id}/courts",
+    response_model=CourtsResponse,
+    dependencies=[Depends(read_replica_dependency)],
+)
 async def get_courts(
     tournament_id: TournamentId,
     _: UserPublic = Depends(user_authenticated_or_public_dashboard),
@@ -90,8 +95,7 @@ async def create_court(
     user: UserPublic = Depends(user_authenticated_for_tournament),
     _: Tournament = Depends(disallow_archived_tournament),
 ) -> SingleCourtResponse:
-    existing_courts = await get_all_courts_in_tournament(tournament_id)
-    check_requirement(existing_courts, user, "max_courts")
+    await check_tournament_quota(tournament_id, user, "max_courts")
 
     last_record_id = await database.execute(
         query=courts.insert(),
@@ -107,7 +111,7 @@ async def create_court(
                 database,
                 Court,
                 courts.select().where(
-                    courts.c.id == last_record_id and courts.c.tournament_id == tournament_id
+                    (courts.c.id == last_record_id) & (courts.c.tournament_id == tournament_id)
                 ),
             )
         )
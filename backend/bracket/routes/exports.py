@@ -0,0 +1,110 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime
+from enum import auto
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query
+from starlette.responses import StreamingResponse
+
+from bracket.models.db.user import UserPublic
+from bracket.routes.auth import user_authenticated_or_public_dashboard
+from bracket.routes.util import read_replica_dependency
+from bracket.sql.exports import (
+    iterate_matches_export,
+    iterate_schedule_export,
+    iterate_standings_export,
+)
+from bracket.utils.id_types import TournamentId
+from bracket.utils.tracing import TracedAPIRoute
+from bracket.utils.types import EnumAutoStr
+
+router = APIRouter(route_class=TracedAPIRoute)
+
+EXPORT_CHUNK_ROWS = 500
+
+
+class ExportType(EnumAutoStr):
+    matches = auto()
+    standings = auto()
+    schedule = auto()
+
+
+class ExportFormat(EnumAutoStr):
+    csv = auto()
+    ndjson = auto()
+
+
+export_lookup: dict[ExportType, Callable[[TournamentId], AsyncIterator[dict[str, Any]]]] = {
+    ExportType.matches: iterate_matches_export,
+    ExportType.standings: iterate_standings_export,
+    ExportType.schedule: iterate_schedule_export,
+}
+
+media_types = {
+    ExportFormat.csv: "text/csv",
+    ExportFormat.ndjson: "application/x-ndjson",
+}
+
+
+def serialize_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+async def stream_csv(rows: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer: csv.DictWriter[str] | None = None
+    row_count = 0
+
+    async for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(row.keys()))
+            writer.writeheader()
+
+        writer.writerow({key: serialize_value(value) for key, value in row.items()})
+        row_count += 1
+        if row_count % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
+
+
+async def stream_ndjson(rows: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    lines: list[str] = []
+    async for row in rows:
+        lines.append(json.dumps(row, default=serialize_value) + "\n")
+        if len(lines) >= EXPORT_CHUNK_ROWS:
+            yield "".join(lines)
+            lines = []
+
+    yield "".join(lines)
+
+
+@router.get(
+    "/tournaments/{tournament_id}/exports/{export_type}",
+    response_class=StreamingResponse,
+    dependencies=[Depends(read_replica_dependency)],
+)
+async def export_tournament_data(
+    tournament_id: TournamentId,
+    export_type: ExportType,
+    export_format: ExportFormat = Query(ExportFormat.csv, alias="format"),
+    _: UserPublic = Depends(user_authenticated_or_public_dashboard),
+) -> StreamingResponse:
+    """
+    Streams all matches (with results), the standings per stage item or the schedule of a
+    tournament as CSV or newline-delimited JSON. Rows are read from a server-side cursor, so
+    memory usage doesn't grow with the size of the tournament.
+    """
+    rows = export_lookup[export_type](tournament_id)
+    content = stream_csv(rows) if export_format is ExportFormat.csv else stream_ndjson(rows)
+    filename = f"tournament-{tournament_id}-{export_type.value}.{export_format.value}"
+    return StreamingResponse(
+        content,
+        media_type=media_types[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
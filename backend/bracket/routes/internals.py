@@ -1,14 +1,62 @@
-from fastapi import APIRouter
-from fastapi.responses import PlainTextResponse
+import asyncio
+import threading
+from enum import auto
 
-from bracket.models.metrics import get_request_metrics
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import JSONResponse, PlainTextResponse
+from starlette import status
+from starlette.responses import Response
 
-router = APIRouter()
+from bracket.models.db.user import UserPublic
+from bracket.routes.auth import user_authenticated_admin
+from bracket.utils.metrics_multiprocess import render_metrics
+from bracket.utils.profiling import SamplingProfiler
+from bracket.utils.tracing import TracedAPIRoute
+from bracket.utils.types import EnumAutoStr
+
+router = APIRouter(route_class=TracedAPIRoute)
+
+profiling_lock = asyncio.Lock()
+
+
+class ProfileFormat(EnumAutoStr):
+    collapsed = auto()
+    speedscope = auto()
 
 
 @router.get("/metrics", response_class=PlainTextResponse)
 async def get_metrics() -> PlainTextResponse:
-    return PlainTextResponse(get_request_metrics().to_prometheus())
+    return PlainTextResponse(await render_metrics())
+
+
+@router.get("/profile", summary="Sample the stacks of this worker process")
+async def get_profile(
+    _: UserPublic = Depends(user_authenticated_admin),
+    seconds: float = Query(10, gt=0, le=60),
+    interval_ms: float = Query(5, ge=1, le=100),
+    profile_format: ProfileFormat = Query(ProfileFormat.collapsed, alias="format"),
+    all_threads: bool = False,
+) -> Response:
+    """
+    Samples the event loop thread (or all threads) of the worker that handles this request for
+    `seconds` and returns the profile in the collapsed stack or speedscope format.
+    """
+    if profiling_lock.locked():
+        raise HTTPException(status.HTTP_409_CONFLICT, "A profiling session is already running")
+
+    async with profiling_lock:
+        thread_ids = (
+            [thread.ident for thread in threading.enumerate() if thread.ident is not None]
+            if all_threads
+            else [threading.get_ident()]
+        )
+        profiler = SamplingProfiler(thread_ids, interval_ms / 1000)
+        await asyncio.to_thread(profiler.run, seconds)
+
+    if profile_format is ProfileFormat.speedscope:
+        return JSONResponse(profiler.to_speedscope())
+
+    return PlainTextResponse(profiler.to_collapsed())
 
 
 @router.get("/ping", summary="Healthcheck ping")
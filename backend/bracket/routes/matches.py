@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from starlette import status
 
 from bracket.logic.planning.conflicts import handle_conflicts
@@ -38,9 +38,10 @@ from bracket.sql.stages import get_full_tournament_details
 from bracket.sql.tournaments import sql_get_tournament
 from bracket.sql.validation import check_foreign_keys_belong_to_tournament
 from bracket.utils.id_types import MatchId, StageItemId, TournamentId
+from bracket.utils.tracing import TracedAPIRoute
 from bracket.utils.types import assert_some
 
-router = APIRouter()
+router = APIRouter(route_class=TracedAPIRoute)
 
 
 @router.get(
@@ -52,6 +53,7 @@ async def get_matches_to_schedule(
     stage_item_id: StageItemId,
     elo_diff_threshold: int = 200,
     iterations: int = 2_000,
+    restarts: int = Query(0, ge=0, le=1_000),
     only_recommended: bool = False,
     limit: int = 50,
     _: UserPublic = Depends(user_authenticated_for_tournament),
@@ -61,6 +63,7 @@ async def get_matches_to_schedule(
         only_recommended=only_recommended,
         limit=limit,
         iterations=iterations,
+        restarts=restarts,
     )
 
     draft_round, stage_item = await get_draft_round_in_stage_item(tournament_id, stage_item_id)
@@ -69,7 +72,7 @@ async def get_matches_to_schedule(
         return UpcomingMatchesResponse(data=[])
 
     return UpcomingMatchesResponse(
-        data=get_upcoming_matches_for_swiss(match_filter, stage_item, draft_round)
+        data=await get_upcoming_matches_for_swiss(match_filter, stage_item, draft_round)
     )
 
 
@@ -47,8 +47,9 @@ class TournamentsResponse(DataResponse[list[Tournament]]):
 
 
 class PaginatedPlayers(BaseModel):
-    count: int
+    count: int | None
     players: list[Player]
+    next_cursor: str | None = None
 
 
 class PlayersResponse(DataResponse[PaginatedPlayers]):
@@ -72,8 +73,9 @@ class SingleMatchResponse(DataResponse[Match]):
 
 
 class PaginatedTeams(BaseModel):
-    count: int
+    count: int | None
     teams: list[FullTeamWithPlayers]
+    next_cursor: str | None = None
 
 
 class TeamsWithPlayersResponse(DataResponse[PaginatedTeams]):
@@ -1,7 +1,17 @@
-from fastapi import APIRouter, Depends
+from collections.abc import AsyncIterable
+
+from fastapi import APIRouter, Depends, Form, UploadFile
 
 from bracket.database import database
-from bracket.logic.subscriptions import check_requirement
+from bracket.logic.bulk_import import (
+    ImportRowError,
+    iter_batches,
+    iter_text_lines,
+    iter_upload_lines,
+    parse_player_row,
+    raise_for_row_errors,
+)
+from bracket.logic.subscriptions import check_tournament_quota
 from bracket.models.db.player import Player, PlayerBody, PlayerMultiBody
 from bracket.models.db.tournament import Tournament
 from bracket.models.db.user import UserPublic
@@ -14,6 +24,7 @@ from bracket.routes.models import (
 )
 from bracket.routes.util import disallow_archived_tournament
 from bracket.schema import players
+from bracket.sql.bulk_import import sql_import_players
 from bracket.sql.players import (
     get_all_players_in_tournament,
     get_player_count,
@@ -22,10 +33,11 @@ from bracket.sql.players import (
 )
 from bracket.utils.db import fetch_one_parsed
 from bracket.utils.id_types import PlayerId, TournamentId
-from bracket.utils.pagination import PaginationPlayers
+from bracket.utils.pagination import PaginationPlayers, get_next_cursor
+from bracket.utils.tracing import TracedAPIRoute
 from bracket.utils.types import assert_some
 
-router = APIRouter()
+router = APIRouter(route_class=TracedAPIRoute)
 
 
 @router.get("/tournaments/{tournament_id}/players", response_model=PlayersResponse)
@@ -35,12 +47,19 @@ async def get_players(
     pagination: PaginationPlayers = Depends(),
     _: UserPublic = Depends(user_authenticated_for_tournament),
 ) -> PlayersResponse:
+    players_ = await get_all_players_in_tournament(
+        tournament_id, not_in_team=not_in_team, pagination=pagination
+    )
+    count = (
+        await get_player_count(tournament_id, not_in_team=not_in_team)
+        if pagination.include_count
+        else None
+    )
     return PlayersResponse(
         data=PaginatedPlayers(
-            players=await get_all_players_in_tournament(
-                tournament_id, not_in_team=not_in_team, pagination=pagination
-            ),
-            count=await get_player_count(tournament_id, not_in_team=not_in_team),
+            players=players_,
+            count=count,
+            next_cursor=get_next_cursor(pagination, players_),
         )
     )
 
@@ -90,12 +109,27 @@ async def create_single_player(
     user: UserPublic = Depends(user_authenticated_for_tournament),
     _: Tournament = Depends(disallow_archived_tournament),
 ) -> SuccessResponse:
-    existing_players = await get_all_players_in_tournament(tournament_id)
-    check_requirement(existing_players, user, "max_players")
+    await check_tournament_quota(tournament_id, user, "max_players")
     await insert_player(player_body, tournament_id)
     return SuccessResponse()
 
 
+async def import_players(
+    tournament_id: TournamentId, lines: AsyncIterable[str], active: bool, user: UserPublic
+) -> None:
+    """
+    Writes the players batch by batch in a single transaction. The quota is checked after every
+    batch, so that an import that exceeds it is rolled back without reading the rest.
+    """
+    row_errors: list[ImportRowError] = []
+    async with database.transaction():
+        async for player_names in iter_batches(lines, parse_player_row, row_errors):
+            await sql_import_players(tournament_id, player_names, active)
+            await check_tournament_quota(tournament_id, user, "max_players", additions=0)
+
+        raise_for_row_errors(row_errors)
+
+
 @router.post("/tournaments/{tournament_id}/players_multi", response_model=SuccessResponse)
 async def create_multiple_players(
     player_body: PlayerMultiBody,
@@ -103,11 +137,23 @@ async def create_multiple_players(
     user: UserPublic = Depends(user_authenticated_for_tournament),
     _: Tournament = Depends(disallow_archived_tournament),
 ) -> SuccessResponse:
-    player_names = [player.strip() for player in player_body.names.split("\n") if len(player) > 0]
-    existing_players = await get_all_players_in_tournament(tournament_id)
-    check_requirement(existing_players, user, "max_players", additions=len(player_names))
+    await import_players(
+        tournament_id, iter_text_lines(player_body.names), player_body.active, user
+    )
+    return SuccessResponse()
 
-    for player_name in player_names:
-        await insert_player(PlayerBody(name=player_name, active=player_body.active), tournament_id)
 
+@router.post("/tournaments/{tournament_id}/players_import", response_model=SuccessResponse)
+async def import_players_from_file(
+    tournament_id: TournamentId,
+    file: UploadFile,
+    active: bool = Form(),
+    user: UserPublic = Depends(user_authenticated_for_tournament),
+    _: Tournament = Depends(disallow_archived_tournament),
+) -> SuccessResponse:
+    """
+    Imports a file with a player name per line. Unlike `players_multi`, the file is read in
+    chunks, so large imports are not held in memory as a whole.
+    """
+    await import_players(tournament_id, iter_upload_lines(file), active, user)
     return SuccessResponse()
@@ -17,7 +17,7 @@ from bracket.routes.models import (
     RankingsResponse,
     SuccessResponse,
 )
-from bracket.routes.util import disallow_archived_tournament
+from bracket.routes.util import disallow_archived_tournament, read_replica_dependency
 from bracket.sql.rankings import (
     get_all_rankings_in_tournament,
     sql_create_ranking,
@@ -27,11 +27,15 @@ from bracket.sql.rankings import (
 from bracket.sql.stage_item_inputs import get_stage_item_input_ids_by_ranking_id
 from bracket.sql.stage_items import get_stage_item
 from bracket.utils.id_types import RankingId, TournamentId
+from bracket.utils.tracing import TracedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TracedAPIRoute)
 
 
-@router.get("/tournaments/{tournament_id}/rankings")
+@router.get(
+    "/tournaments/{tournament_id}/rankings",
+    dependencies=[Depends(read_replica_dependency)],
+)
 async def get_rankings(
     tournament_id: TournamentId,
     _: UserPublic = Depends(user_authenticated_or_public_dashboard),
@@ -81,7 +85,7 @@ async def create_ranking(
     _: Tournament = Depends(disallow_archived_tournament),
 ) -> SuccessResponse:
     existing_rankings = await get_all_rankings_in_tournament(tournament_id)
-    check_requirement(existing_rankings, user, "max_rankings")
+    check_requirement(len(existing_rankings), user, "max_rankings")
 
     highest_position = (
         max(x.position for x in existing_rankings) if len(existing_rankings) > 0 else -1
@@ -5,7 +5,7 @@ from bracket.database import database
 from bracket.logic.ranking.calculation import (
     recalculate_ranking_for_stage_item,
 )
-from bracket.logic.subscriptions import check_requirement
+from bracket.logic.subscriptions import check_tournament_quota
 from bracket.models.db.round import (
     Round,
     RoundCreateBody,
@@ -30,12 +30,12 @@ from bracket.sql.rounds import (
     sql_delete_round,
 )
 from bracket.sql.stage_items import get_stage_item
-from bracket.sql.stages import get_full_tournament_details
 from bracket.sql.validation import check_foreign_keys_belong_to_tournament
 from bracket.utils.id_types import RoundId, TournamentId
+from bracket.utils.tracing import TracedAPIRoute
 from tests.integration_tests.mocks import MOCK_NOW
 
-router = APIRouter()
+router = APIRouter(route_class=TracedAPIRoute)
 
 
 @router.delete("/tournaments/{tournament_id}/rounds/{round_id}", response_model=SuccessResponse)
@@ -65,14 +65,7 @@ async def create_round(
 ) -> SuccessResponse:
     await check_foreign_keys_belong_to_tournament(round_body, tournament_id)
 
-    stages = await get_full_tournament_details(tournament_id)
-    existing_rounds = [
-        round_
-        for stage in stages
-        for stage_item in stage.stage_items
-        for round_ in stage_item.rounds
-    ]
-    check_requirement(existing_rounds, user, "max_rounds")
+    await check_tournament_quota(tournament_id, user, "max_rounds")
 
     stage_item = await get_stage_item(tournament_id, stage_item_id=round_body.stage_item_id)
 
@@ -87,6 +80,7 @@ async def create_round(
             created=MOCK_NOW,
             is_draft=False,
             stage_item_id=round_body.stage_item_id,
+            tournament_id=tournament_id,
             name=await get_next_round_name(tournament_id, round_body.stage_item_id),
         ),
     )
@@ -107,14 +101,8 @@ async def update_round_by_id(
     query = """
         UPDATE rounds
         SET name = :name, is_draft = :is_draft
-        WHERE rounds.id IN (
-            SELECT rounds.id
-            FROM rounds
-            JOIN stage_items ON rounds.stage_item_id = stage_items.id
-            JOIN stages s on s.id = stage_items.stage_id
-            WHERE s.tournament_id = :tournament_id
-        )
-        AND rounds.id = :round_id
+        WHERE rounds.id = :round_id
+        AND rounds.tournament_id = :tournament_id
     """
     await database.execute(
         query=query,
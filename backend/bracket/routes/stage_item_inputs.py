@@ -26,8 +26,9 @@ from bracket.utils.errors import (
     check_unique_constraint_violation,
 )
 from bracket.utils.id_types import StageItemId, StageItemInputId, TournamentId
+from bracket.utils.tracing import TracedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TracedAPIRoute)
 
 
 async def validate_stage_item_update(
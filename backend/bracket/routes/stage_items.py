@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from heliclockter import datetime_utc
 from starlette import status
 
@@ -18,7 +18,7 @@ from bracket.logic.scheduling.builder import (
     build_matches_for_stage_item,
 )
 from bracket.logic.scheduling.upcoming_matches import get_upcoming_matches_for_swiss
-from bracket.logic.subscriptions import check_requirement
+from bracket.logic.subscriptions import check_tournament_quota
 from bracket.models.db.match import MatchCreateBody, MatchFilter, SuggestedMatch
 from bracket.models.db.round import RoundInsertable
 from bracket.models.db.stage_item import (
@@ -59,8 +59,9 @@ from bracket.utils.errors import (
     check_foreign_key_violation,
 )
 from bracket.utils.id_types import StageItemId, TournamentId
+from bracket.utils.tracing import TracedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TracedAPIRoute)
 
 
 @router.delete(
@@ -88,9 +89,7 @@ async def create_stage_item(
 ) -> SuccessResponse:
     await check_foreign_keys_belong_to_tournament(stage_body, tournament_id)
 
-    stages = await get_full_tournament_details(tournament_id)
-    existing_stage_items = [stage_item for stage in stages for stage_item in stage.stage_items]
-    check_requirement(existing_stage_items, user, "max_stage_items")
+    await check_tournament_quota(tournament_id, user, "max_stage_items")
 
     stage_item = await sql_create_stage_item_with_empty_inputs(tournament_id, stage_body)
     await build_matches_for_stage_item(stage_item, tournament_id)
@@ -141,6 +140,7 @@ async def start_next_round(
     user: UserPublic = Depends(user_authenticated_for_tournament),
     elo_diff_threshold: int = 200,
     iterations: int = 2_000,
+    restarts: int = Query(0, ge=0, le=1_000),
     only_recommended: bool = False,
     _: Tournament = Depends(disallow_archived_tournament),
 ) -> SuccessResponse:
@@ -156,28 +156,23 @@ async def start_next_round(
         only_recommended=only_recommended,
         limit=1,
         iterations=iterations,
+        restarts=restarts,
     )
-    all_matches_to_schedule = get_upcoming_matches_for_swiss(match_filter, stage_item)
+    all_matches_to_schedule = await get_upcoming_matches_for_swiss(match_filter, stage_item)
     if len(all_matches_to_schedule) < 1:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No more matches to schedule, all combinations of teams have been added already",
         )
 
-    stages = await get_full_tournament_details(tournament_id)
-    existing_rounds = [
-        round_
-        for stage in stages
-        for stage_item in stage.stage_items
-        for round_ in stage_item.rounds
-    ]
-    check_requirement(existing_rounds, user, "max_rounds")
+    await check_tournament_quota(tournament_id, user, "max_rounds")
 
     round_id = await sql_create_round(
         RoundInsertable(
             created=datetime_utc.now(),
             is_draft=True,
             stage_item_id=stage_item_id,
+            tournament_id=tournament_id,
             name=await get_next_round_name(tournament_id, stage_item_id),
         ),
     )
@@ -189,7 +184,7 @@ async def start_next_round(
     for ___ in range(limit):
         stage_item = await get_stage_item(tournament_id, stage_item_id)
         draft_round = next(round_ for round_ in stage_item.rounds if round_.is_draft)
-        all_matches_to_schedule = get_upcoming_matches_for_swiss(
+        all_matches_to_schedule = await get_upcoming_matches_for_swiss(
             match_filter, stage_item, draft_round
         )
         if len(all_matches_to_schedule) < 1:
@@ -8,7 +8,7 @@ from bracket.logic.scheduling.handle_stage_activation import (
     update_matches_in_activated_stage,
     update_matches_in_deactivated_stage,
 )
-from bracket.logic.subscriptions import check_requirement
+from bracket.logic.subscriptions import check_tournament_quota
 from bracket.models.db.stage import Stage, StageActivateBody, StageUpdateBody
 from bracket.models.db.tournament import Tournament
 from bracket.models.db.user import UserPublic
@@ -23,7 +23,11 @@ from bracket.routes.models import (
     StagesWithStageItemsResponse,
     SuccessResponse,
 )
-from bracket.routes.util import disallow_archived_tournament, stage_dependency
+from bracket.routes.util import (
+    disallow_archived_tournament,
+    read_replica_dependency,
+    stage_dependency,
+)
 from bracket.sql.stages import (
     get_full_tournament_details,
     get_next_stage_in_tournament,
@@ -32,12 +36,18 @@ from bracket.sql.stages import (
     sql_delete_stage,
 )
 from bracket.sql.teams import get_teams_with_members
+from bracket.utils.compute import run_cpu_bound
 from bracket.utils.id_types import StageId, TournamentId
+from bracket.utils.tracing import TracedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TracedAPIRoute)
 
 
-@router.get("/tournaments/{tournament_id}/stages", response_model=StagesWithStageItemsResponse)
+@router.get(
+    "/tournaments/{tournament_id}/stages",
+    response_model=StagesWithStageItemsResponse,
+    dependencies=[Depends(read_replica_dependency)],
+)
 async def get_stages(
     tournament_id: TournamentId,
     user: UserPublic = Depends(user_authenticated_or_public_dashboard),
@@ -84,8 +94,7 @@ async def create_stage(
     user: UserPublic = Depends(user_authenticated_for_tournament),
     _: Tournament = Depends(disallow_archived_tournament),
 ) -> SuccessResponse:
-    existing_stages = await get_full_tournament_details(tournament_id)
-    check_requirement(existing_stages, user, "max_stages")
+    await check_tournament_quota(tournament_id, user, "max_stages")
 
     await sql_create_stage(tournament_id)
     return SuccessResponse()
@@ -151,7 +160,14 @@ async def get_available_inputs(
 ) -> StageItemInputOptionsResponse:
     stages = await get_full_tournament_details(tournament_id)
     teams = await get_teams_with_members(tournament_id)
-    return StageItemInputOptionsResponse(data=determine_available_inputs(teams, stages))
+    stage_item_count = sum(len(stage.stage_items) for stage in stages)
+    available_inputs = await run_cpu_bound(
+        determine_available_inputs,
+        teams,
+        stages,
+        size=(len(teams) + stage_item_count) * max(stage_item_count, 1),
+    )
+    return StageItemInputOptionsResponse(data=available_inputs)
 
 
 @router.get("/tournaments/{tournament_id}/next_stage_rankings")
@@ -1,16 +1,23 @@
-import csv
 import os
+from collections.abc import AsyncIterable
 from uuid import uuid4
 
 import aiofiles
 import aiofiles.os
-from fastapi import APIRouter, Depends, UploadFile
+from fastapi import APIRouter, Depends, Form, UploadFile
 from heliclockter import datetime_utc
 
 from bracket.database import database
-from bracket.logic.subscriptions import check_requirement
+from bracket.logic.bulk_import import (
+    ImportRowError,
+    iter_batches,
+    iter_text_lines,
+    iter_upload_lines,
+    parse_team_row,
+    raise_for_row_errors,
+)
+from bracket.logic.subscriptions import check_tournament_quota
 from bracket.logic.teams import get_team_logo_path
-from bracket.models.db.player import PlayerBody
 from bracket.models.db.team import (
     FullTeamWithPlayers,
     Team,
@@ -32,11 +39,12 @@ from bracket.routes.models import (
 )
 from bracket.routes.util import (
     disallow_archived_tournament,
+    read_replica_dependency,
     team_dependency,
     team_with_players_dependency,
 )
 from bracket.schema import players_x_teams, teams
-from bracket.sql.players import get_all_players_in_tournament, insert_player
+from bracket.sql.bulk_import import sql_import_teams_with_players
 from bracket.sql.teams import (
     get_team_by_id,
     get_team_count,
@@ -48,10 +56,11 @@ from bracket.utils.db import fetch_one_parsed
 from bracket.utils.errors import ForeignKey, check_foreign_key_violation
 from bracket.utils.id_types import PlayerId, TeamId, TournamentId
 from bracket.utils.logging import logger
-from bracket.utils.pagination import PaginationTeams
+from bracket.utils.pagination import PaginationTeams, get_next_cursor
+from bracket.utils.tracing import TracedAPIRoute
 from bracket.utils.types import assert_some
 
-router = APIRouter()
+router = APIRouter(route_class=TracedAPIRoute)
 
 
 async def update_team_members(
@@ -76,16 +85,22 @@ async def update_team_members(
     )
 
 
-@router.get("/tournaments/{tournament_id}/teams", response_model=TeamsWithPlayersResponse)
+@router.get(
+    "/tournaments/{tournament_id}/teams",
+    response_model=TeamsWithPlayersResponse,
+    dependencies=[Depends(read_replica_dependency)],
+)
 async def get_teams(
     tournament_id: TournamentId,
     pagination: PaginationTeams = Depends(),
     _: UserPublic = Depends(user_authenticated_or_public_dashboard),
 ) -> TeamsWithPlayersResponse:
+    teams_ = await get_teams_with_members(tournament_id, pagination=pagination)
     return TeamsWithPlayersResponse(
         data=PaginatedTeams(
-            teams=await get_teams_with_members(tournament_id, pagination=pagination),
-            count=await get_team_count(tournament_id),
+            teams=teams_,
+            count=await get_team_count(tournament_id) if pagination.include_count else None,
+            next_cursor=get_next_cursor(pagination, teams_),
         )
     )
 
@@ -187,8 +202,7 @@ async def create_team(
 ) -> SingleTeamResponse:
     await check_foreign_keys_belong_to_tournament(team_to_insert, tournament_id)
 
-    existing_teams = await get_teams_with_members(tournament_id)
-    check_requirement(existing_teams, user, "max_teams")
+    await check_tournament_quota(tournament_id, user, "max_teams")
 
     last_record_id = await database.execute(
         query=teams.insert(),
@@ -205,6 +219,24 @@ async def create_team(
     return SingleTeamResponse(data=team_result)
 
 
+async def import_teams(
+    tournament_id: TournamentId, lines: AsyncIterable[str], active: bool, user: UserPublic
+) -> None:
+    """
+    Writes the teams and their players batch by batch in a single transaction. The quotas are
+    checked after every batch, so that an import that exceeds them is rolled back without reading
+    the rest.
+    """
+    row_errors: list[ImportRowError] = []
+    async with database.transaction():
+        async for imported_teams in iter_batches(lines, parse_team_row, row_errors):
+            await sql_import_teams_with_players(tournament_id, imported_teams, active)
+            await check_tournament_quota(tournament_id, user, "max_teams", additions=0)
+            await check_tournament_quota(tournament_id, user, "max_players", additions=0)
+
+        raise_for_row_errors(row_errors)
+
+
 @router.post("/tournaments/{tournament_id}/teams_multi", response_model=SuccessResponse)
 async def create_multiple_teams(
     team_body: TeamMultiBody,
@@ -212,33 +244,22 @@ async def create_multiple_teams(
     user: UserPublic = Depends(user_authenticated_for_tournament),
     _: Tournament = Depends(disallow_archived_tournament),
 ) -> SuccessResponse:
-    reader = list(csv.reader(team_body.names.split("\n"), delimiter=","))
-    teams_and_players = [
-        (row[0], [p for p in row[1:] if len(p) > 0] if len(row) > 1 else [])
-        for row in reader
-        if len(row) > 0
-    ]
-    players = [player for row in teams_and_players for player in row[1]]
-
-    existing_teams = await get_teams_with_members(tournament_id)
-    existing_players = await get_all_players_in_tournament(tournament_id)
-
-    check_requirement(existing_teams, user, "max_teams", additions=len(reader))
-    check_requirement(existing_players, user, "max_players", additions=len(players))
+    await import_teams(tournament_id, iter_text_lines(team_body.names), team_body.active, user)
+    return SuccessResponse()
 
-    async with database.transaction():
-        for team_name, players in teams_and_players:
-            await database.execute(
-                query=teams.insert(),
-                values=TeamInsertable(
-                    name=team_name,
-                    active=team_body.active,
-                    created=datetime_utc.now(),
-                    tournament_id=tournament_id,
-                ).model_dump(),
-            )
-            for player in players:
-                player_body = PlayerBody(name=player, active=team_body.active)
-                await insert_player(player_body, tournament_id)
 
+@router.post("/tournaments/{tournament_id}/teams_import", response_model=SuccessResponse)
+async def import_teams_from_file(
+    tournament_id: TournamentId,
+    file: UploadFile,
+    active: bool = Form(),
+    user: UserPublic = Depends(user_authenticated_for_tournament),
+    _: Tournament = Depends(disallow_archived_tournament),
+) -> SuccessResponse:
+    """
+    Imports a CSV file with a row per team: the team name followed by the names of its players.
+    Unlike `teams_multi`, the file is read in chunks, so large imports are not held in memory as a
+    whole.
+    """
+    await import_teams(tournament_id, iter_upload_lines(file), active, user)
     return SuccessResponse()
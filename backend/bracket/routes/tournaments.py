@@ -25,8 +25,9 @@ from bracket.routes.auth import (
     user_authenticated_or_public_dashboard_by_endpoint_name,
 )
 from bracket.routes.models import SuccessResponse, TournamentResponse, TournamentsResponse
-from bracket.routes.util import disallow_archived_tournament
+from bracket.routes.util import disallow_archived_tournament, read_replica_dependency
 from bracket.schema import tournaments
+from bracket.sql.quotas import sql_count_tournaments_in_club
 from bracket.sql.rankings import (
     get_all_rankings_in_tournament,
     sql_create_ranking,
@@ -50,8 +51,9 @@ from bracket.utils.errors import (
 )
 from bracket.utils.id_types import TournamentId
 from bracket.utils.logging import logger
+from bracket.utils.tracing import TracedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TracedAPIRoute)
 unauthorized_exception = HTTPException(
     status_code=status.HTTP_401_UNAUTHORIZED,
     detail="You don't have access to this tournament",
@@ -59,7 +61,11 @@ unauthorized_exception = HTTPException(
 )
 
 
-@router.get("/tournaments/{tournament_id}", response_model=TournamentResponse)
+@router.get(
+    "/tournaments/{tournament_id}",
+    response_model=TournamentResponse,
+    dependencies=[Depends(read_replica_dependency)],
+)
 async def get_tournament(
     tournament_id: TournamentId,
     user: UserPublic | None = Depends(user_authenticated_or_public_dashboard),
@@ -160,7 +166,7 @@ async def change_status(
 async def create_tournament(
     tournament_to_insert: TournamentBody, user: UserPublic = Depends(user_authenticated)
 ) -> SuccessResponse:
-    existing_tournaments = await sql_get_tournaments((tournament_to_insert.club_id,))
+    existing_tournaments = await sql_count_tournaments_in_club(tournament_to_insert.club_id)
     check_requirement(existing_tournaments, user, "max_tournaments")
 
     has_access_to_club = await get_user_access_to_club(tournament_to_insert.club_id, user.id)
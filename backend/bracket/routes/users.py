@@ -31,9 +31,10 @@ from bracket.sql.users import (
 )
 from bracket.utils.id_types import UserId
 from bracket.utils.security import hash_password, verify_captcha_token
+from bracket.utils.tracing import TracedAPIRoute
 from bracket.utils.types import assert_some
 
-router = APIRouter()
+router = APIRouter(route_class=TracedAPIRoute)
 
 
 @router.get("/users/me", response_model=UserPublicResponse)
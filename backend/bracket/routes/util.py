@@ -1,7 +1,7 @@
-from fastapi import HTTPException
+from fastapi import HTTPException, Request
 from starlette import status
 
-from bracket.database import database
+from bracket.database import READ_PRIMARY_COOKIE, database, use_read_replica
 from bracket.models.db.match import Match
 from bracket.models.db.round import Round
 from bracket.models.db.team import FullTeamWithPlayers, Team
@@ -17,11 +17,21 @@ from bracket.utils.db import fetch_one_parsed
 from bracket.utils.id_types import MatchId, RoundId, StageId, StageItemId, TeamId, TournamentId
 
 
+async def read_replica_dependency(request: Request) -> None:
+    """
+    Lets a read-only endpoint read from the replica, unless the client wrote something recently.
+    """
+    if READ_PRIMARY_COOKIE not in request.cookies:
+        use_read_replica.set(True)
+
+
 async def round_dependency(tournament_id: TournamentId, round_id: RoundId) -> Round:
     round_ = await fetch_one_parsed(
         database,
         Round,
-        rounds.select().where(rounds.c.id == round_id and matches.c.tournament_id == tournament_id),
+        rounds.select().where(
+            (rounds.c.id == round_id) & (rounds.c.tournament_id == tournament_id)
+        ),
     )
 
     if round_ is None:
@@ -64,7 +74,7 @@ async def match_dependency(tournament_id: TournamentId, match_id: MatchId) -> Ma
         database,
         Match,
         matches.select().where(
-            matches.c.id == match_id and matches.c.tournament_id == tournament_id
+            (matches.c.id == match_id) & (matches.c.tournament_id == tournament_id)
         ),
     )
 
@@ -81,7 +91,7 @@ async def team_dependency(tournament_id: TournamentId, team_id: TeamId) -> Team:
     team = await fetch_one_parsed(
         database,
         Team,
-        teams.select().where(teams.c.id == team_id and teams.c.tournament_id == tournament_id),
+        teams.select().where((teams.c.id == team_id) & (teams.c.tournament_id == tournament_id)),
     )
 
     if team is None:
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, Table, UniqueConstraint, func
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Table, UniqueConstraint, func
 from sqlalchemy.orm import declarative_base  # type: ignore[attr-defined]
 from sqlalchemy.sql.sqltypes import BigInteger, Boolean, DateTime, Enum, Float, Text
 
@@ -40,6 +40,7 @@ tournaments = Table(
         server_default="OPEN",
         index=True,
     ),
+    Index("ix_tournaments_id_club_id", "id", "club_id"),
 )
 
 stages = Table(
@@ -60,7 +61,7 @@ stage_items = Table(
     Column("created", DateTimeTZ, nullable=False, server_default=func.now()),
     Column("stage_id", BigInteger, ForeignKey("stages.id"), index=True, nullable=False),
     Column("team_count", Integer, nullable=False),
-    Column("ranking_id", BigInteger, ForeignKey("rankings.id"), nullable=False),
+    Column("ranking_id", BigInteger, ForeignKey("rankings.id"), index=True, nullable=False),
     Column(
         "type",
         Enum(
@@ -86,7 +87,7 @@ stage_item_inputs = Table(
         index=True,
         nullable=False,
     ),
-    Column("team_id", BigInteger, ForeignKey("teams.id"), nullable=True),
+    Column("team_id", BigInteger, ForeignKey("teams.id"), index=True, nullable=True),
     Column("winner_from_stage_item_id", BigInteger, ForeignKey("stage_items.id"), nullable=True),
     Column("winner_position", Integer, nullable=True),
     Column("points", Float, nullable=False, server_default="0"),
@@ -104,7 +105,8 @@ rounds = Table(
     Column("name", Text, nullable=False),
     Column("created", DateTimeTZ, nullable=False, server_default=func.now()),
     Column("is_draft", Boolean, nullable=False),
-    Column("stage_item_id", BigInteger, ForeignKey("stage_items.id"), nullable=False),
+    Column("stage_item_id", BigInteger, ForeignKey("stage_items.id"), index=True, nullable=False),
+    Column("tournament_id", BigInteger, ForeignKey("tournaments.id"), index=True, nullable=False),
 )
 
 
@@ -118,9 +120,22 @@ matches = Table(
     Column("margin_minutes", Integer, nullable=True),
     Column("custom_duration_minutes", Integer, nullable=True),
     Column("custom_margin_minutes", Integer, nullable=True),
-    Column("round_id", BigInteger, ForeignKey("rounds.id"), nullable=False),
-    Column("stage_item_input1_id", BigInteger, ForeignKey("stage_item_inputs.id"), nullable=True),
-    Column("stage_item_input2_id", BigInteger, ForeignKey("stage_item_inputs.id"), nullable=True),
+    Column("round_id", BigInteger, ForeignKey("rounds.id"), index=True, nullable=False),
+    Column("tournament_id", BigInteger, ForeignKey("tournaments.id"), index=True, nullable=False),
+    Column(
+        "stage_item_input1_id",
+        BigInteger,
+        ForeignKey("stage_item_inputs.id"),
+        index=True,
+        nullable=True,
+    ),
+    Column(
+        "stage_item_input2_id",
+        BigInteger,
+        ForeignKey("stage_item_inputs.id"),
+        index=True,
+        nullable=True,
+    ),
     Column("stage_item_input1_conflict", Boolean, nullable=False),
     Column("stage_item_input2_conflict", Boolean, nullable=False),
     Column(
@@ -135,7 +150,7 @@ matches = Table(
         ForeignKey("matches.id"),
         nullable=True,
     ),
-    Column("court_id", BigInteger, ForeignKey("courts.id"), nullable=True),
+    Column("court_id", BigInteger, ForeignKey("courts.id"), index=True, nullable=True),
     Column("stage_item_input1_score", Integer, nullable=False),
     Column("stage_item_input2_score", Integer, nullable=False),
     Column("position_in_schedule", Integer, nullable=True),
@@ -155,6 +170,7 @@ teams = Table(
     Column("draws", Integer, nullable=False, server_default="0"),
     Column("losses", Integer, nullable=False, server_default="0"),
     Column("logo_path", String, nullable=True),
+    Index("ix_teams_tournament_id_name_id", "tournament_id", "name", "id"),
 )
 
 players = Table(
@@ -170,6 +186,7 @@ players = Table(
     Column("draws", Integer, nullable=False),
     Column("losses", Integer, nullable=False),
     Column("active", Boolean, nullable=False, index=True, server_default="t"),
+    Index("ix_players_tournament_id_name_id", "tournament_id", "name", "id"),
 )
 
 users = Table(
@@ -207,14 +224,27 @@ users_x_clubs = Table(
         nullable=False,
         default="OWNER",
     ),
+    Index("ix_users_x_clubs_user_id_club_id", "user_id", "club_id"),
 )
 
 players_x_teams = Table(
     "players_x_teams",
     metadata,
     Column("id", BigInteger, primary_key=True, index=True),
-    Column("player_id", BigInteger, ForeignKey("players.id", ondelete="CASCADE"), nullable=False),
-    Column("team_id", BigInteger, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False),
+    Column(
+        "player_id",
+        BigInteger,
+        ForeignKey("players.id", ondelete="CASCADE"),
+        index=True,
+        nullable=False,
+    ),
+    Column(
+        "team_id",
+        BigInteger,
+        ForeignKey("teams.id", ondelete="CASCADE"),
+        index=True,
+        nullable=False,
+    ),
 )
 
 courts = Table(
@@ -0,0 +1,116 @@
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Table
+
+from bracket.database import database
+from bracket.logic.bulk_import import ImportedTeam
+from bracket.logic.ranking.statistics import START_ELO
+from bracket.schema import players, players_x_teams, teams
+from bracket.utils.id_types import TournamentId
+
+SQLITE_INSERT_BATCH_SIZE = 500
+
+
+async def reserve_ids(table: Table, count: int) -> list[int]:
+    if database.url.dialect == "sqlite":
+        # SQLite serializes write transactions, so nobody else can take these IDs in the meantime.
+        next_id: int = await database.fetch_val(
+            query=f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table.name}"
+        )
+        return list(range(next_id, next_id + count))
+
+    query = f"""
+        SELECT nextval(pg_get_serial_sequence('{table.name}', 'id')) AS id
+        FROM generate_series(1, :count)
+        """
+    result = await database.fetch_all(query=query, values={"count": count})
+    return [row.id for row in result]
+
+
+async def sql_bulk_insert(table: Table, records: Sequence[dict[str, Any]]) -> list[int]:
+    """
+    Inserts the records using `COPY` (or multi-row inserts on SQLite) and returns their IDs in the
+    same order. Should be called inside a transaction.
+    """
+    if len(records) < 1:
+        return []
+
+    ids = await reserve_ids(table, len(records))
+    rows = [{"id": id_, **record} for id_, record in zip(ids, records, strict=True)]
+
+    if database.url.dialect == "sqlite":
+        for i in range(0, len(rows), SQLITE_INSERT_BATCH_SIZE):
+            await database.execute(table.insert().values(rows[i : i + SQLITE_INSERT_BATCH_SIZE]))
+        return ids
+
+    columns = list(rows[0].keys())
+    await database.connection().raw_connection.copy_records_to_table(
+        table.name, records=[tuple(row.values()) for row in rows], columns=columns
+    )
+    return ids
+
+
+def get_player_record(name: str, active: bool, tournament_id: TournamentId) -> dict[str, Any]:
+    return {
+        "name": name,
+        "active": active,
+        "tournament_id": tournament_id,
+        "elo_score": float(START_ELO),
+        "swiss_score": 0.0,
+        "wins": 0,
+        "draws": 0,
+        "losses": 0,
+    }
+
+
+async def sql_import_players(
+    tournament_id: TournamentId, player_names: list[str], active: bool
+) -> None:
+    """
+    Should be called inside a transaction.
+    """
+    await sql_bulk_insert(
+        players, [get_player_record(name, active, tournament_id) for name in player_names]
+    )
+
+
+async def sql_import_teams_with_players(
+    tournament_id: TournamentId, imported_teams: list[ImportedTeam], active: bool
+) -> None:
+    """
+    Creates the teams, their players and the links between them. Should be called inside a
+    transaction.
+    """
+    team_ids = await sql_bulk_insert(
+        teams,
+        [
+            {
+                "name": team.name,
+                "active": active,
+                "tournament_id": tournament_id,
+                "elo_score": float(START_ELO),
+            }
+            for team in imported_teams
+        ],
+    )
+    player_ids = await sql_bulk_insert(
+        players,
+        [
+            get_player_record(name, active, tournament_id)
+            for team in imported_teams
+            for name in team.player_names
+        ],
+    )
+    player_team_ids = [
+        team_id
+        for team_id, team in zip(team_ids, imported_teams, strict=True)
+        for _ in team.player_names
+    ]
+    await sql_bulk_insert(
+        players_x_teams,
+        [
+            {"player_id": player_id, "team_id": team_id}
+            for player_id, team_id in zip(player_ids, player_team_ids, strict=True)
+        ],
+    )
@@ -1,4 +1,5 @@
 from bracket.database import database
+from bracket.logic.auth_cache import auth_cache
 from bracket.models.db.club import Club, ClubCreateBody, ClubUpdateBody
 from bracket.utils.id_types import ClubId, UserId
 from bracket.utils.types import assert_some
@@ -13,6 +14,7 @@ async def sql_give_user_access_to_club(user_id: UserId, club_id: ClubId) -> None
         query=query_many_to_many,
         values={"club_id": assert_some(club_id), "user_id": user_id},
     )
+    auth_cache.invalidate_user(user_id)
 
 
 async def create_club(club: ClubCreateBody, user_id: UserId) -> Club:
@@ -30,6 +32,8 @@ async def create_club(club: ClubCreateBody, user_id: UserId) -> Club:
 
         await sql_give_user_access_to_club(user_id, club_created.id)
 
+    # Invalidate again after the commit, the access sets may have been cached before it.
+    auth_cache.invalidate_user(user_id)
     return club_created
 
 
@@ -50,6 +54,7 @@ async def sql_delete_club(club_id: ClubId) -> None:
         WHERE id = :club_id
         """
     await database.execute(query=query, values={"club_id": club_id})
+    auth_cache.invalidate_access()
 
 
 async def get_clubs_for_user_id(user_id: UserId) -> list[Club]:
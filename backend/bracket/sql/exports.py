@@ -0,0 +1,94 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+from bracket.database import database
+from bracket.utils.id_types import TournamentId
+
+MATCHES_QUERY = """
+    SELECT
+        m.id AS match_id,
+        stages.name AS stage,
+        stage_items.name AS stage_item,
+        rounds.name AS round,
+        team1.name AS team1,
+        team2.name AS team2,
+        m.stage_item_input1_score AS team1_score,
+        m.stage_item_input2_score AS team2_score,
+        courts.name AS court,
+        m.start_time
+    FROM matches m
+    JOIN rounds ON rounds.id = m.round_id
+    JOIN stage_items ON stage_items.id = rounds.stage_item_id
+    JOIN stages ON stages.id = stage_items.stage_id
+    LEFT JOIN stage_item_inputs input1 ON input1.id = m.stage_item_input1_id
+    LEFT JOIN stage_item_inputs input2 ON input2.id = m.stage_item_input2_id
+    LEFT JOIN teams team1 ON team1.id = input1.team_id
+    LEFT JOIN teams team2 ON team2.id = input2.team_id
+    LEFT JOIN courts ON courts.id = m.court_id
+    WHERE m.tournament_id = :tournament_id
+    AND NOT rounds.is_draft
+    ORDER BY m.id
+    """
+
+STANDINGS_QUERY = """
+    SELECT
+        stages.name AS stage,
+        stage_items.name AS stage_item,
+        RANK() OVER (
+            PARTITION BY stage_items.id ORDER BY stage_item_inputs.points DESC
+        ) AS position,
+        teams.name AS team,
+        stage_item_inputs.points,
+        stage_item_inputs.wins,
+        stage_item_inputs.draws,
+        stage_item_inputs.losses
+    FROM stage_item_inputs
+    JOIN stage_items ON stage_items.id = stage_item_inputs.stage_item_id
+    JOIN stages ON stages.id = stage_items.stage_id
+    LEFT JOIN teams ON teams.id = stage_item_inputs.team_id
+    WHERE stage_item_inputs.tournament_id = :tournament_id
+    ORDER BY stages.id, stage_items.id, position, stage_item_inputs.slot
+    """
+
+SCHEDULE_QUERY = """
+    SELECT
+        m.id AS match_id,
+        m.start_time,
+        COALESCE(m.custom_duration_minutes, m.duration_minutes) AS duration_minutes,
+        courts.name AS court,
+        m.position_in_schedule,
+        stages.name AS stage,
+        stage_items.name AS stage_item,
+        rounds.name AS round,
+        team1.name AS team1,
+        team2.name AS team2
+    FROM matches m
+    JOIN rounds ON rounds.id = m.round_id
+    JOIN stage_items ON stage_items.id = rounds.stage_item_id
+    JOIN stages ON stages.id = stage_items.stage_id
+    LEFT JOIN stage_item_inputs input1 ON input1.id = m.stage_item_input1_id
+    LEFT JOIN stage_item_inputs input2 ON input2.id = m.stage_item_input2_id
+    LEFT JOIN teams team1 ON team1.id = input1.team_id
+    LEFT JOIN teams team2 ON team2.id = input2.team_id
+    LEFT JOIN courts ON courts.id = m.court_id
+    WHERE m.tournament_id = :tournament_id
+    ORDER BY m.start_time NULLS LAST, courts.name, m.position_in_schedule, m.id
+    """
+
+
+async def iterate_matches_export(tournament_id: TournamentId) -> AsyncIterator[dict[str, Any]]:
+    values = {"tournament_id": tournament_id}
+    async for row in database.iterate(query=MATCHES_QUERY, values=values):
+        yield dict(row._mapping)
+
+
+async def iterate_standings_export(tournament_id: TournamentId) -> AsyncIterator[dict[str, Any]]:
+    values = {"tournament_id": tournament_id}
+    async for row in database.iterate(query=STANDINGS_QUERY, values=values):
+        yield dict(row._mapping)
+
+
+async def iterate_schedule_export(tournament_id: TournamentId) -> AsyncIterator[dict[str, Any]]:
+    values = {"tournament_id": tournament_id}
+    async for row in database.iterate(query=SCHEDULE_QUERY, values=values):
+        yield dict(row._mapping)
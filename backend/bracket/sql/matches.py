@@ -2,7 +2,7 @@ from datetime import datetime
 
 from heliclockter import datetime_utc
 
-from bracket.database import database
+from bracket.database import PreparedQuery, database
 from bracket.models.db.match import Match, MatchBody, MatchCreateBody
 from bracket.models.db.tournament import Tournament
 from bracket.utils.id_types import (
@@ -40,6 +40,7 @@ async def sql_create_match(match: MatchCreateBody) -> Match:
     query = """
         INSERT INTO matches (
             round_id,
+            tournament_id,
             court_id,
             stage_item_input1_id,
             stage_item_input2_id,
@@ -57,6 +58,7 @@ async def sql_create_match(match: MatchCreateBody) -> Match:
         )
         VALUES (
             :round_id,
+            (SELECT tournament_id FROM rounds WHERE rounds.id = :round_id),
             :court_id,
             :stage_item_input1_id,
             :stage_item_input2_id,
@@ -151,7 +153,7 @@ async def sql_reschedule_match(
     stage_item_input1_conflict: bool,
     stage_item_input2_conflict: bool,
 ) -> None:
-    query = """
+    query = PreparedQuery("""
         UPDATE matches
         SET court_id = :court_id,
             start_time = :start_time,
@@ -163,7 +165,7 @@ async def sql_reschedule_match(
             stage_item_input1_conflict = :stage_item_input1_conflict,
             stage_item_input2_conflict = :stage_item_input2_conflict
         WHERE matches.id = :match_id
-        """
+        """)
     await database.execute(
         query=query,
         values={
@@ -234,11 +236,9 @@ async def clear_scores_for_matches_in_stage_item(
         SET stage_item_input1_score = 0,
             stage_item_input2_score = 0
         FROM rounds
-        JOIN stage_items ON rounds.stage_item_id = stage_items.id
-        JOIN stages ON stages.id = stage_items.stage_id
         WHERE   rounds.id = matches.round_id
-            AND stages.tournament_id = :tournament_id
-            AND stage_items.id = :stage_item_id
+            AND matches.tournament_id = :tournament_id
+            AND rounds.stage_item_id = :stage_item_id
         """
     await database.execute(
         query=query,
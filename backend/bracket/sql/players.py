@@ -7,8 +7,7 @@ from bracket.logic.ranking.statistics import START_ELO
 from bracket.models.db.player import Player, PlayerBody, PlayerToInsert
 from bracket.schema import players
 from bracket.utils.id_types import PlayerId, TournamentId
-from bracket.utils.pagination import PaginationPlayers
-from bracket.utils.types import dict_without_none
+from bracket.utils.pagination import PaginationPlayers, get_page_sql
 
 
 async def get_all_players_in_tournament(
@@ -18,31 +17,20 @@ async def get_all_players_in_tournament(
     pagination: PaginationPlayers | None = None,
 ) -> list[Player]:
     not_in_team_filter = "AND players.team_id IS NULL" if not_in_team else ""
-    limit_filter = "LIMIT :limit" if pagination is not None and pagination.limit is not None else ""
-    offset_filter = (
-        "OFFSET :offset" if pagination is not None and pagination.offset is not None else ""
-    )
-    sort_by = pagination.sort_by if pagination is not None else "name"
-    sort_direction = pagination.sort_direction if pagination is not None else ""
+    page = get_page_sql(pagination, "players") if pagination is not None else None
     query = f"""
         SELECT *
         FROM players
         WHERE players.tournament_id = :tournament_id
         {not_in_team_filter}
-        ORDER BY {sort_by} {sort_direction}
-        {limit_filter}
-        {offset_filter}
+        {page.keyset_filter if page is not None else ""}
+        ORDER BY {page.order_by if page is not None else "name"}
+        {page.limit_offset if page is not None else ""}
         """
 
     result = await database.fetch_all(
         query=query,
-        values=dict_without_none(
-            {
-                "tournament_id": tournament_id,
-                "offset": pagination.offset if pagination is not None else None,
-                "limit": pagination.limit if pagination is not None else None,
-            }
-        ),
+        values={"tournament_id": tournament_id} | (page.values if page is not None else {}),
     )
 
     return [Player.model_validate(x) for x in result]
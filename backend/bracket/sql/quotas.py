@@ -0,0 +1,37 @@
+from bracket.database import database
+from bracket.utils.id_types import ClubId, TournamentId, UserId
+
+# Counts the entities of a tournament that a subscription limits, keyed by the limit's attribute
+# in `Subscription`.
+TOURNAMENT_QUOTA_QUERIES = {
+    "max_teams": "SELECT COUNT(*) FROM teams WHERE tournament_id = :tournament_id",
+    "max_players": "SELECT COUNT(*) FROM players WHERE tournament_id = :tournament_id",
+    "max_courts": "SELECT COUNT(*) FROM courts WHERE tournament_id = :tournament_id",
+    "max_rankings": "SELECT COUNT(*) FROM rankings WHERE tournament_id = :tournament_id",
+    "max_stages": "SELECT COUNT(*) FROM stages WHERE tournament_id = :tournament_id",
+    "max_stage_items": """
+        SELECT COUNT(*)
+        FROM stage_items
+        JOIN stages ON stages.id = stage_items.stage_id
+        WHERE stages.tournament_id = :tournament_id
+        """,
+    "max_rounds": "SELECT COUNT(*) FROM rounds WHERE tournament_id = :tournament_id",
+}
+
+
+async def sql_count_for_tournament_quota(tournament_id: TournamentId, attribute: str) -> int:
+    query = TOURNAMENT_QUOTA_QUERIES[attribute]
+    result: int = await database.fetch_val(query=query, values={"tournament_id": tournament_id})
+    return result
+
+
+async def sql_count_tournaments_in_club(club_id: ClubId) -> int:
+    query = "SELECT COUNT(*) FROM tournaments WHERE club_id = :club_id"
+    result: int = await database.fetch_val(query=query, values={"club_id": club_id})
+    return result
+
+
+async def sql_count_clubs_of_user(user_id: UserId) -> int:
+    query = "SELECT COUNT(*) FROM users_x_clubs WHERE user_id = :user_id"
+    result: int = await database.fetch_val(query=query, values={"user_id": user_id})
+    return result
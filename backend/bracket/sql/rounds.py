@@ -8,8 +8,8 @@ from bracket.utils.id_types import RoundId, StageItemId, TournamentId
 
 async def sql_create_round(round_: RoundInsertable) -> RoundId:
     query = """
-        INSERT INTO rounds (created, is_draft, name, stage_item_id)
-        VALUES (NOW(), :is_draft, :name, :stage_item_id)
+        INSERT INTO rounds (created, is_draft, name, stage_item_id, tournament_id)
+        VALUES (NOW(), :is_draft, :name, :stage_item_id, :tournament_id)
         RETURNING id
         """
     result: RoundId = await database.fetch_val(
@@ -18,6 +18,7 @@ async def sql_create_round(round_: RoundInsertable) -> RoundId:
             "name": round_.name,
             "is_draft": round_.is_draft,
             "stage_item_id": round_.stage_item_id,
+            "tournament_id": round_.tournament_id,
         },
     )
     return result
@@ -47,9 +48,7 @@ async def get_round_by_id(tournament_id: TournamentId, round_id: RoundId) -> Rou
 async def get_next_round_name(tournament_id: TournamentId, stage_item_id: StageItemId) -> str:
     query = """
         SELECT count(*) FROM rounds
-        JOIN stage_items on stage_items.id = rounds.stage_item_id
-        JOIN stages on stage_items.stage_id = stages.id
-        WHERE stages.tournament_id = :tournament_id
+        WHERE rounds.tournament_id = :tournament_id
         AND rounds.stage_item_id = :stage_item_id
     """
     round_count = int(
@@ -86,13 +85,7 @@ async def set_round_active_or_draft(
                 CASE WHEN rounds.id=:round_id THEN :is_draft
                      ELSE is_draft AND NOT :is_draft
                 END
-        WHERE rounds.id IN (
-            SELECT rounds.id
-            FROM rounds
-            JOIN stage_items ON rounds.stage_item_id = stage_items.id
-            JOIN stages s on s.id = stage_items.stage_id
-            WHERE s.tournament_id = :tournament_id
-        )
+        WHERE rounds.tournament_id = :tournament_id
     """
     await database.execute(
         query=query,
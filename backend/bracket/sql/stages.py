@@ -1,6 +1,6 @@
 from typing import Literal, cast
 
-from bracket.database import database
+from bracket.database import PreparedQuery, database
 from bracket.models.db.stage import Stage
 from bracket.models.db.util import StageWithStageItems
 from bracket.utils.id_types import RoundId, StageId, StageItemId, TournamentId
@@ -27,7 +27,8 @@ async def get_full_tournament_details(
         else ""
     )
 
-    query = f"""
+    # The query text only varies with the filters that are used, so there are few variants.
+    query = PreparedQuery(f"""
         WITH inputs_with_teams AS (
             SELECT DISTINCT ON (stage_item_inputs.id)
                 stage_item_inputs.*,
@@ -48,20 +49,15 @@ async def get_full_tournament_details(
             FROM matches
             LEFT JOIN inputs_with_teams sii1 on sii1.id = matches.stage_item_input1_id
             LEFT JOIN inputs_with_teams sii2 on sii2.id = matches.stage_item_input2_id
-            LEFT JOIN rounds r on matches.round_id = r.id
-            LEFT JOIN stage_items si on r.stage_item_id = si.id
-            LEFT JOIN stages s2 on s2.id = si.stage_id
             LEFT JOIN courts c on matches.court_id = c.id
-            WHERE s2.tournament_id = :tournament_id
+            WHERE matches.tournament_id = :tournament_id
         ), rounds_with_matches AS (
             SELECT DISTINCT ON (rounds.id)
                 rounds.*,
                 to_json(array_agg(m.*)) AS matches
             FROM rounds
             LEFT JOIN matches_with_inputs m on m.round_id = rounds.id
-            LEFT JOIN stage_items si on rounds.stage_item_id = si.id
-            LEFT JOIN stages s2 on s2.id = si.stage_id
-            WHERE s2.tournament_id = :tournament_id
+            WHERE rounds.tournament_id = :tournament_id
             {draft_filter}
             {round_filter}
             GROUP BY rounds.id
@@ -101,7 +97,7 @@ async def get_full_tournament_details(
         {stage_item_filter}
         GROUP BY stages.id
         ORDER BY stages.id
-    """
+    """)
     values = dict_without_none(
         {
             "tournament_id": tournament_id,
@@ -4,7 +4,7 @@ from bracket.database import database
 from bracket.logic.ranking.statistics import TeamStatistics
 from bracket.models.db.team import FullTeamWithPlayers, Team
 from bracket.utils.id_types import StageItemInputId, TeamId, TournamentId
-from bracket.utils.pagination import PaginationTeams
+from bracket.utils.pagination import PaginationTeams, get_page_sql
 from bracket.utils.types import dict_without_none
 
 
@@ -38,37 +38,31 @@ async def get_teams_with_members(
 ) -> list[FullTeamWithPlayers]:
     active_team_filter = "AND teams.active IS TRUE" if only_active_teams else ""
     team_id_filter = "AND teams.id = :team_id" if team_id is not None else ""
-    limit_filter = "LIMIT :limit" if pagination is not None and pagination.limit is not None else ""
-    offset_filter = (
-        "OFFSET :offset" if pagination is not None and pagination.offset is not None else ""
-    )
-    sort = (
-        f"teams.{pagination.sort_by} {pagination.sort_direction}"
-        if pagination is not None
-        else "teams.elo_score DESC, teams.wins DESC, name ASC"
-    )
+    page = get_page_sql(pagination, "teams") if pagination is not None else None
+    sort = page.order_by if page is not None else "teams.elo_score DESC, teams.wins DESC, name ASC"
+    # The players are aggregated per team in a lateral subquery, so that only the teams of the
+    # requested page are aggregated instead of all teams in the tournament.
     query = f"""
         SELECT
             teams.*,
-            to_json(array_agg(p.*)) AS players
+            team_players.players
         FROM teams
-        LEFT JOIN players_x_teams pt on pt.team_id = teams.id
-        LEFT JOIN players p on pt.player_id = p.id
+        LEFT JOIN LATERAL (
+            SELECT COALESCE(to_json(array_agg(p.*)), '[]') AS players
+            FROM players_x_teams pt
+            JOIN players p on pt.player_id = p.id
+            WHERE pt.team_id = teams.id
+        ) team_players ON TRUE
         WHERE teams.tournament_id = :tournament_id
         {active_team_filter}
         {team_id_filter}
-        GROUP BY teams.id
+        {page.keyset_filter if page is not None else ""}
         ORDER BY {sort}
-        {limit_filter}
-        {offset_filter}
+        {page.limit_offset if page is not None else ""}
         """
     values = dict_without_none(
-        {
-            "tournament_id": tournament_id,
-            "team_id": team_id,
-            "limit": pagination.limit if pagination is not None else None,
-            "offset": pagination.offset if pagination is not None else None,
-        }
+        {"tournament_id": tournament_id, "team_id": team_id}
+        | (page.values if page is not None else {})
     )
     result = await database.fetch_all(query=query, values=values)
     return [FullTeamWithPlayers.model_validate(x) for x in result]
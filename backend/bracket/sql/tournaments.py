@@ -1,6 +1,9 @@
 from typing import Any, Literal
 
-from bracket.database import database
+from pydantic import BaseModel
+
+from bracket.database import PreparedQuery, database
+from bracket.logic.auth_cache import auth_cache
 from bracket.models.db.tournament import (
     Tournament,
     TournamentBody,
@@ -11,11 +14,11 @@ from bracket.utils.id_types import TournamentId
 
 
 async def sql_get_tournament(tournament_id: TournamentId) -> Tournament:
-    query = """
+    query = PreparedQuery("""
         SELECT *
         FROM tournaments
         WHERE id = :tournament_id
-        """
+        """)
     result = await database.fetch_one(query=query, values={"tournament_id": tournament_id})
     assert result is not None
     return Tournament.model_validate(result)
@@ -64,6 +67,75 @@ async def sql_delete_tournament(tournament_id: TournamentId) -> None:
         WHERE id = :tournament_id
         """
     await database.fetch_one(query=query, values={"tournament_id": tournament_id})
+    auth_cache.invalidate_access()
+
+
+# Deletes everything that belongs to the tournaments, ordered such that rows are deleted before the
+# rows they refer to. `players_x_teams` rows are removed by their `ON DELETE CASCADE`.
+TOURNAMENT_CONTENTS_DELETE_QUERIES = {
+    "matches": "DELETE FROM matches WHERE tournament_id = any(:tournament_ids)",
+    "stage_item_inputs": "DELETE FROM stage_item_inputs WHERE tournament_id = any(:tournament_ids)",
+    "rounds": "DELETE FROM rounds WHERE tournament_id = any(:tournament_ids)",
+    "stage_items": """
+        DELETE FROM stage_items
+        USING stages
+        WHERE stages.id = stage_items.stage_id
+        AND stages.tournament_id = any(:tournament_ids)
+        """,
+    "stages": "DELETE FROM stages WHERE tournament_id = any(:tournament_ids)",
+    "rankings": "DELETE FROM rankings WHERE tournament_id = any(:tournament_ids)",
+    "players": "DELETE FROM players WHERE tournament_id = any(:tournament_ids)",
+    "courts": "DELETE FROM courts WHERE tournament_id = any(:tournament_ids)",
+}
+
+
+class DeletedTournaments(BaseModel):
+    rows_per_table: dict[str, int]
+    tournament_logos: list[str]
+    team_logos: list[str]
+
+
+async def sql_delete_tournaments_with_contents(
+    tournament_ids: list[TournamentId],
+) -> DeletedTournaments:
+    """
+    Deletes the tournaments and all their contents in a single transaction.
+
+    Returns the number of deleted rows per table and the logo file names of the tournaments and
+    their teams, so the files can be removed.
+    """
+    values = {"tournament_ids": tournament_ids}
+    rows_per_table: dict[str, int] = {}
+    async with database.transaction():
+        for table, query in TOURNAMENT_CONTENTS_DELETE_QUERIES.items():
+            rows_per_table[table] = await database.fetch_val(
+                query=f"WITH deleted AS ({query} RETURNING 1) SELECT COUNT(*) FROM deleted",
+                values=values,
+            )
+
+        teams = await database.fetch_all(
+            query="""
+                DELETE FROM teams
+                WHERE tournament_id = any(:tournament_ids)
+                RETURNING logo_path
+                """,
+            values=values,
+        )
+        tournaments = await database.fetch_all(
+            query="""
+                DELETE FROM tournaments
+                WHERE id = any(:tournament_ids)
+                RETURNING logo_path
+                """,
+            values=values,
+        )
+
+    auth_cache.invalidate_access()
+    return DeletedTournaments(
+        rows_per_table={**rows_per_table, "teams": len(teams), "tournaments": len(tournaments)},
+        tournament_logos=[row.logo_path for row in tournaments if row.logo_path is not None],
+        team_logos=[row.logo_path for row in teams if row.logo_path is not None],
+    )
 
 
 async def sql_update_tournament(
@@ -134,4 +206,5 @@ async def sql_create_tournament(tournament: TournamentBody) -> TournamentId:
         RETURNING id
         """
     new_id = await database.fetch_val(query=query, values=tournament.model_dump())
+    auth_cache.invalidate_access()
     return TournamentId(new_id)
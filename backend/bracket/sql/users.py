@@ -1,36 +1,70 @@
-from bracket.database import database
+from bracket.database import PreparedQuery, database, read_from_primary
+from bracket.logic.auth_cache import auth_cache
 from bracket.logic.tournaments import sql_delete_tournament_completely
 from bracket.models.db.account import UserAccountType
-from bracket.models.db.user import User, UserInDB, UserInsertable, UserPublic, UserToUpdate
-from bracket.schema import users
+from bracket.models.db.user import (
+    ExpiredDemoAccount,
+    User,
+    UserInDB,
+    UserInsertable,
+    UserPublic,
+    UserToUpdate,
+)
 from bracket.sql.clubs import get_clubs_for_user_id, sql_delete_club
-from bracket.sql.tournaments import sql_get_tournaments
+from bracket.sql.tournaments import (
+    DeletedTournaments,
+    sql_delete_tournaments_with_contents,
+    sql_get_tournaments,
+)
 from bracket.utils.db import fetch_one_parsed
 from bracket.utils.id_types import ClubId, TournamentId, UserId
+from bracket.utils.tracing import traced
 from bracket.utils.types import assert_some
 
 
+@traced("auth")
 async def get_user_access_to_tournament(tournament_id: TournamentId, user_id: UserId) -> bool:
-    query = """
-        SELECT DISTINCT t.id
-        FROM users_x_clubs
-        JOIN tournaments t ON t.club_id = users_x_clubs.club_id
-        WHERE user_id = :user_id
-        """
-    result = await database.fetch_all(query=query, values={"user_id": user_id})
-    return tournament_id in {tournament.id for tournament in result}  # type: ignore[attr-defined]
-
-
-async def get_which_clubs_has_user_access_to(user_id: UserId) -> set[ClubId]:
-    query = """
-        SELECT club_id
-        FROM users_x_clubs
-        WHERE user_id = :user_id
-        """
-    result = await database.fetch_all(query=query, values={"user_id": user_id})
-    return {club.club_id for club in result}  # type: ignore[attr-defined]
-
-
+    key = (user_id, tournament_id)
+    if (has_access := auth_cache.tournament_access.get(key)) is None:
+        generation = auth_cache.generation
+        query = PreparedQuery("""
+            SELECT EXISTS (
+                SELECT 1
+                FROM tournaments t
+                JOIN users_x_clubs ON users_x_clubs.club_id = t.club_id
+                WHERE t.id = :tournament_id AND users_x_clubs.user_id = :user_id
+            )
+            """)
+        with read_from_primary():
+            has_access = bool(
+                await database.fetch_val(
+                    query=query, values={"tournament_id": tournament_id, "user_id": user_id}
+                )
+            )
+        if has_access:
+            auth_cache.set_if_not_invalidated(auth_cache.tournament_access, key, True, generation)
+
+    return has_access
+
+
+async def get_which_clubs_has_user_access_to(user_id: UserId) -> frozenset[ClubId]:
+    if (club_ids := auth_cache.club_access.get(user_id)) is None:
+        generation = auth_cache.generation
+        query = """
+            SELECT club_id
+            FROM users_x_clubs
+            WHERE user_id = :user_id
+            """
+        with read_from_primary():
+            result = await database.fetch_all(query=query, values={"user_id": user_id})
+        club_ids = frozenset(club.club_id for club in result)  # type: ignore[attr-defined]
+        if len(club_ids) > 0:
+            auth_cache.set_if_not_invalidated(auth_cache.club_access, user_id, club_ids, generation)
+
+    return club_ids
+
+
+@traced("auth")
 async def get_user_access_to_club(club_id: ClubId, user_id: UserId) -> bool:
     return club_id in await get_which_clubs_has_user_access_to(user_id)
 
@@ -44,6 +78,7 @@ async def update_user(user_id: UserId, user: UserToUpdate) -> None:
     await database.execute(
         query=query, values={"user_id": user_id, "name": user.name, "email": user.email}
     )
+    auth_cache.invalidate_user(user_id)
 
 
 async def update_user_account_type(user_id: UserId, account_type: UserAccountType) -> None:
@@ -55,6 +90,7 @@ async def update_user_account_type(user_id: UserId, account_type: UserAccountTyp
     await database.execute(
         query=query, values={"user_id": user_id, "account_type": account_type.value}
     )
+    auth_cache.invalidate_user(user_id)
 
 
 async def update_user_password(user_id: UserId, password_hash: str) -> None:
@@ -64,6 +100,7 @@ async def update_user_password(user_id: UserId, password_hash: str) -> None:
         WHERE id = :user_id
         """
     await database.execute(query=query, values={"user_id": user_id, "password_hash": password_hash})
+    auth_cache.invalidate_user(user_id)
 
 
 async def get_user_by_id(user_id: UserId) -> UserPublic | None:
@@ -76,15 +113,29 @@ async def get_user_by_id(user_id: UserId) -> UserPublic | None:
     return UserPublic.model_validate(dict(result._mapping)) if result is not None else None
 
 
-async def get_expired_demo_users() -> list[UserPublic]:
+async def get_expired_demo_accounts() -> list[ExpiredDemoAccount]:
     query = """
-        SELECT *
+        SELECT
+            users.id,
+            COALESCE(
+                array_agg(DISTINCT users_x_clubs.club_id)
+                    FILTER (WHERE users_x_clubs.club_id IS NOT NULL),
+                '{}'
+            ) AS club_ids,
+            COALESCE(
+                array_agg(DISTINCT tournaments.id) FILTER (WHERE tournaments.id IS NOT NULL),
+                '{}'
+            ) AS tournament_ids
         FROM users
-        WHERE account_type='DEMO'
-        AND created <= NOW() - INTERVAL '30 minutes'
+        LEFT JOIN users_x_clubs ON users_x_clubs.user_id = users.id
+        LEFT JOIN tournaments ON tournaments.club_id = users_x_clubs.club_id
+        WHERE users.account_type = 'DEMO'
+        AND users.created <= NOW() - INTERVAL '30 minutes'
+        GROUP BY users.id
+        ORDER BY users.id
         """
     result = await database.fetch_all(query=query)
-    return [UserPublic.model_validate(demo_user) for demo_user in result]
+    return [ExpiredDemoAccount.model_validate(dict(row._mapping)) for row in result]
 
 
 async def create_user(user: UserInsertable) -> User:
@@ -112,6 +163,7 @@ async def delete_user(user_id: UserId) -> None:
         WHERE id = :user_id
         """
     await database.fetch_one(query=query, values={"user_id": user_id})
+    auth_cache.invalidate_user(user_id)
 
 
 async def check_whether_email_is_in_use(email: str) -> bool:
@@ -125,7 +177,59 @@ async def check_whether_email_is_in_use(email: str) -> bool:
 
 
 async def get_user(email: str) -> UserInDB | None:
-    return await fetch_one_parsed(database, UserInDB, users.select().where(users.c.email == email))
+    if (user := auth_cache.users.get(email)) is not None:
+        return user
+
+    generation = auth_cache.generation
+    query = PreparedQuery("""
+        SELECT *
+        FROM users
+        WHERE email = :email
+        """)
+    with read_from_primary():
+        user = await fetch_one_parsed(database, UserInDB, query.bindparams(email=email))
+    if user is not None:
+        auth_cache.set_if_not_invalidated(auth_cache.users, email, user, generation)
+    return user
+
+
+async def sql_purge_demo_accounts(accounts: list[ExpiredDemoAccount]) -> DeletedTournaments:
+    """
+    Deletes the demo users together with their clubs and tournaments in a single transaction.
+    """
+    club_ids = [club_id for account in accounts for club_id in account.club_ids]
+    user_ids = [account.id for account in accounts]
+    async with database.transaction():
+        deleted = await sql_delete_tournaments_with_contents(
+            [tournament_id for account in accounts for tournament_id in account.tournament_ids]
+        )
+        deleted_clubs = await database.fetch_val(
+            query="""
+                WITH deleted AS (DELETE FROM clubs WHERE id = any(:club_ids) RETURNING 1)
+                SELECT COUNT(*) FROM deleted
+                """,
+            values={"club_ids": club_ids},
+        )
+        deleted_users = await database.fetch_val(
+            query="""
+                WITH deleted AS (DELETE FROM users WHERE id = any(:user_ids) RETURNING 1)
+                SELECT COUNT(*) FROM deleted
+                """,
+            values={"user_ids": user_ids},
+        )
+
+    for user_id in user_ids:
+        auth_cache.invalidate_user(user_id)
+
+    return deleted.model_copy(
+        update={
+            "rows_per_table": {
+                **deleted.rows_per_table,
+                "clubs": deleted_clubs,
+                "users": deleted_users,
+            }
+        }
+    )
 
 
 async def delete_user_and_owned_clubs(user_id: UserId) -> None:
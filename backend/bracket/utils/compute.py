@@ -0,0 +1,125 @@
+"""
+Offloads CPU-bound work (rankings, conflict detection, Swiss suggestions) from the event loop.
+
+Functions passed to `run_cpu_bound` must be pure module-level functions that take and return
+plain data (including Pydantic models), so that they can be pickled for a process pool.
+"""
+
+import asyncio
+import copyreg
+import datetime
+import multiprocessing
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cache, partial
+from typing import Any, Literal, TypeVar
+
+from heliclockter import datetime_tz, datetime_utc
+
+from bracket.config import config
+from bracket.models.metrics import (
+    COMPUTE_CALLS,
+    COMPUTE_EXECUTION_SECONDS,
+    COMPUTE_QUEUE_DEPTH,
+    COMPUTE_WAIT_SECONDS,
+)
+
+T = TypeVar("T")
+ExecutorType = Literal["inline", "thread", "process"]
+DatetimeTzT = TypeVar("DatetimeTzT", bound=datetime_tz)
+
+
+def restore_datetime_tz(cls: type[DatetimeTzT], value: datetime.datetime) -> DatetimeTzT:
+    return cls.from_datetime(value)
+
+
+def reduce_datetime_tz(
+    value: datetime_tz,
+) -> tuple[Callable[..., datetime_tz], tuple[type[datetime_tz], datetime.datetime]]:
+    # `datetime_tz` can't be unpickled by default because its `__init__` requires a timezone.
+    plain = datetime.datetime(
+        value.year,
+        value.month,
+        value.day,
+        value.hour,
+        value.minute,
+        value.second,
+        value.microsecond,
+        tzinfo=value.tzinfo,
+        fold=value.fold,
+    )
+    return restore_datetime_tz, (type(value), plain)
+
+
+for datetime_type in (datetime_tz, datetime_utc):
+    copyreg.pickle(datetime_type, reduce_datetime_tz)
+
+
+@cache
+def get_thread_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=config.compute_offload_workers, thread_name_prefix="bracket-compute"
+    )
+
+
+@cache
+def get_process_pool() -> ProcessPoolExecutor:
+    # Use `spawn` because forking a process that runs an event loop and threads is unsafe.
+    return ProcessPoolExecutor(
+        max_workers=config.compute_offload_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def shutdown_compute_pools() -> None:
+    for get_pool in (get_thread_pool, get_process_pool):
+        if get_pool.cache_info().currsize > 0:
+            get_pool().shutdown(cancel_futures=True)
+            get_pool.cache_clear()
+
+
+def timed_call(func: Callable[..., T], *args: Any) -> tuple[T, float]:
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+async def run_cpu_bound(
+    func: Callable[..., T],
+    *args: Any,
+    size: int,
+    executor_type: ExecutorType | None = None,
+) -> T:
+    """
+    Runs `func(*args)` directly if `size` (an estimate of the amount of work) is below
+    `config.compute_offload_threshold`. Otherwise, runs it in the configured worker pool.
+    """
+    if executor_type is None:
+        executor_type = (
+            config.compute_offload_executor
+            if size >= config.compute_offload_threshold
+            else "inline"
+        )
+
+    function_labels = (func.__name__,)
+    COMPUTE_CALLS.inc((func.__name__, executor_type))
+
+    if executor_type == "inline":
+        result, execution_time = timed_call(func, *args)
+        COMPUTE_EXECUTION_SECONDS.inc(function_labels, execution_time)
+        return result
+
+    executor: Executor = get_thread_pool() if executor_type == "thread" else get_process_pool()
+    start = time.perf_counter()
+    COMPUTE_QUEUE_DEPTH.inc()
+    try:
+        result, execution_time = await asyncio.get_running_loop().run_in_executor(
+            executor, partial(timed_call, func, *args)
+        )
+    finally:
+        COMPUTE_QUEUE_DEPTH.dec()
+
+    COMPUTE_EXECUTION_SECONDS.inc(function_labels, execution_time)
+    COMPUTE_WAIT_SECONDS.inc(function_labels, time.perf_counter() - start - execution_time)
+    return result
@@ -1,22 +1,28 @@
 from databases import Database
 from sqlalchemy import Table
 from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import TextClause
 
 from bracket.config import Environment, environment
 from bracket.utils.conversion import to_string_mapping
 from bracket.utils.logging import logger
+from bracket.utils.tracing import trace_span
 from bracket.utils.types import BaseModelT, assert_some
 
 
 async def fetch_one_parsed(
-    database: Database, model: type[BaseModelT], query: Select
+    database: Database, model: type[BaseModelT], query: Select | TextClause
 ) -> BaseModelT | None:
     record = await database.fetch_one(query)
-    return model.model_validate(dict(record._mapping)) if record is not None else None
+    if record is None:
+        return None
+
+    with trace_span(f"validate.{model.__name__}"):
+        return model.model_validate(dict(record._mapping))
 
 
 async def fetch_one_parsed_certain(
-    database: Database, model: type[BaseModelT], query: Select
+    database: Database, model: type[BaseModelT], query: Select | TextClause
 ) -> BaseModelT:
     return assert_some(await fetch_one_parsed(database, model, query))
 
@@ -25,7 +31,8 @@ async def fetch_all_parsed(
     database: Database, model: type[BaseModelT], query: Select
 ) -> list[BaseModelT]:
     records = await database.fetch_all(query)
-    return [model.model_validate(dict(record._mapping)) for record in records]
+    with trace_span(f"validate.{model.__name__}"):
+        return [model.model_validate(dict(record._mapping)) for record in records]
 
 
 async def insert_generic(
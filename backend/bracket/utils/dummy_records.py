@@ -97,6 +97,7 @@ DUMMY_STAGE_ITEM3 = StageItemInsertable(
 
 DUMMY_ROUND1 = RoundInsertable(
     stage_item_id=StageItemId(DB_PLACEHOLDER_ID),
+    tournament_id=TournamentId(DB_PLACEHOLDER_ID),
     created=DUMMY_MOCK_TIME,
     is_draft=False,
     name="Round 1",
@@ -104,6 +105,7 @@ DUMMY_ROUND1 = RoundInsertable(
 
 DUMMY_ROUND2 = RoundInsertable(
     stage_item_id=StageItemId(DB_PLACEHOLDER_ID),
+    tournament_id=TournamentId(DB_PLACEHOLDER_ID),
     created=DUMMY_MOCK_TIME,
     is_draft=True,
     name="Round 2",
@@ -111,6 +113,7 @@ DUMMY_ROUND2 = RoundInsertable(
 
 DUMMY_ROUND3 = RoundInsertable(
     stage_item_id=StageItemId(DB_PLACEHOLDER_ID),
+    tournament_id=TournamentId(DB_PLACEHOLDER_ID),
     created=DUMMY_MOCK_TIME,
     is_draft=False,
     name="Round 3",
@@ -120,6 +123,7 @@ DUMMY_MATCH1 = MatchInsertable(
     created=DUMMY_MOCK_TIME,
     start_time=DUMMY_MOCK_TIME,
     round_id=RoundId(DB_PLACEHOLDER_ID),
+    tournament_id=TournamentId(DB_PLACEHOLDER_ID),
     stage_item_input1_id=StageItemInputId(DB_PLACEHOLDER_ID),
     stage_item_input2_id=StageItemInputId(DB_PLACEHOLDER_ID),
     stage_item_input1_score=11,
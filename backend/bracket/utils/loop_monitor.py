@@ -0,0 +1,70 @@
+"""
+Detects when synchronous code blocks the event loop, which delays every other request.
+
+The monitor sleeps for a fixed interval and measures how late it wakes up. When the loop was
+blocked longer than the threshold, it reports the routes that were being handled at that time,
+one of which (or a background task) ran the blocking callback.
+"""
+
+import asyncio
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from bracket.config import config
+from bracket.models.metrics import EVENT_LOOP_BLOCKED, EVENT_LOOP_LAG
+from bracket.utils.logging import logger
+
+BACKGROUND_ROUTE = "background"
+
+in_flight_routes: Counter[str] = Counter()
+routes_since_last_check: set[str] = set()
+
+
+@contextmanager
+def track_in_flight_route(route: str) -> Iterator[None]:
+    in_flight_routes[route] += 1
+    routes_since_last_check.add(route)
+    try:
+        yield
+    finally:
+        in_flight_routes[route] -= 1
+        if in_flight_routes[route] <= 0:
+            del in_flight_routes[route]
+
+
+def pop_active_routes() -> list[str]:
+    """
+    Returns the routes that were in flight at any point since the previous call, so requests
+    that finished right after blocking the loop are reported as well.
+    """
+    routes = sorted(routes_since_last_check)
+    routes_since_last_check.clear()
+    routes_since_last_check.update(in_flight_routes)
+    return routes
+
+
+def record_event_loop_lag(lag: float) -> None:
+    EVENT_LOOP_LAG.observe(lag)
+    routes = pop_active_routes()
+
+    if lag < config.event_loop_block_threshold:
+        return
+
+    for route in routes or [BACKGROUND_ROUTE]:
+        EVENT_LOOP_BLOCKED.inc((route,))
+
+    logger.warning(
+        f"Event loop was blocked for {lag * 1000:.0f}ms, "
+        f"routes in flight: {', '.join(routes) or BACKGROUND_ROUTE}"
+    )
+
+
+async def monitor_event_loop() -> None:
+    loop = asyncio.get_running_loop()
+    interval = config.event_loop_monitor_interval
+
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        record_event_loop_lag(max(loop.time() - start - interval, 0.0))
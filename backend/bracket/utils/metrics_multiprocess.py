@@ -0,0 +1,183 @@
+"""
+Aggregates metrics across worker processes (e.g. multiple gunicorn workers).
+
+Every process periodically writes a JSON snapshot of its metrics to
+`config.metrics_multiprocess_dir`, named after its PID and start time. On scrape, the serving
+worker writes its own snapshot and merges the snapshots of all processes.
+
+When a worker exits, the gunicorn master folds its counters and histograms into a single archive
+file (see `gunicorn.conf.py`), so totals don't decrease and the directory doesn't grow. Gauges of
+exited processes are dropped. The master wipes the directory on startup, so snapshots of earlier
+runs are never merged.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from bracket.config import config
+from bracket.models.metrics import Gauge, SampleValue, registry
+from bracket.utils.logging import logger
+
+Snapshot = dict[str, list[tuple[tuple[str, ...], SampleValue]]]
+
+ARCHIVE_FILE_NAME = "archived-metrics.json"
+
+
+def get_process_start_time(pid: int) -> int | None:
+    """
+    Returns the start time of a process in clock ticks since boot, or `None` if it doesn't exist.
+
+    Together with the PID, the start time identifies a process even after its PID is reused.
+    On systems without `/proc`, the start time of every running process is 0.
+    """
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except FileNotFoundError:
+        if Path("/proc/self/stat").exists():
+            return None
+        return 0 if is_process_alive(pid) else None
+
+    # The process name (2nd field) can contain spaces, so split after its closing parenthesis.
+    # The start time is the 22nd field.
+    return int(stat.rsplit(")", 1)[1].split()[19])
+
+
+@cache
+def get_snapshot_name(pid: int) -> str:
+    return f"metrics-{pid}-{get_process_start_time(pid)}.json"
+
+
+def write_json_atomically(path: Path, data: object) -> None:
+    file_descriptor, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".metrics-")
+    with os.fdopen(file_descriptor, "w") as file:
+        json.dump(data, file)
+
+    # `os.replace` is atomic, so readers never see a partially written file.
+    os.replace(temp_path, path)
+
+
+def write_metrics_snapshot(directory: Path, snapshot: Snapshot | None = None) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    write_json_atomically(
+        directory / get_snapshot_name(os.getpid()),
+        registry.snapshot() if snapshot is None else snapshot,
+    )
+
+
+def is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def is_snapshot_process_alive(path: Path) -> bool:
+    pid, start_time = path.stem.removeprefix("metrics-").split("-")
+    return str(get_process_start_time(int(pid))) == start_time
+
+
+def parse_snapshot(raw_snapshot: dict[str, list[list[Any]]], is_alive: bool) -> Snapshot:
+    return {
+        name: [(tuple(label_values), value) for label_values, value in samples]
+        for name, samples in raw_snapshot.items()
+        if is_alive or not isinstance(registry.metrics.get(name), Gauge)
+    }
+
+
+def read_json(path: Path) -> Any:
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.exception(f"Could not read metrics file {path}")
+        return None
+
+
+def read_metrics_snapshots(directory: Path) -> list[Snapshot]:
+    """
+    The snapshots of the processes are read before the archive. The archive is replaced before
+    the snapshots it contains are removed, so every snapshot is counted exactly once.
+    """
+    snapshots: dict[str, Snapshot] = {}
+    for path in directory.glob("metrics-*-*.json"):
+        if (raw_snapshot := read_json(path)) is not None:
+            snapshots[path.name] = parse_snapshot(raw_snapshot, is_snapshot_process_alive(path))
+
+    if (archive := read_json(directory / ARCHIVE_FILE_NAME)) is not None:
+        for name in archive["snapshots"]:
+            snapshots.pop(name, None)
+        snapshots[ARCHIVE_FILE_NAME] = parse_snapshot(archive["metrics"], is_alive=False)
+
+    return list(snapshots.values())
+
+
+def archive_metrics_snapshots(directory: Path, pid: int) -> None:
+    """
+    Folds the counters and histograms of the snapshots of an exited process into the archive and
+    removes the snapshots. Must only be called from one process, i.e. the gunicorn master.
+    """
+    paths = list(directory.glob(f"metrics-{pid}-*.json"))
+    if len(paths) < 1:
+        return
+
+    archive = read_json(directory / ARCHIVE_FILE_NAME) or {"snapshots": [], "metrics": {}}
+    snapshots = [parse_snapshot(archive["metrics"], is_alive=False)]
+    for path in paths:
+        if (raw_snapshot := read_json(path)) is not None:
+            snapshots.append(parse_snapshot(raw_snapshot, is_alive=False))
+
+    merged = registry.merge(snapshots)
+    metrics = {
+        name: [(label_values, value) for label_values, value in samples.items()]
+        for name, samples in merged.items()
+        if len(samples) > 0
+    }
+    write_json_atomically(
+        directory / ARCHIVE_FILE_NAME,
+        {"snapshots": archive["snapshots"] + [path.name for path in paths], "metrics": metrics},
+    )
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+def wipe_metrics_directory(directory: Path) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    for path in directory.iterdir():
+        if path.is_file():
+            path.unlink(missing_ok=True)
+
+
+def render_merged_metrics(directory: Path, snapshot: Snapshot) -> str:
+    write_metrics_snapshot(directory, snapshot)
+    return registry.render(registry.merge(read_metrics_snapshots(directory)))
+
+
+async def render_metrics() -> str:
+    if config.metrics_multiprocess_dir is None:
+        return registry.render()
+
+    # The snapshot is taken on the event loop because the metrics are updated there, the file I/O
+    # runs in a thread so that it doesn't block the event loop.
+    directory = Path(config.metrics_multiprocess_dir)
+    return await asyncio.to_thread(render_merged_metrics, directory, registry.snapshot())
+
+
+async def write_metrics_snapshots_periodically() -> None:
+    assert config.metrics_multiprocess_dir is not None
+    directory = Path(config.metrics_multiprocess_dir)
+
+    while True:
+        await asyncio.sleep(config.metrics_multiprocess_interval)
+        try:
+            await asyncio.to_thread(write_metrics_snapshot, directory, registry.snapshot())
+        except OSError:
+            logger.exception("Could not write metrics snapshot")
@@ -1,7 +1,21 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Literal
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Literal
 
-from fastapi import Query
+from fastapi import HTTPException, Query
+from heliclockter import datetime_utc
+from starlette import status
+
+# Converts cursor values that JSON can't represent back to the type of their column.
+CURSOR_VALUE_PARSERS: dict[str, Callable[[Any], Any]] = {
+    "elo_score": float,
+    "swiss_score": float,
+    "created": datetime_utc.fromisoformat,
+}
 
 
 @dataclass
@@ -9,6 +23,16 @@ class Pagination:
     limit: int = Query(25, ge=1, le=100, description="Max number of results in a single page.")
     offset: int = Query(0, ge=0, description="Filter results starting from this offset.")
     sort_direction: Literal["asc", "desc"] = "asc"
+    cursor: str | None = Query(
+        None,
+        description=(
+            "`next_cursor` of the previous page, to continue after its last result. "
+            "Unlike `offset`, this stays fast for deep pages."
+        ),
+    )
+    include_count: bool = Query(
+        True, description="Whether to count the total number of results as well."
+    )
 
 
 @dataclass
@@ -23,3 +47,81 @@ class PaginationTeams(Pagination):
     sort_by: Literal[
         "name", "elo_score", "swiss_score", "wins", "draws", "losses", "active", "created"
     ] = "name"
+
+
+def encode_cursor(pagination: PaginationPlayers | PaginationTeams, value: Any, id_: int) -> str:
+    if isinstance(value, Decimal):
+        value = float(value)
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+
+    payload = [pagination.sort_by, pagination.sort_direction, value, id_]
+    return urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(pagination: PaginationPlayers | PaginationTeams) -> tuple[Any, int] | None:
+    if pagination.cursor is None:
+        return None
+
+    try:
+        sort_by, sort_direction, value, id_ = json.loads(urlsafe_b64decode(pagination.cursor))
+        value = CURSOR_VALUE_PARSERS.get(sort_by, lambda x: x)(value)
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid pagination cursor") from exc
+
+    if (sort_by, sort_direction) != (pagination.sort_by, pagination.sort_direction):
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST, "Pagination cursor was created for a different sort order"
+        )
+
+    return value, int(id_)
+
+
+def get_next_cursor(
+    pagination: PaginationPlayers | PaginationTeams, results: list[Any]
+) -> str | None:
+    """
+    Returns the cursor of the page after `results`, unless `results` is the last page.
+    """
+    if len(results) < pagination.limit:
+        return None
+
+    last = results[-1]
+    return encode_cursor(pagination, getattr(last, pagination.sort_by), last.id)
+
+
+@dataclass
+class PageSql:
+    keyset_filter: str
+    order_by: str
+    limit_offset: str
+    values: dict[str, Any]
+
+
+def get_page_sql(pagination: PaginationPlayers | PaginationTeams, table: str) -> PageSql:
+    """
+    With a cursor, the page starts after the cursor's row using a row comparison on the sort column
+    and the ID (which breaks ties). Postgres can then seek there in an index instead of skipping
+    `offset` rows.
+    """
+    order_by = (
+        f"{table}.{pagination.sort_by} {pagination.sort_direction}, "
+        f"{table}.id {pagination.sort_direction}"
+    )
+    if (cursor := decode_cursor(pagination)) is None:
+        return PageSql(
+            keyset_filter="",
+            order_by=order_by,
+            limit_offset="LIMIT :limit OFFSET :offset",
+            values={"limit": pagination.limit, "offset": pagination.offset},
+        )
+
+    operator = ">" if pagination.sort_direction == "asc" else "<"
+    return PageSql(
+        keyset_filter=(
+            f"AND ({table}.{pagination.sort_by}, {table}.id) {operator} (:cursor_value, :cursor_id)"
+        ),
+        order_by=order_by,
+        limit_offset="LIMIT :limit",
+        values={"limit": pagination.limit, "cursor_value": cursor[0], "cursor_id": cursor[1]},
+    )
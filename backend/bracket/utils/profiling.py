@@ -0,0 +1,114 @@
+"""
+Statistical profiler that samples the stacks of running threads from a background thread.
+
+Sampling via `sys._current_frames()` doesn't require tracing hooks, so the overhead on the
+profiled threads is limited to the GIL contention of the sampling thread.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable
+from types import CodeType
+from typing import Any
+
+Stack = tuple[CodeType, ...]
+
+
+def shorten_filename(filename: str) -> str:
+    for marker in ("site-packages" + os.sep, "lib" + os.sep + "python"):
+        if marker in filename:
+            return filename.split(marker, 1)[1]
+
+    return os.path.relpath(filename) if os.path.isabs(filename) else filename
+
+
+class SamplingProfiler:
+    def __init__(self, thread_ids: Iterable[int], interval: float) -> None:
+        self.thread_ids = frozenset(thread_ids)
+        self.interval = interval
+        self.samples: Counter[tuple[str, Stack]] = Counter()
+        self.duration = 0.0
+        self._thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+
+    def run(self, duration: float) -> None:
+        """
+        Samples the stacks of the profiled threads for `duration` seconds, blocking the
+        calling thread.
+        """
+        start = time.perf_counter()
+        deadline = start + duration
+        current_thread_id = threading.get_ident()
+
+        while (now := time.perf_counter()) < deadline:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id not in self.thread_ids or thread_id == current_thread_id:
+                    continue
+
+                stack = []
+                current_frame: Any = frame
+                while current_frame is not None:
+                    stack.append(current_frame.f_code)
+                    current_frame = current_frame.f_back
+
+                thread_name = self._thread_names.get(thread_id, str(thread_id))
+                self.samples[(thread_name, tuple(reversed(stack)))] += 1
+
+            time.sleep(max(self.interval - (time.perf_counter() - now), 0.0))
+
+        self.duration = time.perf_counter() - start
+
+    @staticmethod
+    def format_frame(code: CodeType) -> str:
+        return f"{code.co_name} ({shorten_filename(code.co_filename)}:{code.co_firstlineno})"
+
+    def to_collapsed(self) -> str:
+        """
+        Returns the samples in the collapsed stack format used by flamegraph.pl and speedscope.
+        """
+        return "".join(
+            f"{';'.join([thread_name, *[self.format_frame(code) for code in stack]])} {count}\n"
+            for (thread_name, stack), count in self.samples.most_common()
+        )
+
+    def to_speedscope(self) -> dict[str, Any]:
+        frame_indices: dict[CodeType, int] = {}
+        frames: list[dict[str, Any]] = []
+        profiles: dict[str, dict[str, Any]] = {}
+
+        for (thread_name, stack), count in self.samples.items():
+            for code in stack:
+                if code not in frame_indices:
+                    frame_indices[code] = len(frames)
+                    frames.append(
+                        {
+                            "name": code.co_name,
+                            "file": shorten_filename(code.co_filename),
+                            "line": code.co_firstlineno,
+                        }
+                    )
+
+            profile = profiles.setdefault(
+                thread_name,
+                {
+                    "type": "sampled",
+                    "name": thread_name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": self.duration,
+                    "samples": [],
+                    "weights": [],
+                },
+            )
+            profile["samples"].append([frame_indices[code] for code in stack])
+            profile["weights"].append(count * self.interval)
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "exporter": "bracket",
+            "name": f"bracket (pid {os.getpid()})",
+            "shared": {"frames": frames},
+            "profiles": list(profiles.values()),
+        }
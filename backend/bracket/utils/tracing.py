@@ -0,0 +1,196 @@
+"""
+Lightweight per-request tracing to find out which phase of a slow request dominates.
+
+The request middleware starts a `RequestTrace` in a context variable. Spans are recorded for
+dependency resolution (including auth), the endpoint itself, response serialization, database
+queries and Pydantic validation. Requests slower than `config.slow_request_threshold` are
+logged with their trace. When Sentry tracing is configured, spans are reported to Sentry too.
+"""
+
+import asyncio
+import json
+import time
+from collections import defaultdict
+from collections.abc import Callable, Coroutine, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+import sentry_sdk
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+
+from bracket.config import config
+from bracket.utils.logging import logger
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+MAX_SPANS_PER_TRACE = 200
+
+
+@dataclass
+class Span:
+    name: str
+    start: float
+    end: float
+
+    @property
+    def phase(self) -> str:
+        return self.name.split(".", 1)[0]
+
+
+@dataclass
+class RequestTrace:
+    method: str
+    route: str
+    start: float = field(default_factory=time.perf_counter)
+    spans: list[Span] = field(default_factory=list)
+    dropped_spans: int = 0
+    endpoint_start: float | None = None
+    endpoint_end: float | None = None
+
+    def add_span(self, name: str, start: float, end: float) -> None:
+        if len(self.spans) >= MAX_SPANS_PER_TRACE:
+            self.dropped_spans += 1
+            return
+
+        self.spans.append(Span(name, start, end))
+
+    def to_dict(self, end: float) -> dict[str, Any]:
+        """
+        `phases_ms` sums the spans per phase (the part of the span name before the first dot).
+        Phases can overlap, e.g. `auth` spans are part of `dependencies` and `db` spans are
+        usually part of `endpoint`.
+        """
+        phases: dict[str, float] = defaultdict(float)
+        for span in self.spans:
+            phases[span.phase] += (span.end - span.start) * 1000
+
+        return {
+            "method": self.method,
+            "route": self.route,
+            "duration_ms": round((end - self.start) * 1000, 2),
+            "phases_ms": {phase: round(duration, 2) for phase, duration in phases.items()},
+            "spans": [
+                {
+                    "name": span.name,
+                    "offset_ms": round((span.start - self.start) * 1000, 2),
+                    "duration_ms": round((span.end - span.start) * 1000, 2),
+                }
+                for span in sorted(self.spans, key=lambda span: span.start)
+            ],
+            "dropped_spans": self.dropped_spans,
+        }
+
+
+current_trace: ContextVar[RequestTrace | None] = ContextVar("current_trace", default=None)
+
+
+def is_sentry_tracing_enabled() -> bool:
+    return config.sentry_dsn is not None and config.sentry_traces_sample_rate is not None
+
+
+@contextmanager
+def trace_span(name: str, op: str = "function") -> Iterator[None]:
+    trace = current_trace.get()
+    if trace is None and not is_sentry_tracing_enabled():
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        if is_sentry_tracing_enabled():
+            with sentry_sdk.start_span(op=op, name=name):
+                yield
+        else:
+            yield
+    finally:
+        if trace is not None:
+            trace.add_span(name, start, time.perf_counter())
+
+
+def traced(
+    op: str,
+) -> Callable[[Callable[P, Coroutine[Any, Any, T]]], Callable[P, Coroutine[Any, Any, T]]]:
+    """
+    Records a span named `{op}.{function name}` for every call of the decorated coroutine.
+    """
+
+    def decorator(
+        func: Callable[P, Coroutine[Any, Any, T]],
+    ) -> Callable[P, Coroutine[Any, Any, T]]:
+        span_name = f"{op}.{func.__name__}"
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            with trace_span(span_name, op):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record_endpoint_call(start: float) -> None:
+    if (trace := current_trace.get()) is not None:
+        trace.endpoint_start, trace.endpoint_end = start, time.perf_counter()
+        trace.add_span("endpoint", start, trace.endpoint_end)
+
+
+class TracedAPIRoute(APIRoute):
+    """
+    Route that splits the time spent in FastAPI's request handler into dependency resolution
+    (which includes auth and request validation), the endpoint and response serialization.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        endpoint = self.dependant.call
+        assert endpoint is not None
+
+        if asyncio.iscoroutinefunction(endpoint):
+
+            @wraps(endpoint)
+            async def traced_endpoint(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                try:
+                    return await endpoint(*args, **kwargs)
+                finally:
+                    record_endpoint_call(start)
+
+            self.dependant.call = traced_endpoint
+        else:
+
+            @wraps(endpoint)
+            def traced_sync_endpoint(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                try:
+                    return endpoint(*args, **kwargs)
+                finally:
+                    record_endpoint_call(start)
+
+            self.dependant.call = traced_sync_endpoint
+
+        handler = super().get_route_handler()
+
+        async def traced_handler(request: Request) -> Response:
+            start = time.perf_counter()
+            try:
+                return await handler(request)
+            finally:
+                if (trace := current_trace.get()) is not None:
+                    end = time.perf_counter()
+                    trace.add_span("dependencies", start, trace.endpoint_start or end)
+                    if trace.endpoint_end is not None:
+                        trace.add_span("serialization", trace.endpoint_end, end)
+
+        return traced_handler
+
+
+def log_if_slow_request(trace: RequestTrace) -> None:
+    end = time.perf_counter()
+    if end - trace.start >= config.slow_request_threshold:
+        logger.warning(f"Slow request: {json.dumps(trace.to_dict(end))}")
@@ -0,0 +1,28 @@
+"""
+Gunicorn loads this file from the working directory by default.
+
+The hooks run in the gunicorn master, which outlives the workers. They keep the snapshots of
+`bracket.utils.metrics_multiprocess` consistent when workers exit or are restarted.
+"""
+
+from pathlib import Path
+from typing import Any
+
+# `bracket` is imported in the hooks, because this file is loaded before gunicorn adds the working
+# directory to `sys.path`.
+
+
+def on_starting(_: Any) -> None:
+    from bracket.config import config
+    from bracket.utils.metrics_multiprocess import wipe_metrics_directory
+
+    if config.metrics_multiprocess_dir is not None:
+        wipe_metrics_directory(Path(config.metrics_multiprocess_dir))
+
+
+def child_exit(_: Any, worker: Any) -> None:
+    from bracket.config import config
+    from bracket.utils.metrics_multiprocess import archive_metrics_snapshots
+
+    if config.metrics_multiprocess_dir is not None:
+        archive_metrics_snapshots(Path(config.metrics_multiprocess_dir), worker.pid)
@@ -70,6 +70,7 @@ async def test_start_next_round(
         await sql_create_round(
             RoundInsertable(
                 stage_item_id=stage_item_1.id,
+                tournament_id=tournament_id,
                 name="",
                 is_draft=False,
                 created=MOCK_NOW,
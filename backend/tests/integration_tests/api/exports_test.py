@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from bracket.models.db.stage_item_inputs import StageItemInputInsertable
+from bracket.utils.dummy_records import (
+    DUMMY_COURT1,
+    DUMMY_MATCH1,
+    DUMMY_ROUND1,
+    DUMMY_STAGE1,
+    DUMMY_STAGE_ITEM1,
+    DUMMY_TEAM1,
+    DUMMY_TEAM2,
+)
+from bracket.utils.http import HTTPMethod
+from tests.integration_tests.api.shared import send_request_raw
+from tests.integration_tests.models import AuthContext
+from tests.integration_tests.sql import (
+    inserted_court,
+    inserted_match,
+    inserted_round,
+    inserted_stage,
+    inserted_stage_item,
+    inserted_stage_item_input,
+    inserted_team,
+)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_exports(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    tournament_id = auth_context.tournament.id
+    async with (
+        inserted_stage(DUMMY_STAGE1.model_copy(update={"tournament_id": tournament_id})) as stage,
+        inserted_stage_item(
+            DUMMY_STAGE_ITEM1.model_copy(
+                update={"stage_id": stage.id, "ranking_id": auth_context.ranking.id}
+            )
+        ) as stage_item,
+        inserted_round(
+            DUMMY_ROUND1.model_copy(
+                update={"tournament_id": tournament_id, "stage_item_id": stage_item.id}
+            )
+        ) as round_,
+        inserted_team(DUMMY_TEAM1.model_copy(update={"tournament_id": tournament_id})) as team1,
+        inserted_team(DUMMY_TEAM2.model_copy(update={"tournament_id": tournament_id})) as team2,
+        inserted_stage_item_input(
+            StageItemInputInsertable(
+                slot=0, team_id=team1.id, tournament_id=tournament_id, stage_item_id=stage_item.id
+            )
+        ) as input1,
+        inserted_stage_item_input(
+            StageItemInputInsertable(
+                slot=1, team_id=team2.id, tournament_id=tournament_id, stage_item_id=stage_item.id
+            )
+        ) as input2,
+        inserted_court(DUMMY_COURT1.model_copy(update={"tournament_id": tournament_id})) as court,
+        inserted_match(
+            DUMMY_MATCH1.model_copy(
+                update={
+                    "round_id": round_.id,
+                    "tournament_id": tournament_id,
+                    "stage_item_input1_id": input1.id,
+                    "stage_item_input2_id": input2.id,
+                    "court_id": court.id,
+                }
+            )
+        ) as match,
+    ):
+        matches_csv = await send_request_raw(
+            HTTPMethod.GET,
+            f"tournaments/{tournament_id}/exports/matches?format=csv",
+            auth_context.headers,
+        )
+        assert matches_csv.splitlines() == [
+            "match_id,stage,stage_item,round,team1,team2,team1_score,team2_score,court,start_time",
+            f"{match.id},Group Stage,Group A,Round 1,Team 1,Team 2,11,22,Court 1,"
+            "2022-01-11T04:32:11+00:00",
+        ]
+
+        standings_ndjson = await send_request_raw(
+            HTTPMethod.GET,
+            f"tournaments/{tournament_id}/exports/standings?format=ndjson",
+            auth_context.headers,
+        )
+        standings = [json.loads(line) for line in standings_ndjson.splitlines()]
+        assert [(row["position"], row["team"]) for row in standings] == [
+            (1, "Team 1"),
+            (1, "Team 2"),
+        ]
+
+        schedule_ndjson = await send_request_raw(
+            HTTPMethod.GET,
+            f"tournaments/{tournament_id}/exports/schedule?format=ndjson",
+            auth_context.headers,
+        )
+        [schedule_row] = [json.loads(line) for line in schedule_ndjson.splitlines()]
+        assert schedule_row["court"] == "Court 1"
+        assert schedule_row["duration_minutes"] == 10
@@ -58,7 +58,11 @@ async def test_create_match(
         ) as stage_item_inserted,
         inserted_round(
             DUMMY_ROUND1.model_copy(
-                update={"stage_item_id": stage_item_inserted.id, "is_draft": True}
+                update={
+                    "tournament_id": auth_context.tournament.id,
+                    "stage_item_id": stage_item_inserted.id,
+                    "is_draft": True,
+                }
             )
         ) as round_inserted,
         inserted_team(
@@ -104,7 +108,11 @@ async def test_delete_match(
         ) as stage_item_inserted,
         inserted_round(
             DUMMY_ROUND1.model_copy(
-                update={"stage_item_id": stage_item_inserted.id, "is_draft": True}
+                update={
+                    "tournament_id": auth_context.tournament.id,
+                    "stage_item_id": stage_item_inserted.id,
+                    "is_draft": True,
+                }
             )
         ) as round_inserted,
         inserted_team(
@@ -136,6 +144,7 @@ async def test_delete_match(
             DUMMY_MATCH1.model_copy(
                 update={
                     "round_id": round_inserted.id,
+                    "tournament_id": auth_context.tournament.id,
                     "stage_item_input1_id": stage_item_input1_inserted.id,
                     "stage_item_input2_id": stage_item_input2_inserted.id,
                     "court_id": court1_inserted.id,
@@ -166,7 +175,12 @@ async def test_update_match(
             )
         ) as stage_item_inserted,
         inserted_round(
-            DUMMY_ROUND1.model_copy(update={"stage_item_id": stage_item_inserted.id})
+            DUMMY_ROUND1.model_copy(
+                update={
+                    "tournament_id": auth_context.tournament.id,
+                    "stage_item_id": stage_item_inserted.id,
+                }
+            )
         ) as round_inserted,
         inserted_team(
             DUMMY_TEAM1.model_copy(update={"tournament_id": auth_context.tournament.id})
@@ -197,6 +211,7 @@ async def test_update_match(
             DUMMY_MATCH1.model_copy(
                 update={
                     "round_id": round_inserted.id,
+                    "tournament_id": auth_context.tournament.id,
                     "stage_item_input1_id": stage_item_input1_inserted.id,
                     "stage_item_input2_id": stage_item_input2_inserted.id,
                     "court_id": court1_inserted.id,
@@ -246,7 +261,12 @@ async def test_update_endpoint_custom_duration_margin(
             )
         ) as stage_item_inserted,
         inserted_round(
-            DUMMY_ROUND1.model_copy(update={"stage_item_id": stage_item_inserted.id})
+            DUMMY_ROUND1.model_copy(
+                update={
+                    "tournament_id": auth_context.tournament.id,
+                    "stage_item_id": stage_item_inserted.id,
+                }
+            )
         ) as round_inserted,
         inserted_team(
             DUMMY_TEAM1.model_copy(update={"tournament_id": auth_context.tournament.id})
@@ -277,6 +297,7 @@ async def test_update_endpoint_custom_duration_margin(
             DUMMY_MATCH1.model_copy(
                 update={
                     "round_id": round_inserted.id,
+                    "tournament_id": auth_context.tournament.id,
                     "stage_item_input1_id": stage_item_input1_inserted.id,
                     "stage_item_input2_id": stage_item_input2_inserted.id,
                     "court_id": court1_inserted.id,
@@ -340,6 +361,7 @@ async def test_upcoming_matches_endpoint(
         inserted_round(
             DUMMY_ROUND1.model_copy(
                 update={
+                    "tournament_id": auth_context.tournament.id,
                     "is_draft": True,
                     "stage_item_id": stage_item_inserted.id,
                 }
@@ -1,10 +1,95 @@
+import asyncio
+from unittest.mock import patch
+
+import aiohttp
 import pytest
 
+from bracket.config import config
+from bracket.database import InstrumentedPostgresBackend, database
+from bracket.models.metrics import DB_QUERY_PLANNING_SECONDS
 from bracket.utils.http import HTTPMethod
-from tests.integration_tests.api.shared import send_request_raw
+from tests.integration_tests.api.shared import (
+    get_root_uvicorn_url,
+    send_auth_request,
+    send_request_raw,
+)
+from tests.integration_tests.models import AuthContext
 
 
 @pytest.mark.asyncio(loop_scope="session")
 async def test_metrics_endpoint(startup_and_shutdown_uvicorn_server: None) -> None:
+    await send_request_raw(HTTPMethod.GET, "ping")
     text_response = await send_request_raw(HTTPMethod.GET, "metrics")
     assert "HELP bracket_response_time" in text_response
+    assert "# TYPE bracket_response_time_seconds histogram" in text_response
+    assert (
+        'bracket_response_time_seconds_bucket{url="/ping",method="GET",status="200",le="+Inf"}'
+        in text_response
+    )
+    assert (
+        'bracket_response_time_seconds_count{url="/ping",method="GET",status="200"}'
+        in text_response
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_database_query_timing(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    async with aiohttp.ClientSession() as session:
+        async with session.get(
+            f"{get_root_uvicorn_url()}tournaments/{auth_context.tournament.id}/courts",
+            headers=auth_context.headers,
+        ) as resp:
+            server_timing = resp.headers["Server-Timing"]
+
+    assert server_timing.startswith("db;dur=")
+    assert "db.get_all_courts_in_tournament;dur=" in server_timing
+
+    text_response = await send_request_raw(HTTPMethod.GET, "metrics")
+    assert 'bracket_db_query_seconds_count{query="get_all_courts_in_tournament"}' in text_response
+    assert (
+        'bracket_db_queries_per_request_count{url="/tournaments/{tournament_id}/courts",'
+        'method="GET"}'
+    ) in text_response
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_database_pool_metrics(startup_and_shutdown_uvicorn_server: None) -> None:
+    await send_request_raw(HTTPMethod.GET, "ping")
+    text_response = await send_request_raw(HTTPMethod.GET, "metrics")
+    assert (
+        f'bracket_db_pool_max_size{{pool="primary"}} {float(config.pg_pool_max_size)}'
+        in text_response
+    )
+    assert 'bracket_db_pool_in_use{pool="primary"} ' in text_response
+    assert 'bracket_db_pool_acquire_seconds_count{pool="primary"} ' in text_response
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_query_planning_time(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    with patch("bracket.database.planning_time_sampled_at", {}):
+        await send_auth_request(
+            HTTPMethod.GET, f"tournaments/{auth_context.tournament.id}", auth_context
+        )
+
+    # The planning time is sampled in the background.
+    sample = 'bracket_db_query_planning_seconds_count{query="sql_get_tournament"}'
+    for _ in range(50):
+        if sample in await send_request_raw(HTTPMethod.GET, "metrics"):
+            break
+        await asyncio.sleep(0.01)
+    else:
+        pytest.fail("The planning time was not sampled")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_query_planning_time_sample_failure_is_ignored(
+    startup_and_shutdown_uvicorn_server: None,
+) -> None:
+    backend = database._backend
+    assert isinstance(backend, InstrumentedPostgresBackend)
+    await backend.sample_planning_time("missing_table", "SELECT * FROM missing_table", [])
+    assert ("missing_table",) not in DB_QUERY_PLANNING_SECONDS.values
@@ -1,10 +1,17 @@
+import aiohttp
 import pytest
 
 from bracket.database import database
 from bracket.models.db.player import Player
 from bracket.schema import players
 from bracket.utils.db import fetch_one_parsed_certain
-from bracket.utils.dummy_records import DUMMY_MOCK_TIME, DUMMY_PLAYER1, DUMMY_TEAM1
+from bracket.utils.dummy_records import (
+    DUMMY_MOCK_TIME,
+    DUMMY_PLAYER1,
+    DUMMY_PLAYER2,
+    DUMMY_PLAYER3,
+    DUMMY_TEAM1,
+)
 from bracket.utils.http import HTTPMethod
 from tests.integration_tests.api.shared import SUCCESS_RESPONSE, send_tournament_request
 from tests.integration_tests.models import AuthContext
@@ -38,10 +45,40 @@ async def test_players_endpoint(
                         }
                     ],
                     "count": 1,
+                    "next_cursor": None,
                 },
             }
 
 
+@pytest.mark.asyncio(loop_scope="session")
+async def test_players_endpoint_cursor_pagination(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    tournament_id = auth_context.tournament.id
+    async with (
+        inserted_player(DUMMY_PLAYER1.model_copy(update={"tournament_id": tournament_id})) as p1,
+        inserted_player(DUMMY_PLAYER2.model_copy(update={"tournament_id": tournament_id})) as p2,
+        inserted_player(DUMMY_PLAYER3.model_copy(update={"tournament_id": tournament_id})) as p3,
+    ):
+        # All players have the same `created`, so the order within it is decided by the ID.
+        endpoint = "players?sort_by=created&sort_direction=desc&limit=2&include_count=false"
+        first_page = await send_tournament_request(HTTPMethod.GET, endpoint, auth_context)
+        assert [player["id"] for player in first_page["data"]["players"]] == [p3.id, p2.id]
+        assert first_page["data"]["count"] is None
+
+        cursor = first_page["data"]["next_cursor"]
+        second_page = await send_tournament_request(
+            HTTPMethod.GET, f"{endpoint}&cursor={cursor}", auth_context
+        )
+        assert [player["id"] for player in second_page["data"]["players"]] == [p1.id]
+        assert second_page["data"]["next_cursor"] is None
+
+        response = await send_tournament_request(
+            HTTPMethod.GET, f"players?sort_by=name&cursor={cursor}", auth_context
+        )
+        assert response == {"detail": "Pagination cursor was created for a different sort order"}
+
+
 @pytest.mark.asyncio(loop_scope="session")
 async def test_create_player(
     startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
@@ -64,6 +101,33 @@ async def test_create_players(
     await assert_row_count_and_clear(players, 2)
 
 
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_players_from_file(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    data = aiohttp.FormData()
+    data.add_field("file", b"Player x\r\nPlayer, y\r\n\r\n", filename="players.csv")
+    data.add_field("active", "true")
+    response = await send_tournament_request(HTTPMethod.POST, "players_import", auth_context, data)
+    assert response == SUCCESS_RESPONSE
+
+    names = await database.fetch_all("SELECT name FROM players ORDER BY name")
+    assert [row.name for row in names] == ["Player x", "Player, y"]
+    await assert_row_count_and_clear(players, 2)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_players_from_file_rejects_invalid_utf8(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    data = aiohttp.FormData()
+    data.add_field("file", b"Player x\n\xff", filename="players.csv")
+    data.add_field("active", "true")
+    response = await send_tournament_request(HTTPMethod.POST, "players_import", auth_context, data)
+    assert response == {"detail": "The file is not valid UTF-8"}
+    await assert_row_count_and_clear(players, 0)
+
+
 @pytest.mark.asyncio(loop_scope="session")
 async def test_delete_player(
     startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
@@ -0,0 +1,31 @@
+from unittest.mock import patch
+
+import pytest
+
+from bracket.utils.http import HTTPMethod
+from tests.integration_tests.api.shared import send_auth_request
+from tests.integration_tests.models import AuthContext
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_profile_requires_admin(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    assert await send_auth_request(HTTPMethod.GET, "profile?seconds=0.1", auth_context) == {
+        "detail": "Only the admin user can access this endpoint"
+    }
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_profile_speedscope(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    with patch("bracket.routes.auth.config.admin_email", auth_context.user.email):
+        response = await send_auth_request(
+            HTTPMethod.GET, "profile?seconds=0.2&format=speedscope", auth_context
+        )
+
+    assert response["exporter"] == "bracket"
+    [profile] = response["profiles"]
+    assert profile["type"] == "sampled"
+    assert len(profile["samples"]) == len(profile["weights"]) > 0
@@ -0,0 +1,33 @@
+import pytest
+
+from bracket.sql.quotas import (
+    TOURNAMENT_QUOTA_QUERIES,
+    sql_count_clubs_of_user,
+    sql_count_for_tournament_quota,
+    sql_count_tournaments_in_club,
+)
+from bracket.utils.dummy_records import DUMMY_PLAYER1
+from tests.integration_tests.models import AuthContext
+from tests.integration_tests.sql import inserted_player
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_quota_counts(auth_context: AuthContext) -> None:
+    tournament_id = auth_context.tournament.id
+    async with inserted_player(DUMMY_PLAYER1.model_copy(update={"tournament_id": tournament_id})):
+        counts = {
+            attribute: await sql_count_for_tournament_quota(tournament_id, attribute)
+            for attribute in TOURNAMENT_QUOTA_QUERIES
+        }
+
+    assert counts == {
+        "max_teams": 0,
+        "max_players": 1,
+        "max_courts": 0,
+        "max_rankings": 1,
+        "max_stages": 0,
+        "max_stage_items": 0,
+        "max_rounds": 0,
+    }
+    assert await sql_count_tournaments_in_club(auth_context.club.id) == 1
+    assert await sql_count_clubs_of_user(auth_context.user.id) == 1
@@ -0,0 +1,94 @@
+# pylint: disable=redefined-outer-name
+from collections.abc import AsyncIterator
+
+import aiohttp
+import pytest
+import pytest_asyncio
+
+from bracket.config import config
+from bracket.database import (
+    READ_PRIMARY_COOKIE,
+    InstrumentedDatabase,
+    create_postgres_database_instance,
+    database,
+    use_read_replica,
+)
+from bracket.logic.auth_cache import auth_cache
+from bracket.models.metrics import DB_POOL_ACQUIRE_SECONDS
+from bracket.sql.users import get_user_access_to_tournament
+from bracket.utils.id_types import TournamentId
+from tests.integration_tests.api.shared import get_root_uvicorn_url
+from tests.integration_tests.models import AuthContext
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def read_replica() -> AsyncIterator[InstrumentedDatabase]:
+    # The primary doubles as replica, the pool metrics tell which one served the reads.
+    replica = create_postgres_database_instance(str(config.pg_dsn), "replica")
+    await replica.connect()
+    database.read_replica = replica
+    try:
+        yield replica
+    finally:
+        database.read_replica = None
+        await replica.disconnect()
+
+
+def get_replica_acquire_count() -> float:
+    counts = DB_POOL_ACQUIRE_SECONDS.values.get(("replica",), [0.0])
+    assert isinstance(counts, list)
+    return sum(counts[:-1])
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_reads_use_primary_after_a_write_by_the_same_client(
+    startup_and_shutdown_uvicorn_server: None,
+    auth_context: AuthContext,
+    read_replica: InstrumentedDatabase,
+) -> None:
+    courts_url = f"{get_root_uvicorn_url()}tournaments/{auth_context.tournament.id}/courts"
+
+    # The test server runs on an IP address, from which aiohttp only accepts cookies when unsafe.
+    async with aiohttp.ClientSession(
+        headers=auth_context.headers, cookie_jar=aiohttp.CookieJar(unsafe=True)
+    ) as session:
+        acquire_count = get_replica_acquire_count()
+        async with session.get(courts_url) as response:
+            assert await response.json() == {"data": []}
+        assert get_replica_acquire_count() > acquire_count
+
+        # Any write sets the cookie, also one outside of a tournament and one that fails.
+        async with session.delete(f"{get_root_uvicorn_url()}clubs/-1") as response:
+            assert READ_PRIMARY_COOKIE in response.cookies
+
+        acquire_count = get_replica_acquire_count()
+        async with session.get(courts_url) as response:
+            assert await response.json() == {"data": []}
+        assert get_replica_acquire_count() == acquire_count
+
+    # Other clients keep reading from the replica.
+    async with aiohttp.ClientSession(headers=auth_context.headers) as session:
+        async with session.get(courts_url) as response:
+            assert await response.json() == {"data": []}
+        assert get_replica_acquire_count() > acquire_count
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_access_checks_read_from_primary_and_only_cache_granted_access(
+    auth_context: AuthContext, read_replica: InstrumentedDatabase
+) -> None:
+    user_id, tournament_id = auth_context.user.id, auth_context.tournament.id
+    other_tournament_id = TournamentId(-1)
+    auth_cache.clear()
+
+    token = use_read_replica.set(True)
+    try:
+        acquire_count = get_replica_acquire_count()
+        assert await get_user_access_to_tournament(tournament_id, user_id)
+        assert not await get_user_access_to_tournament(other_tournament_id, user_id)
+        assert get_replica_acquire_count() == acquire_count
+    finally:
+        use_read_replica.reset(token)
+
+    assert auth_cache.tournament_access.get((user_id, tournament_id)) is True
+    assert auth_cache.tournament_access.get((user_id, other_tournament_id)) is None
@@ -43,7 +43,12 @@ async def test_reschedule_match(
             )
         ) as stage_item_inserted,
         inserted_round(
-            DUMMY_ROUND1.model_copy(update={"stage_item_id": stage_item_inserted.id})
+            DUMMY_ROUND1.model_copy(
+                update={
+                    "tournament_id": auth_context.tournament.id,
+                    "stage_item_id": stage_item_inserted.id,
+                }
+            )
         ) as round_inserted,
         inserted_team(
             DUMMY_TEAM1.model_copy(update={"tournament_id": auth_context.tournament.id})
@@ -77,6 +82,7 @@ async def test_reschedule_match(
             DUMMY_MATCH1.model_copy(
                 update={
                     "round_id": round_inserted.id,
+                    "tournament_id": auth_context.tournament.id,
                     "stage_item_input1_id": stage_item_input1_inserted.id,
                     "stage_item_input2_id": stage_item_input2_inserted.id,
                     "court_id": court1_inserted.id,
@@ -1,12 +1,15 @@
 import pytest
+from fastapi import HTTPException
 
 from bracket.database import database
 from bracket.models.db.round import Round
 from bracket.models.db.stage_item import StageType
+from bracket.routes.util import round_dependency
 from bracket.schema import rounds
 from bracket.utils.db import fetch_one_parsed_certain
 from bracket.utils.dummy_records import DUMMY_ROUND1, DUMMY_STAGE1, DUMMY_STAGE_ITEM1, DUMMY_TEAM1
 from bracket.utils.http import HTTPMethod
+from bracket.utils.id_types import TournamentId
 from tests.integration_tests.api.shared import SUCCESS_RESPONSE, send_tournament_request
 from tests.integration_tests.models import AuthContext
 from tests.integration_tests.sql import (
@@ -64,7 +67,12 @@ async def test_delete_round(
             )
         ) as stage_item_inserted,
         inserted_round(
-            DUMMY_ROUND1.model_copy(update={"stage_item_id": stage_item_inserted.id})
+            DUMMY_ROUND1.model_copy(
+                update={
+                    "tournament_id": auth_context.tournament.id,
+                    "stage_item_id": stage_item_inserted.id,
+                }
+            )
         ) as round_inserted,
     ):
         assert (
@@ -92,7 +100,12 @@ async def test_update_round(
             )
         ) as stage_item_inserted,
         inserted_round(
-            DUMMY_ROUND1.model_copy(update={"stage_item_id": stage_item_inserted.id})
+            DUMMY_ROUND1.model_copy(
+                update={
+                    "tournament_id": auth_context.tournament.id,
+                    "stage_item_id": stage_item_inserted.id,
+                }
+            )
         ) as round_inserted,
     ):
         assert (
@@ -108,3 +121,28 @@ async def test_update_round(
         assert updated_round.is_draft == body["is_draft"]
 
         await assert_row_count_and_clear(rounds, 1)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_round_dependency_checks_tournament(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    tournament_id = auth_context.tournament.id
+    async with (
+        inserted_stage(DUMMY_STAGE1.model_copy(update={"tournament_id": tournament_id})) as stage,
+        inserted_stage_item(
+            DUMMY_STAGE_ITEM1.model_copy(
+                update={"stage_id": stage.id, "ranking_id": auth_context.ranking.id}
+            )
+        ) as stage_item,
+        inserted_round(
+            DUMMY_ROUND1.model_copy(
+                update={"tournament_id": tournament_id, "stage_item_id": stage_item.id}
+            )
+        ) as round_inserted,
+    ):
+        assert (await round_dependency(tournament_id, round_inserted.id)).id == round_inserted.id
+
+        with pytest.raises(HTTPException) as exc_info:
+            await round_dependency(TournamentId(tournament_id + 1), round_inserted.id)
+        assert exc_info.value.status_code == 404
@@ -86,11 +86,12 @@ async def send_request(
             return response
 
 
-async def send_request_raw(method: HTTPMethod, endpoint: str) -> str:
+async def send_request_raw(method: HTTPMethod, endpoint: str, headers: JsonDict = {}) -> str:
     async with aiohttp.ClientSession() as session:
         async with session.request(
             method=method.value,
             url=get_root_uvicorn_url() + endpoint,
+            headers=headers,
         ) as resp:
             return await resp.text()
 
@@ -42,7 +42,12 @@ async def test_stages_endpoint(
             )
         ) as stage_item_inserted,
         inserted_round(
-            DUMMY_ROUND1.model_copy(update={"stage_item_id": stage_item_inserted.id})
+            DUMMY_ROUND1.model_copy(
+                update={
+                    "tournament_id": auth_context.tournament.id,
+                    "stage_item_id": stage_item_inserted.id,
+                }
+            )
         ) as round_inserted,
     ):
         if with_auth:
@@ -73,6 +78,7 @@ async def test_stages_endpoint(
                                 {
                                     "id": round_inserted.id,
                                     "stage_item_id": stage_item_inserted.id,
+                                    "tournament_id": auth_context.tournament.id,
                                     "created": DUMMY_MOCK_TIME.isoformat().replace("+00:00", "Z"),
                                     "is_draft": False,
                                     "name": "Round 1",
@@ -4,7 +4,7 @@ import pytest
 
 from bracket.database import database
 from bracket.models.db.team import Team
-from bracket.schema import players, teams
+from bracket.schema import players, players_x_teams, teams
 from bracket.utils.db import fetch_one_parsed_certain
 from bracket.utils.dummy_records import DUMMY_MOCK_TIME, DUMMY_TEAM1
 from bracket.utils.http import HTTPMethod
@@ -39,6 +39,7 @@ async def test_teams_endpoint(
                     }
                 ],
                 "count": 1,
+                "next_cursor": None,
             },
         }
 
@@ -66,6 +67,68 @@ async def test_create_teams(
     await assert_row_count_and_clear(players, 3)
 
 
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_teams_links_players(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    body = {"names": "Team -1,Player 42,Player 43\n\nTeam -2,Player 44", "active": True}
+    await send_tournament_request(HTTPMethod.POST, "teams_multi", auth_context, None, body)
+
+    query = """
+        SELECT teams.name AS team_name, players.name AS player_name
+        FROM players_x_teams
+        JOIN teams ON teams.id = players_x_teams.team_id
+        JOIN players ON players.id = players_x_teams.player_id
+        ORDER BY players.name
+        """
+    links = [(row.team_name, row.player_name) for row in await database.fetch_all(query)]
+    assert links == [
+        ("Team -1", "Player 42"),
+        ("Team -1", "Player 43"),
+        ("Team -2", "Player 44"),
+    ]
+    await assert_row_count_and_clear(players_x_teams, 3)
+    await assert_row_count_and_clear(teams, 2)
+    await assert_row_count_and_clear(players, 3)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_teams_reports_invalid_rows(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    body = {"names": f"Team -1,Player 42\n,Player 43\nTeam -3,{'x' * 31}", "active": True}
+    response = await send_tournament_request(
+        HTTPMethod.POST, "teams_multi", auth_context, None, body
+    )
+    # The frontend shows a string `detail` as the message of the error notification.
+    assert response == {
+        "detail": (
+            "Row 2: String should have at least 1 character: ''\n"
+            f"Row 3: String should have at most 30 characters: '{'x' * 31}'"
+        )
+    }
+    assert await database.fetch_val("SELECT COUNT(*) FROM teams") == 0
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_teams_from_file(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    data = aiohttp.FormData()
+    data.add_field(
+        "file", "\ufeffTeam -1,Player 42,Player 43\nTeam -2,".encode(), filename="teams.csv"
+    )
+    data.add_field("active", "true")
+    response = await send_tournament_request(HTTPMethod.POST, "teams_import", auth_context, data)
+    assert response == SUCCESS_RESPONSE
+
+    team_names = await database.fetch_all("SELECT name FROM teams ORDER BY name")
+    assert [row.name for row in team_names] == ["Team -1", "Team -2"]
+    await assert_row_count_and_clear(players_x_teams, 2)
+    await assert_row_count_and_clear(teams, 2)
+    await assert_row_count_and_clear(players, 2)
+
+
 @pytest.mark.asyncio(loop_scope="session")
 async def test_delete_team(
     startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
@@ -1,3 +1,5 @@
+import asyncio
+
 import aiofiles
 import aiofiles.os
 import aiohttp
@@ -9,7 +11,14 @@ from bracket.models.db.tournament import Tournament, TournamentStatus
 from bracket.schema import tournaments
 from bracket.sql.tournaments import sql_delete_tournament, sql_get_tournament_by_endpoint_name
 from bracket.utils.db import fetch_one_parsed_certain
-from bracket.utils.dummy_records import DUMMY_MOCK_TIME, DUMMY_TOURNAMENT
+from bracket.utils.dummy_records import (
+    DUMMY_COURT1,
+    DUMMY_MOCK_TIME,
+    DUMMY_RANKING1,
+    DUMMY_STAGE1,
+    DUMMY_TEAM1,
+    DUMMY_TOURNAMENT,
+)
 from bracket.utils.http import HTTPMethod
 from bracket.utils.types import assert_some
 from tests.integration_tests.api.shared import (
@@ -18,7 +27,13 @@ from tests.integration_tests.api.shared import (
     send_tournament_request,
 )
 from tests.integration_tests.models import AuthContext
-from tests.integration_tests.sql import inserted_tournament
+from tests.integration_tests.sql import (
+    inserted_court,
+    inserted_ranking,
+    inserted_stage,
+    inserted_team,
+    inserted_tournament,
+)
 
 
 @pytest.mark.asyncio(loop_scope="session")
@@ -194,6 +209,65 @@ async def test_delete_tournament(
     await sql_delete_tournament(tournament_inserted.id)
 
 
+@pytest.mark.asyncio(loop_scope="session")
+async def test_delete_tournament_completely(
+    startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
+) -> None:
+    logo_paths = [
+        "static/tournament-logos/deleted-tournament.png",
+        "static/team-logos/deleted-tournament-team.png",
+    ]
+    for logo_path in logo_paths:
+        await aiofiles.os.makedirs(logo_path.rsplit("/", 1)[0], exist_ok=True)
+        async with aiofiles.open(logo_path, "wb") as f:
+            await f.write(b"logo")
+
+    async with inserted_tournament(
+        DUMMY_TOURNAMENT.model_copy(
+            update={
+                "club_id": auth_context.club.id,
+                "dashboard_endpoint": None,
+                "logo_path": "deleted-tournament.png",
+            }
+        )
+    ) as tournament:
+        tournament_id = tournament.id
+        async with (
+            inserted_ranking(DUMMY_RANKING1.model_copy(update={"tournament_id": tournament_id})),
+            inserted_stage(DUMMY_STAGE1.model_copy(update={"tournament_id": tournament_id})),
+            inserted_court(DUMMY_COURT1.model_copy(update={"tournament_id": tournament_id})),
+            inserted_team(
+                DUMMY_TEAM1.model_copy(
+                    update={
+                        "tournament_id": tournament_id,
+                        "logo_path": "deleted-tournament-team.png",
+                    }
+                )
+            ),
+        ):
+            await sql_delete_tournament_completely(tournament_id)
+
+            for table in ("rankings", "stages", "courts", "teams"):
+                query = f"SELECT COUNT(*) FROM {table} WHERE tournament_id = :tournament_id"
+                assert await database.fetch_val(query, {"tournament_id": tournament_id}) == 0
+
+            assert (
+                await database.fetch_val(
+                    "SELECT COUNT(*) FROM tournaments WHERE id = :id", {"id": tournament_id}
+                )
+                == 0
+            )
+
+    # The logos are removed in the background
+    for _ in range(100):
+        if not any([await aiofiles.os.path.exists(logo_path) for logo_path in logo_paths]):
+            break
+        await asyncio.sleep(0.01)
+
+    for logo_path in logo_paths:
+        assert not await aiofiles.os.path.exists(logo_path)
+
+
 @pytest.mark.asyncio(loop_scope="session")
 async def test_tournament_upload_and_remove_logo(
     startup_and_shutdown_uvicorn_server: None, auth_context: AuthContext
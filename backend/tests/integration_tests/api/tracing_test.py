@@ -0,0 +1,32 @@
+import json
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from bracket.utils.http import HTTPMethod
+from tests.integration_tests.api.shared import send_tournament_request
+from tests.integration_tests.models import AuthContext
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_slow_request_is_logged_with_trace(
+    startup_and_shutdown_uvicorn_server: None,
+    auth_context: AuthContext,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    with (
+        patch("bracket.utils.tracing.config.slow_request_threshold", 0.0),
+        caplog.at_level(logging.WARNING, logger="bracket"),
+    ):
+        await send_tournament_request(HTTPMethod.GET, "courts", auth_context)
+
+    [record] = [record for record in caplog.records if record.message.startswith("Slow request: ")]
+    trace = json.loads(record.message.removeprefix("Slow request: "))
+    assert trace["route"] == "/tournaments/{tournament_id}/courts"
+    assert trace["method"] == "GET"
+    assert {"auth", "db", "dependencies", "endpoint", "serialization"} <= set(trace["phases_ms"])
+    span_names = {span["name"] for span in trace["spans"]}
+    assert "auth.check_jwt_and_get_user" in span_names
+    assert "auth.get_user_access_to_tournament" in span_names
+    assert "db.get_all_courts_in_tournament" in span_names
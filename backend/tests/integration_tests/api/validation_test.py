@@ -0,0 +1,51 @@
+import pytest
+from fastapi import HTTPException
+
+from bracket.models.db.match import MatchBody
+from bracket.sql.validation import check_foreign_keys_belong_to_tournament
+from bracket.utils.dummy_records import (
+    DUMMY_COURT1,
+    DUMMY_ROUND1,
+    DUMMY_STAGE1,
+    DUMMY_STAGE_ITEM1,
+)
+from bracket.utils.id_types import CourtId, TournamentId
+from tests.integration_tests.models import AuthContext
+from tests.integration_tests.sql import (
+    inserted_court,
+    inserted_round,
+    inserted_stage,
+    inserted_stage_item,
+)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_check_foreign_keys_belong_to_tournament(auth_context: AuthContext) -> None:
+    tournament_id = auth_context.tournament.id
+    async with (
+        inserted_court(DUMMY_COURT1.model_copy(update={"tournament_id": tournament_id})) as court,
+        inserted_stage(DUMMY_STAGE1.model_copy(update={"tournament_id": tournament_id})) as stage,
+        inserted_stage_item(
+            DUMMY_STAGE_ITEM1.model_copy(
+                update={"stage_id": stage.id, "ranking_id": auth_context.ranking.id}
+            )
+        ) as stage_item,
+        inserted_round(
+            DUMMY_ROUND1.model_copy(
+                update={"tournament_id": tournament_id, "stage_item_id": stage_item.id}
+            )
+        ) as round_,
+    ):
+        await check_foreign_keys_belong_to_tournament(
+            MatchBody(round_id=round_.id, court_id=court.id), tournament_id
+        )
+
+        with pytest.raises(HTTPException, match="Could not find Court\\(s\\) with ID -1"):
+            await check_foreign_keys_belong_to_tournament(
+                MatchBody(round_id=round_.id, court_id=CourtId(-1)), tournament_id
+            )
+
+        with pytest.raises(HTTPException, match=f"Could not find Round\\(s\\) with ID {round_.id}"):
+            await check_foreign_keys_belong_to_tournament(
+                MatchBody(round_id=round_.id, court_id=court.id), TournamentId(-1)
+            )
@@ -1,9 +1,28 @@
+from unittest.mock import patch
+
 import pytest
 
 from bracket.cronjobs.scheduling import delete_demo_accounts
+from bracket.database import database
 from bracket.models.db.account import UserAccountType
+from bracket.models.db.user_x_club import UserXClubInsertable, UserXClubRelation
+from bracket.models.metrics import DEMO_PURGE_ROWS
 from bracket.sql.users import get_user_by_id, update_user_account_type
-from tests.integration_tests.sql import inserted_auth_context
+from bracket.utils.dummy_records import DUMMY_CLUB, DUMMY_TEAM1
+from tests.integration_tests.mocks import get_mock_user
+from tests.integration_tests.sql import (
+    inserted_auth_context,
+    inserted_club,
+    inserted_team,
+    inserted_user,
+    inserted_user_x_club,
+)
+
+
+def get_purged_rows(table: str) -> float:
+    value = DEMO_PURGE_ROWS.values.get((table,), 0.0)
+    assert not isinstance(value, list)
+    return value
 
 
 @pytest.mark.asyncio(loop_scope="session")
@@ -15,3 +34,44 @@ async def test_delete_demo_accounts() -> None:
         assert await get_user_by_id(user_id) is not None
         await delete_demo_accounts()
         assert await get_user_by_id(user_id) is None
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_delete_demo_accounts_in_batches() -> None:
+    async with (
+        inserted_auth_context() as auth_context,
+        inserted_team(DUMMY_TEAM1.model_copy(update={"tournament_id": auth_context.tournament.id})),
+        inserted_user(get_mock_user()) as user_without_tournaments,
+        inserted_club(DUMMY_CLUB) as club_without_tournaments,
+        inserted_user_x_club(
+            UserXClubInsertable(
+                user_id=user_without_tournaments.id,
+                club_id=club_without_tournaments.id,
+                relation=UserXClubRelation.OWNER,
+            )
+        ),
+    ):
+        for user_id in (auth_context.user.id, user_without_tournaments.id):
+            await update_user_account_type(user_id, UserAccountType.DEMO)
+
+        users_purged = get_purged_rows("users")
+        teams_purged = get_purged_rows("teams")
+
+        # With an exhausted time budget, a run still deletes one batch.
+        with (
+            patch("bracket.cronjobs.scheduling.config.demo_purge_batch_size", 1),
+            patch("bracket.cronjobs.scheduling.config.demo_purge_time_budget", 0.0),
+        ):
+            await delete_demo_accounts()
+            assert await get_user_by_id(auth_context.user.id) is None
+            assert await get_user_by_id(user_without_tournaments.id) is not None
+
+            await delete_demo_accounts()
+            assert await get_user_by_id(user_without_tournaments.id) is None
+
+        for club_id in (auth_context.club.id, club_without_tournaments.id):
+            query = "SELECT COUNT(*) FROM clubs WHERE id = :club_id"
+            assert await database.fetch_val(query, {"club_id": club_id}) == 0
+
+        assert get_purged_rows("users") == users_purged + 2
+        assert get_purged_rows("teams") == teams_purged + 1
@@ -0,0 +1,64 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from heliclockter import timedelta
+
+from bracket.cronjobs.scheduler import (
+    CRONJOBS_LEADER_LOCK_KEY,
+    CronJob,
+    run_cronjob,
+    run_scheduler,
+)
+from bracket.database import database
+from bracket.models.metrics import CRONJOB_FAILURES, CRONJOB_LAST_RUN
+
+
+async def failing_job() -> None:
+    raise ValueError("Job failed")
+
+
+async def try_acquire_lock() -> bool:
+    query = "SELECT pg_try_advisory_lock(:key)"
+    return bool(await database.fetch_val(query, {"key": CRONJOBS_LEADER_LOCK_KEY}))
+
+
+async def release_lock() -> None:
+    await database.fetch_val("SELECT pg_advisory_unlock(:key)", {"key": CRONJOBS_LEADER_LOCK_KEY})
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_run_cronjob_records_failures() -> None:
+    job = CronJob(entrypoint=failing_job, interval=timedelta(minutes=5))
+    assert (job.name,) not in CRONJOB_FAILURES.values
+
+    await run_cronjob(job)
+
+    assert CRONJOB_FAILURES.values[(job.name,)] == 1
+    assert (job.name,) in CRONJOB_LAST_RUN.values
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_scheduler_only_runs_jobs_on_leader() -> None:
+    entrypoint = AsyncMock(__name__="mock_job")
+    job = CronJob(entrypoint=entrypoint, interval=timedelta(seconds=0))
+
+    with patch("bracket.cronjobs.scheduler.config.cronjob_leader_check_interval", 0.01):
+        async with database.connection():
+            # Another worker holds the lock, so this scheduler must not run the job.
+            assert await try_acquire_lock()
+            scheduler = asyncio.create_task(run_scheduler([job]))
+            try:
+                await asyncio.sleep(0.1)
+                entrypoint.assert_not_called()
+
+                await release_lock()
+                await asyncio.sleep(0.1)
+                entrypoint.assert_called()
+            finally:
+                scheduler.cancel()
+                await asyncio.gather(scheduler, return_exceptions=True)
+
+            # The lock is released when the scheduler stops.
+            assert await try_acquire_lock()
+            await release_lock()
@@ -0,0 +1,118 @@
+import json
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bracket.database import database
+from bracket.sql.matches import clear_scores_for_matches_in_stage_item
+from bracket.sql.stages import get_full_tournament_details
+from bracket.utils.id_types import StageItemId, TournamentId
+
+# Tables that grow with the number of tournaments, and must never be scanned entirely to load or
+# update a single tournament.
+LARGE_TABLES = {"matches", "rounds", "stage_items", "stage_item_inputs"}
+
+GENERATE_DATASET_QUERIES = [
+    "INSERT INTO clubs (name) VALUES ('Query plan test club')",
+    """
+    INSERT INTO tournaments (name, start_time, club_id, dashboard_public)
+    SELECT 'Tournament ' || i, now(), (SELECT max(id) FROM clubs), false
+    FROM generate_series(1, 1000) i
+    """,
+    """
+    INSERT INTO rankings (tournament_id, position, win_points, draw_points, loss_points,
+                          add_score_points)
+    SELECT id, 0, 1, 0.5, 0, false FROM tournaments
+    """,
+    "INSERT INTO courts (name, tournament_id) SELECT 'Court', id FROM tournaments",
+    "INSERT INTO stages (name, tournament_id) SELECT 'Stage', id FROM tournaments",
+    """
+    INSERT INTO stage_items (name, stage_id, team_count, ranking_id, type)
+    SELECT 'Stage item ' || i, stages.id, 8, rankings.id, 'ROUND_ROBIN'
+    FROM stages
+    JOIN rankings ON rankings.tournament_id = stages.tournament_id
+    CROSS JOIN generate_series(1, 2) i
+    """,
+    """
+    INSERT INTO stage_item_inputs (slot, tournament_id, stage_item_id)
+    SELECT i, stages.tournament_id, stage_items.id
+    FROM stage_items
+    JOIN stages ON stages.id = stage_items.stage_id
+    CROSS JOIN generate_series(1, 8) i
+    """,
+    """
+    INSERT INTO rounds (name, is_draft, stage_item_id, tournament_id)
+    SELECT 'Round ' || i, false, stage_items.id, stages.tournament_id
+    FROM stage_items
+    JOIN stages ON stages.id = stage_items.stage_id
+    CROSS JOIN generate_series(1, 7) i
+    """,
+    """
+    INSERT INTO matches (
+        round_id, tournament_id, stage_item_input1_id, stage_item_input2_id, court_id,
+        stage_item_input1_conflict, stage_item_input2_conflict,
+        stage_item_input1_score, stage_item_input2_score
+    )
+    SELECT rounds.id, rounds.tournament_id, input1.id, input2.id, courts.id, false, false, 1, 2
+    FROM rounds
+    JOIN stage_items ON stage_items.id = rounds.stage_item_id
+    JOIN stages ON stages.id = stage_items.stage_id
+    JOIN courts ON courts.tournament_id = stages.tournament_id
+    JOIN stage_item_inputs input1
+        ON input1.stage_item_id = stage_items.id AND input1.slot <= 4
+    JOIN stage_item_inputs input2
+        ON input2.stage_item_id = stage_items.id AND input2.slot = input1.slot + 4
+    """,
+    "ANALYZE",
+]
+
+
+def get_sequential_scans(plan: dict[str, Any]) -> set[str]:
+    scans = {plan["Relation Name"]} if plan["Node Type"] == "Seq Scan" else set()
+    for subplan in plan.get("Plans", []):
+        scans |= get_sequential_scans(subplan)
+    return scans
+
+
+def get_captured_queries(mock: AsyncMock) -> list[tuple[str, dict[str, Any]]]:
+    return [(str(call.kwargs["query"]), call.kwargs["values"]) for call in mock.call_args_list]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tournament_tree_queries_use_indexes() -> None:
+    """
+    Generates a thousand tournaments and checks that the queries that load or update a single
+    tournament don't sequentially scan the large tables. The data is rolled back afterwards.
+    """
+    async with database.transaction(force_rollback=True):
+        for query in GENERATE_DATASET_QUERIES:
+            await database.execute(query)
+
+        tournament_id = TournamentId(await database.fetch_val("SELECT max(id) FROM tournaments"))
+        stage_item_id = StageItemId(
+            await database.fetch_val(
+                """
+                SELECT stage_items.id FROM stage_items
+                JOIN stages ON stages.id = stage_items.stage_id
+                WHERE stages.tournament_id = :tournament_id
+                LIMIT 1
+                """,
+                {"tournament_id": tournament_id},
+            )
+        )
+
+        with (
+            patch.object(database, "fetch_all", AsyncMock(return_value=[])) as fetch_all,
+            patch.object(database, "execute", AsyncMock()) as execute,
+        ):
+            await get_full_tournament_details(tournament_id)
+            await clear_scores_for_matches_in_stage_item(tournament_id, stage_item_id)
+
+        queries = get_captured_queries(fetch_all) + get_captured_queries(execute)
+        assert len(queries) == 2
+
+        for query, values in queries:
+            plan = await database.fetch_val(f"EXPLAIN (FORMAT JSON) {query}", values)
+            sequential_scans = get_sequential_scans(json.loads(plan)[0]["Plan"])
+            assert sequential_scans.isdisjoint(LARGE_TABLES), (sequential_scans, query)
@@ -5,6 +5,7 @@ from typing import cast
 from sqlalchemy import Table
 
 from bracket.database import database
+from bracket.logic.auth_cache import auth_cache
 from bracket.models.db.club import Club, ClubInsertable
 from bracket.models.db.court import Court, CourtInsertable
 from bracket.models.db.match import Match, MatchInsertable
@@ -59,11 +60,15 @@ async def inserted_generic(
     data_model: BaseModelT, table: Table, return_type: type[BaseModelT]
 ) -> AsyncIterator[BaseModelT]:
     last_record_id, row_inserted = await insert_generic(database, data_model, table, return_type)
+    # Rows are inserted and deleted without the functions in `bracket.sql` that keep the cache
+    # up to date.
+    auth_cache.clear()
 
     try:
         yield row_inserted
     finally:
         await database.execute(query=table.delete().where(table.c.id == last_record_id))
+        auth_cache.clear()
 
 
 @asynccontextmanager
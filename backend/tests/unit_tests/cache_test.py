@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+from bracket.logic.auth_cache import AuthCache
+from bracket.models.db.account import UserAccountType
+from bracket.models.db.user import UserInDB
+from bracket.utils.cache import LRUCache
+from bracket.utils.dummy_records import DUMMY_MOCK_TIME
+from bracket.utils.id_types import TournamentId, UserId
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_lru_cache_ttl() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_size=2, ttl=10.0)
+    with patch("bracket.utils.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+
+    with patch("bracket.utils.cache.time.monotonic", return_value=109.0):
+        assert cache.get("a") == 1
+
+    with patch("bracket.utils.cache.time.monotonic", return_value=110.0):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_auth_cache_invalidation() -> None:
+    auth_cache = AuthCache(max_size=10, ttl=60.0)
+    user = UserInDB(
+        id=UserId(1),
+        email="user@example.com",
+        name="User",
+        password_hash="hash",
+        created=DUMMY_MOCK_TIME,
+        account_type=UserAccountType.REGULAR,
+    )
+    auth_cache.users.set(user.email, user)
+    auth_cache.tournament_access.set((user.id, TournamentId(1)), True)
+    auth_cache.tournament_access.set((UserId(2), TournamentId(1)), True)
+
+    generation = auth_cache.generation
+    auth_cache.invalidate_user(user.id)
+    assert auth_cache.users.get(user.email) is None
+    assert auth_cache.tournament_access.get((user.id, TournamentId(1))) is None
+    assert auth_cache.tournament_access.get((UserId(2), TournamentId(1))) is True
+
+    # A result fetched before the invalidation must not be cached.
+    auth_cache.set_if_not_invalidated(
+        auth_cache.tournament_access, (user.id, TournamentId(1)), True, generation
+    )
+    assert auth_cache.tournament_access.get((user.id, TournamentId(1))) is None
@@ -1,7 +1,9 @@
+import asyncio
 from datetime import timedelta
 
 from bracket.logic.planning.conflicts import get_conflicting_matches
 from bracket.models.db.util import StageWithStageItems
+from bracket.utils.compute import run_cpu_bound, shutdown_compute_pools
 from bracket.utils.dummy_records import DUMMY_MOCK_TIME
 from bracket.utils.id_types import StageId, TournamentId
 from tests.integration_tests.mocks import MOCK_NOW
@@ -53,3 +55,30 @@ def test_get_conflicting_matches_conflicts_to_clear() -> None:
     )
 
     assert get_conflicting_matches([stage_item]) == ({}, {-1, -2})
+
+
+def test_get_conflicting_matches_in_process_pool() -> None:
+    """
+    Test `get_conflicting_matches` returns the same result when offloaded to the process pool
+    """
+    tournament_id = TournamentId(-1)
+    stage_item_inputs = get_stage_item_inputs_mock(tournament_id)
+    match1, match2 = get_2_definitive_matches_mock(stage_item_inputs)
+    rounds = get_one_round_with_two_definitive_matches(match1, match2)
+    stage_item = StageWithStageItems(
+        id=StageId(-1),
+        tournament_id=tournament_id,
+        name="",
+        created=MOCK_NOW,
+        is_active=False,
+        stage_items=[get_stage_item_mock(stage_item_inputs, [rounds])],
+    )
+
+    try:
+        result = asyncio.run(
+            run_cpu_bound(get_conflicting_matches, [stage_item], size=4, executor_type="process")
+        )
+    finally:
+        shutdown_compute_pools()
+
+    assert result == ({-1: [True, False], -2: [True, False]}, set())
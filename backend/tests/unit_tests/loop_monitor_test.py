@@ -0,0 +1,24 @@
+import asyncio
+import time
+
+from bracket.models.metrics import EVENT_LOOP_BLOCKED, EVENT_LOOP_LAG
+from bracket.utils.loop_monitor import monitor_event_loop, track_in_flight_route
+
+
+def test_monitor_reports_blocking_route() -> None:
+    async def block_event_loop() -> None:
+        monitor = asyncio.create_task(monitor_event_loop())
+        await asyncio.sleep(0.01)
+        with track_in_flight_route("/blocking"):
+            time.sleep(0.5)
+
+        await asyncio.sleep(0.5)
+        monitor.cancel()
+
+    asyncio.run(block_event_loop())
+
+    assert EVENT_LOOP_BLOCKED.values[("/blocking",)] == 1
+    assert EVENT_LOOP_LAG.values[()]
+    assert 'bracket_event_loop_blocked{url="/blocking"} 1' in "".join(
+        EVENT_LOOP_BLOCKED.render(EVENT_LOOP_BLOCKED.values)
+    )
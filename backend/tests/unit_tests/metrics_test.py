@@ -0,0 +1,90 @@
+import json
+import os
+from pathlib import Path
+
+from bracket.models.metrics import Counter, Gauge, Histogram, MetricsRegistry
+from bracket.utils.metrics_multiprocess import (
+    ARCHIVE_FILE_NAME,
+    archive_metrics_snapshots,
+    get_snapshot_name,
+    parse_snapshot,
+    read_metrics_snapshots,
+    wipe_metrics_directory,
+)
+
+# Larger than the maximum PID on Linux, so no process has it.
+EXITED_PID = 2**23
+
+
+def test_histogram_render() -> None:
+    histogram = Histogram("test_seconds", "Test", ("url",), buckets=(1.0, 0.1))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value, ('a"b\\c',))
+
+    assert "".join(histogram.render(histogram.values)) == (
+        "# HELP test_seconds Test\n"
+        "# TYPE test_seconds histogram\n"
+        'test_seconds_bucket{url="a\\"b\\\\c",le="0.1"} 2\n'
+        'test_seconds_bucket{url="a\\"b\\\\c",le="1"} 3\n'
+        'test_seconds_bucket{url="a\\"b\\\\c",le="+Inf"} 4\n'
+        'test_seconds_sum{url="a\\"b\\\\c"} 2.650000\n'
+        'test_seconds_count{url="a\\"b\\\\c"} 4\n'
+    )
+
+
+def test_registry_merges_snapshots() -> None:
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("test_count", "Test", ("url",)))
+    gauge = registry.register(Gauge("test_version", "Test", multiprocess_mode="max"))
+    histogram = registry.register(Histogram("test_seconds", "Test", buckets=(1.0,)))
+    counter.inc(("/a",))
+    gauge.set(1.0)
+    histogram.observe(0.5)
+
+    merged = registry.merge([registry.snapshot(), registry.snapshot()])
+
+    assert merged == {
+        "test_count": {("/a",): 2.0},
+        "test_version": {(): 1.0},
+        "test_seconds": {(): [2.0, 0.0, 1.0]},
+    }
+    assert 'test_count{url="/a"} 2.0\n' in registry.render(merged)
+
+
+def test_snapshots_of_exited_processes_drop_gauges(tmp_path: Path) -> None:
+    raw_snapshot = {
+        "bracket_request_count": [[["/ping", "GET"], 3.0]],
+        "bracket_compute_queue_depth": [[[], 2.0]],
+    }
+
+    assert parse_snapshot(raw_snapshot, is_alive=False) == {
+        "bracket_request_count": [(("/ping", "GET"), 3.0)],
+    }
+
+    (tmp_path / get_snapshot_name(os.getpid())).write_text('{"bracket_version": [[[], 1.0]]}')
+    assert read_metrics_snapshots(tmp_path) == [{"bracket_version": [((), 1.0)]}]
+
+    # A snapshot with this PID but another start time was written by an earlier process.
+    (tmp_path / f"metrics-{os.getpid()}-1.json").write_text('{"bracket_version": [[[], 1.0]]}')
+    assert {} in read_metrics_snapshots(tmp_path)
+
+
+def test_snapshots_of_exited_processes_are_archived(tmp_path: Path) -> None:
+    for i, count in enumerate((2.0, 3.0)):
+        raw_snapshot = {
+            "bracket_request_count": [[["/ping", "GET"], count]],
+            "bracket_compute_queue_depth": [[[], 1.0]],
+        }
+        (tmp_path / f"metrics-{EXITED_PID}-{i}.json").write_text(json.dumps(raw_snapshot))
+        archive_metrics_snapshots(tmp_path, EXITED_PID)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [ARCHIVE_FILE_NAME]
+    expected = [{"bracket_request_count": [(("/ping", "GET"), 5.0)]}]
+    assert read_metrics_snapshots(tmp_path) == expected
+
+    # An archived snapshot that hasn't been removed yet is only counted once.
+    (tmp_path / f"metrics-{EXITED_PID}-1.json").write_text('{"bracket_request_count": []}')
+    assert read_metrics_snapshots(tmp_path) == expected
+
+    wipe_metrics_directory(tmp_path)
+    assert read_metrics_snapshots(tmp_path) == []
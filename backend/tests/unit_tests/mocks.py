@@ -71,6 +71,7 @@ def get_2_definitive_matches_mock(
         duration_minutes=90,
         margin_minutes=15,
         round_id=RoundId(-3),
+        tournament_id=stage_item_inputs[0].tournament_id,
         court_id=CourtId(-1),
         stage_item_input1_score=2,
         stage_item_input2_score=0,
@@ -89,6 +90,7 @@ def get_2_definitive_matches_mock(
         duration_minutes=90,
         margin_minutes=15,
         round_id=RoundId(-3),
+        tournament_id=stage_item_inputs[0].tournament_id,
         court_id=CourtId(-2),
         stage_item_input1_score=2,
         stage_item_input2_score=3,
@@ -111,6 +113,7 @@ def get_2_definitive_and_2_tentative_matches_mock(
         duration_minutes=90,
         margin_minutes=15,
         round_id=RoundId(-2),
+        tournament_id=match1.tournament_id,
         stage_item_input1_score=4,
         stage_item_input2_score=0,
         stage_item_input1_conflict=False,
@@ -124,6 +127,7 @@ def get_2_definitive_and_2_tentative_matches_mock(
         duration_minutes=90,
         margin_minutes=15,
         round_id=RoundId(-1),
+        tournament_id=match1.tournament_id,
         stage_item_input1_score=3,
         stage_item_input2_score=2,
         stage_item_input1_conflict=False,
@@ -141,6 +145,7 @@ def get_one_round_with_two_definitive_matches(
         id=RoundId(-3),
         matches=[match1, match2],
         stage_item_id=StageItemId(-1),
+        tournament_id=match1.tournament_id,
         created=DUMMY_MOCK_TIME,
         is_draft=False,
         name="",
@@ -155,6 +160,7 @@ def get_two_round_with_one_tentative_match_each(
             id=RoundId(-2),
             matches=[match1],
             stage_item_id=StageItemId(-1),
+            tournament_id=match1.tournament_id,
             created=DUMMY_MOCK_TIME,
             is_draft=False,
             name="",
@@ -163,6 +169,7 @@ def get_two_round_with_one_tentative_match_each(
             id=RoundId(-1),
             matches=[match2],
             stage_item_id=StageItemId(-1),
+            tournament_id=match2.tournament_id,
             created=DUMMY_MOCK_TIME,
             is_draft=False,
             name="",
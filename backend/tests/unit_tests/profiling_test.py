@@ -0,0 +1,27 @@
+import threading
+
+from bracket.utils.profiling import SamplingProfiler
+
+
+def busy_wait(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1_000))
+
+
+def test_sampling_profiler_collapsed() -> None:
+    stop = threading.Event()
+    thread = threading.Thread(target=busy_wait, args=(stop,), name="busy")
+    thread.start()
+    try:
+        assert thread.ident is not None
+        profiler = SamplingProfiler([thread.ident], interval=0.001)
+        profiler.run(0.2)
+    finally:
+        stop.set()
+        thread.join()
+
+    lines = profiler.to_collapsed().splitlines()
+    assert len(lines) > 0
+    assert all(line.startswith("busy;") for line in lines)
+    assert any("busy_wait (" in line for line in lines)
+    assert profiler.duration >= 0.2
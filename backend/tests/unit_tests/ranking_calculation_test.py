@@ -46,6 +46,7 @@ def test_determine_ranking_for_stage_item_elimination() -> None:
             rounds=[
                 RoundWithMatches(
                     id=RoundId(-1),
+                    tournament_id=tournament_id,
                     matches=[
                         MatchWithDetailsDefinitive(
                             id=MatchId(-1),
@@ -55,6 +56,7 @@ def test_determine_ranking_for_stage_item_elimination() -> None:
                             duration_minutes=90,
                             margin_minutes=15,
                             round_id=RoundId(-1),
+                            tournament_id=tournament_id,
                             stage_item_input1_score=2,
                             stage_item_input2_score=0,
                             stage_item_input1_conflict=False,
@@ -68,6 +70,7 @@ def test_determine_ranking_for_stage_item_elimination() -> None:
                             duration_minutes=90,
                             margin_minutes=15,
                             round_id=RoundId(-1),
+                            tournament_id=tournament_id,
                             stage_item_input1_score=2,
                             stage_item_input2_score=2,
                             stage_item_input1_conflict=False,
@@ -79,6 +82,7 @@ def test_determine_ranking_for_stage_item_elimination() -> None:
                             duration_minutes=90,
                             margin_minutes=15,
                             round_id=RoundId(-1),
+                            tournament_id=tournament_id,
                             stage_item_input1_score=3,
                             stage_item_input2_score=2,
                             stage_item_input1_conflict=False,
@@ -142,6 +146,7 @@ def test_determine_ranking_for_stage_item_swiss() -> None:
             rounds=[
                 RoundWithMatches(
                     id=RoundId(-1),
+                    tournament_id=tournament_id,
                     matches=[
                         MatchWithDetailsDefinitive(
                             id=MatchId(-1),
@@ -151,6 +156,7 @@ def test_determine_ranking_for_stage_item_swiss() -> None:
                             duration_minutes=90,
                             margin_minutes=15,
                             round_id=RoundId(-1),
+                            tournament_id=tournament_id,
                             stage_item_input1_score=2,
                             stage_item_input2_score=0,
                             stage_item_input1_conflict=False,
@@ -164,6 +170,7 @@ def test_determine_ranking_for_stage_item_swiss() -> None:
                             duration_minutes=90,
                             margin_minutes=15,
                             round_id=RoundId(-1),
+                            tournament_id=tournament_id,
                             stage_item_input1_score=2,
                             stage_item_input2_score=2,
                             stage_item_input1_conflict=False,
@@ -175,6 +182,7 @@ def test_determine_ranking_for_stage_item_swiss() -> None:
                             duration_minutes=90,
                             margin_minutes=15,
                             round_id=RoundId(-1),
+                            tournament_id=tournament_id,
                             stage_item_input1_score=3,
                             stage_item_input2_score=2,
                             stage_item_input1_conflict=False,
@@ -238,6 +246,7 @@ def test_determine_ranking_for_stage_item_swiss_no_matches() -> None:
             rounds=[
                 RoundWithMatches(
                     id=RoundId(-1),
+                    tournament_id=tournament_id,
                     matches=[],
                     stage_item_id=StageItemId(-1),
                     created=now,
@@ -0,0 +1,226 @@
+"""
+Simulates complete Swiss tournaments to measure the latency and quality of the pairing logic.
+
+Run it with `python -m tests.unit_tests.swiss_benchmark` from the backend directory.
+"""
+
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from bracket.logic.ranking.calculation import D, K
+from bracket.logic.ranking.statistics import START_ELO
+from bracket.logic.scheduling.ladder_teams import get_possible_upcoming_matches_for_swiss
+from bracket.models.db.match import (
+    Match,
+    MatchFilter,
+    MatchWithDetails,
+    MatchWithDetailsDefinitive,
+    SuggestedMatch,
+)
+from bracket.models.db.stage_item_inputs import StageItemInput, StageItemInputFinal
+from bracket.models.db.team import Team
+from bracket.models.db.util import RoundWithMatches
+from bracket.utils.dummy_records import DUMMY_MATCH1, DUMMY_MOCK_TIME, DUMMY_TEAM1
+from bracket.utils.id_types import (
+    MatchId,
+    RoundId,
+    StageItemId,
+    StageItemInputId,
+    TeamId,
+    TournamentId,
+)
+
+BENCHMARK_CONFIGS = ((16, 5), (64, 8), (256, 12))
+DEFAULT_FILTER = MatchFilter(
+    elo_diff_threshold=200, iterations=2_000, limit=1, only_recommended=False
+)
+
+
+@dataclass
+class SwissBenchmarkResult:
+    inputs_count: int
+    rounds_count: int
+    restarts: int
+    round_latencies_seconds: list[float] = field(default_factory=list)
+    repeat_pairings: int = 0
+    elo_diffs: list[Decimal] = field(default_factory=list)
+    rounds_with_unpaired_inputs: int = 0
+
+    @property
+    def average_elo_diff(self) -> float:
+        return float(sum(self.elo_diffs) / len(self.elo_diffs)) if self.elo_diffs else 0.0
+
+    def format_row(self) -> str:
+        mode = f"restarts={self.restarts}" if self.restarts > 0 else "sampler"
+        latencies_ms = [latency * 1000 for latency in self.round_latencies_seconds]
+        return (
+            f"{self.inputs_count:>6} {self.rounds_count:>6} {mode:>14} "
+            f"{sum(latencies_ms) / len(latencies_ms):>12.1f} {max(latencies_ms):>12.1f} "
+            f"{self.repeat_pairings:>8} {self.average_elo_diff:>10.1f} "
+            f"{self.rounds_with_unpaired_inputs:>9}\n"
+        )
+
+
+def create_inputs(inputs_count: int) -> list[StageItemInputFinal]:
+    return [
+        StageItemInputFinal(
+            id=StageItemInputId(i),
+            slot=i,
+            tournament_id=TournamentId(1),
+            stage_item_id=StageItemId(1),
+            team_id=TeamId(i),
+            team=Team(**DUMMY_TEAM1.model_dump() | {"name": f"Team {i}"}, id=TeamId(i)),
+            points=START_ELO,
+        )
+        for i in range(1, inputs_count + 1)
+    ]
+
+
+def create_match(
+    match_id: int, round_id: int, suggestion: SuggestedMatch, rng: random.Random
+) -> MatchWithDetailsDefinitive:
+    return MatchWithDetailsDefinitive(
+        **Match.model_validate(
+            DUMMY_MATCH1.model_dump()
+            | {
+                "id": MatchId(match_id),
+                "round_id": RoundId(round_id),
+                "stage_item_input1_id": suggestion.stage_item_input1.id,
+                "stage_item_input2_id": suggestion.stage_item_input2.id,
+                "stage_item_input1_score": rng.randint(0, 3),
+                "stage_item_input2_score": rng.randint(0, 3),
+            }
+        ).model_dump(),
+        stage_item_input1=suggestion.stage_item_input1,
+        stage_item_input2=suggestion.stage_item_input2,
+    )
+
+
+def update_elo(
+    inputs: dict[StageItemInputId, StageItemInputFinal], match: MatchWithDetailsDefinitive
+) -> None:
+    """
+    Simplified version of `determine_ranking_for_stage_item` for Swiss stage items.
+    """
+    input1 = inputs[match.stage_item_input1.id]
+    input2 = inputs[match.stage_item_input2.id]
+    score1 = Decimal(
+        (match.stage_item_input1_score > match.stage_item_input2_score)
+        + (match.stage_item_input1_score == match.stage_item_input2_score) * Decimal("0.5")
+    )
+    expected1 = Decimal(1.0 / (1.0 + 10.0 ** (float(input2.points - input1.points) / D)))
+    delta = int(K * (score1 - expected1))
+    inputs[input1.id] = input1.model_copy(update={"points": input1.points + delta})
+    inputs[input2.id] = input2.model_copy(update={"points": input2.points - delta})
+
+
+def schedule_round(
+    match_filter: MatchFilter,
+    rounds: list[RoundWithMatches],
+    inputs: list[StageItemInput],
+    round_id: int,
+    rng: random.Random,
+) -> list[SuggestedMatch]:
+    """
+    Schedules a round the same way as the `start_next_round` endpoint: by repeatedly picking the
+    best suggestion, unless the restart search is used, which returns a complete pairing at once.
+    """
+    draft_round = RoundWithMatches(
+        id=RoundId(round_id),
+        stage_item_id=StageItemId(1),
+        tournament_id=TournamentId(1),
+        created=DUMMY_MOCK_TIME,
+        is_draft=True,
+        name=f"Round {round_id}",
+        matches=[],
+    )
+    if match_filter.restarts > 0:
+        return get_possible_upcoming_matches_for_swiss(
+            match_filter.model_copy(update={"limit": len(inputs)}),
+            rounds,
+            inputs,
+            draft_round,
+            seed=rng.randrange(2**32),
+        )
+
+    scheduled: list[SuggestedMatch] = []
+    for match_index in range(len(inputs) // 2):
+        suggestions = get_possible_upcoming_matches_for_swiss(
+            match_filter, rounds, inputs, draft_round, seed=rng.randrange(2**32)
+        )
+        if len(suggestions) < 1:
+            break
+
+        scheduled.append(suggestions[0])
+        draft_round.matches.append(create_match(-match_index - 1, round_id, suggestions[0], rng))
+
+    return scheduled
+
+
+def simulate_swiss_tournament(
+    inputs_count: int,
+    rounds_count: int,
+    match_filter: MatchFilter = DEFAULT_FILTER,
+    seed: int = 0,
+) -> SwissBenchmarkResult:
+    rng = random.Random(seed)
+    inputs = {input_.id: input_ for input_ in create_inputs(inputs_count)}
+    rounds: list[RoundWithMatches] = []
+    played_pairs: set[frozenset[int]] = set()
+    result = SwissBenchmarkResult(inputs_count, rounds_count, match_filter.restarts)
+
+    for round_id in range(1, rounds_count + 1):
+        current_inputs: list[StageItemInput] = list(inputs.values())
+        start = time.perf_counter()
+        scheduled = schedule_round(match_filter, rounds, current_inputs, round_id, rng)
+        result.round_latencies_seconds.append(time.perf_counter() - start)
+
+        if len(scheduled) < inputs_count // 2:
+            result.rounds_with_unpaired_inputs += 1
+
+        matches: list[MatchWithDetailsDefinitive | MatchWithDetails] = []
+        for match_index, suggestion in enumerate(scheduled):
+            pair = frozenset(suggestion.stage_item_input_ids)
+            result.repeat_pairings += pair in played_pairs
+            played_pairs.add(pair)
+            result.elo_diffs.append(suggestion.elo_diff)
+            matches.append(
+                create_match(round_id * inputs_count + match_index, round_id, suggestion, rng)
+            )
+
+        for match in matches:
+            assert isinstance(match, MatchWithDetailsDefinitive)
+            update_elo(inputs, match)
+
+        rounds.append(
+            RoundWithMatches(
+                id=RoundId(round_id),
+                stage_item_id=StageItemId(1),
+                tournament_id=TournamentId(1),
+                created=DUMMY_MOCK_TIME,
+                is_draft=False,
+                name=f"Round {round_id}",
+                matches=matches,
+            )
+        )
+
+    return result
+
+
+def main() -> None:
+    sys.stdout.write(
+        f"{'inputs':>6} {'rounds':>6} {'mode':>14} {'avg ms/rnd':>12} {'max ms/rnd':>12} "
+        f"{'repeats':>8} {'avg elo':>10} {'unpaired':>9}\n"
+    )
+    for inputs_count, rounds_count in BENCHMARK_CONFIGS:
+        for restarts in (0, 32):
+            match_filter = DEFAULT_FILTER.model_copy(update={"restarts": restarts})
+            result = simulate_swiss_tournament(inputs_count, rounds_count, match_filter)
+            sys.stdout.write(result.format_row())
+
+
+if __name__ == "__main__":
+    main()
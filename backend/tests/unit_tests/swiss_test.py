@@ -1,6 +1,9 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
 
 from bracket.logic.scheduling.ladder_teams import get_possible_upcoming_matches_for_swiss
+from bracket.logic.scheduling.upcoming_matches import get_stage_item_state_version
 from bracket.models.db.match import Match, MatchFilter, MatchWithDetailsDefinitive, SuggestedMatch
 from bracket.models.db.stage_item_inputs import (
     StageItemInput,
@@ -21,6 +24,8 @@ from bracket.utils.id_types import (
     TournamentId,
 )
 from tests.integration_tests.mocks import MOCK_NOW
+from tests.unit_tests.mocks import get_stage_item_mock
+from tests.unit_tests.swiss_benchmark import DEFAULT_FILTER, simulate_swiss_tournament
 
 MATCH_FILTER = MatchFilter(elo_diff_threshold=50, iterations=100, limit=20, only_recommended=False)
 
@@ -41,7 +46,7 @@ def get_match(
     )
 
 
-def test_constraints() -> None:
+def get_inputs_and_rounds() -> tuple[list[StageItemInputFinal], list[RoundWithMatches]]:
     stage_item_input_dummy = StageItemInputFinal(
         id=StageItemInputId(-1),
         tournament_id=TournamentId(-1),
@@ -70,6 +75,7 @@ def test_constraints() -> None:
             ],
             is_draft=False,
             stage_item_id=StageItemId(-1),
+            tournament_id=TournamentId(-1),
             name="R1",
             created=MOCK_NOW,
         ),
@@ -78,10 +84,16 @@ def test_constraints() -> None:
             matches=[],
             is_draft=True,
             stage_item_id=StageItemId(-1),
+            tournament_id=TournamentId(-1),
             name="R2",
             created=MOCK_NOW,
         ),
     ]
+    return [input1, input2, input3, input4], rounds
+
+
+def test_constraints() -> None:
+    [input1, input2, input3, input4], rounds = get_inputs_and_rounds()
     inputs: list[StageItemInput] = [input1, input2, input3, input4]
     result = get_possible_upcoming_matches_for_swiss(MATCH_FILTER, rounds, inputs)
 
@@ -107,3 +119,86 @@ def test_constraints() -> None:
             player_behind_schedule_count=0,
         ),
     ]
+
+
+def test_restarts_keep_best_pairing() -> None:
+    [input1, input2, input3, input4], rounds = get_inputs_and_rounds()
+    inputs: list[StageItemInput] = [input1, input2, input3, input4]
+    match_filter = MATCH_FILTER.model_copy(update={"elo_diff_threshold": 100, "restarts": 10})
+    # Without a fixed seed, all attempts occasionally miss the only complete pairing.
+    result = get_possible_upcoming_matches_for_swiss(match_filter, rounds, inputs, seed=0)
+
+    # Input 1 and 2 have played already, so the only complete pairing is 1-3 and 2-4.
+    assert result == [
+        SuggestedMatch(
+            stage_item_input1=input3,
+            stage_item_input2=input1,
+            elo_diff=Decimal("75.0"),
+            swiss_diff=Decimal("75.0"),
+            is_recommended=True,
+            times_played_sum=1,
+            player_behind_schedule_count=0,
+        ),
+        SuggestedMatch(
+            stage_item_input1=input4,
+            stage_item_input2=input2,
+            elo_diff=Decimal("75.0"),
+            swiss_diff=Decimal("75.0"),
+            is_recommended=True,
+            times_played_sum=1,
+            player_behind_schedule_count=0,
+        ),
+    ]
+
+
+def test_restarts_in_process_pool() -> None:
+    [input1, input2, input3, input4], rounds = get_inputs_and_rounds()
+    inputs: list[StageItemInput] = [input1, input2, input3, input4]
+    match_filter = MATCH_FILTER.model_copy(update={"restarts": 4})
+
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn")) as executor:
+        result = get_possible_upcoming_matches_for_swiss(
+            match_filter, rounds, inputs, executor=executor, seed=0
+        )
+
+    # Input 1 can't be paired within the ELO threshold, so pairing 3-4 has the lowest cost.
+    assert [match.stage_item_input_ids for match in result] == [[input4.id, input3.id]]
+    assert result == get_possible_upcoming_matches_for_swiss(match_filter, rounds, inputs, seed=0)
+
+
+def test_seeded_suggestions_are_reproducible() -> None:
+    inputs, rounds = get_inputs_and_rounds()
+    many_inputs: list[StageItemInput] = [
+        inputs[i % 4].model_copy(update={"id": -i - 1, "points": Decimal(1100 + 10 * i)})
+        for i in range(40)
+    ]
+    match_filter = MATCH_FILTER.model_copy(update={"iterations": 200})
+
+    results = [
+        get_possible_upcoming_matches_for_swiss(match_filter, rounds, many_inputs, seed=42)
+        for _ in range(3)
+    ]
+    assert len(results[0]) > 0
+    assert results[0] == results[1] == results[2]
+
+
+def test_swiss_benchmark_simulation() -> None:
+    for restarts in (0, 8):
+        match_filter = DEFAULT_FILTER.model_copy(update={"restarts": restarts})
+        result = simulate_swiss_tournament(16, 5, match_filter)
+
+        assert len(result.round_latencies_seconds) == 5
+        assert result.repeat_pairings == 0
+        assert len(result.elo_diffs) > 0
+
+
+def test_state_version_changes_with_team_details() -> None:
+    inputs, rounds = get_inputs_and_rounds()
+    stage_item = get_stage_item_mock(inputs, rounds)
+    state_version = get_stage_item_state_version(stage_item)
+    assert get_stage_item_state_version(stage_item) == state_version
+
+    team = inputs[0].team.model_copy(update={"name": "Renamed team"})
+    renamed_input = inputs[0].model_copy(update={"team": team})
+    renamed_stage_item = get_stage_item_mock([renamed_input, *inputs[1:]], rounds)
+    assert get_stage_item_state_version(renamed_stage_item) != state_version
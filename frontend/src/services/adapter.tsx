@@ -63,6 +63,8 @@ export function createAxios() {
   const access_token = user != null ? user.access_token : '';
   return axios.create({
     baseURL: getBaseApiUrl(),
+    // Send the cookie that keeps reads on the primary database after a write.
+    withCredentials: true,
     headers: {
       Authorization: `bearer ${access_token}`,
       Accept: 'application/json',